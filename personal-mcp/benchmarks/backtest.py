@@ -0,0 +1,99 @@
+"""Backtest engine benchmark.
+
+Runs :func:`personal_mcp.shared.backtest.run_backtest` over a VN100-sized
+universe of ten years of daily bars: fixed equal weights and a trend
+signal (``close > sma_200`` ranked by ``close / sma_200``, top 20), each
+rebalanced monthly and daily. Fetching is excluded: histories are
+synthetic and already in memory, as they are once the adapter cache or
+OHLC store is warm; aligning them into a panel is timed separately.
+
+Usage::
+
+    uv run python benchmarks/backtest.py --symbols 100 --bars 2520 --runs 3
+"""
+
+import argparse
+import statistics
+import time
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from personal_mcp.shared.backtest import run_backtest, signal_weights, static_weights
+from personal_mcp.shared.indicators import compute_indicators
+from personal_mcp.shared.panels import price_panel
+
+
+def histories(symbols: int, bars: int) -> dict[str, pd.DataFrame]:
+    """Random-walk daily bars in thousands of VND; a tenth listed a third of the way in."""
+    rng = np.random.default_rng(0)
+    times = pd.bdate_range("2015-01-01", periods=bars)
+    frames = {}
+    for i in range(symbols):
+        close = 20 * np.exp(rng.normal(0.0002, 0.02, bars).cumsum())
+        frame = pd.DataFrame(
+            {
+                "time": times,
+                "open": close,
+                "high": close * 1.01,
+                "low": close * 0.99,
+                "close": close,
+                "volume": rng.integers(10_000, 1_000_000, bars),
+            }
+        )
+        frames[f"S{i:03d}"] = frame.iloc[bars // 3 :] if i % 10 == 0 else frame
+    return frames
+
+
+def measure(run: Callable[[], object], runs: int) -> float:
+    """Median seconds over ``runs`` calls."""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main() -> None:
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--symbols", type=int, default=100)
+    parser.add_argument("--bars", type=int, default=2520)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    frames = histories(args.symbols, args.bars)
+    panel = price_panel(frames)
+    close = panel["close"]
+
+    def weights(rebalance: str) -> Callable[[], object]:
+        def run():
+            targets = static_weights({s: 1 / args.symbols for s in close.columns}, list(close.columns), len(close))
+            return run_backtest(close, targets, rebalance=rebalance)
+
+        return run
+
+    def signal(rebalance: str) -> Callable[[], object]:
+        def run():
+            names = {**panel, **compute_indicators(panel, ["sma:200"])}
+            targets = signal_weights(names, "close > sma_200", rank="close / sma_200", top=20)
+            return run_backtest(close, targets, rebalance=rebalance)
+
+        return run
+
+    print(f"universe: {args.symbols} symbols x {args.bars} daily bars")
+    cases = {
+        "align panel": lambda: price_panel(frames),
+        "weights, monthly": weights("monthly"),
+        "weights, daily": weights("daily"),
+        "signal, monthly": signal("monthly"),
+        "signal, daily": signal("daily"),
+    }
+    for name, run in cases.items():
+        print(f"{name:<18} {measure(run, args.runs) * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
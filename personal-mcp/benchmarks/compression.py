@@ -0,0 +1,113 @@
+"""HTTP response compression benchmark.
+
+Calls a tool returning a listing-sized payload (about 1700 rows by 12
+mixed columns) through the streamable HTTP app, with and without
+:class:`personal_mcp.shared.compression.CompressionMiddleware`, and reports
+the bytes on the wire, the server-side latency and the time the response
+would take over a slow link (bytes / bandwidth + one round trip).
+
+Usage::
+
+    uv run python benchmarks/compression.py --rows 1700 --runs 5 --mbps 2 --rtt-ms 80
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+import numpy as np
+import pandas as pd
+from fastmcp import FastMCP
+from fastmcp.tools.tool import ToolResult
+from starlette.middleware import Middleware
+
+from personal_mcp.shared.compression import CompressionMiddleware, zstandard
+from personal_mcp.shared.payloads import OUTPUT_SCHEMA, frame_result
+
+CALL = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "tools/call",
+    "params": {"name": "listing", "arguments": {}},
+}
+HEADERS = {"Accept": "application/json, text/event-stream", "Content-Type": "application/json"}
+
+
+def listing_frame(rows: int) -> pd.DataFrame:
+    """Build a frame shaped like a listing: tickers, names, codes and ratios."""
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame(
+        {
+            "symbol": [f"T{i:04d}" for i in range(rows)],
+            "organ_name": [f"Công ty Cổ phần Tập đoàn {i}" for i in range(rows)],
+            "exchange": rng.choice(["HOSE", "HNX", "UPCOM"], rows),
+            "icb_name3": rng.choice(["Ngân hàng", "Bất động sản", "Thép", "Bán lẻ"], rows),
+            "icb_code3": rng.choice([8350, 8630, 1750, 5370], rows),
+        }
+    )
+    for i in range(7):
+        frame[f"ratio_{i}"] = rng.normal(10, 5, rows)
+    return frame
+
+
+def build_server(rows: int) -> FastMCP:
+    """Server with a single tool returning the listing frame."""
+    server = FastMCP("bench")
+    frame = listing_frame(rows)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def listing() -> ToolResult:
+        return frame_result(frame)
+
+    return server
+
+
+async def measure(server: FastMCP, compressed: bool, accept: str, runs: int) -> tuple[float, int]:
+    """Return (median seconds, wire bytes) of ``runs`` tool calls."""
+    middleware = [Middleware(CompressionMiddleware)] if compressed else []
+    app = server.http_app(middleware=middleware, stateless_http=True)
+    times, wire = [], 0
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for _ in range(runs):
+                start = time.perf_counter()
+                response = await client.post("/mcp", json=CALL, headers={**HEADERS, "Accept-Encoding": accept})
+                response.raise_for_status()
+                times.append(time.perf_counter() - start)
+                wire = response.num_bytes_downloaded
+    return statistics.median(times), wire
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run every case and print a summary."""
+    server = build_server(args.rows)
+    cases = [
+        ("identity (previous)", False, "identity"),
+        ("gzip", True, "gzip"),
+        ("zstd", True, "zstd"),
+    ]
+    print(f"payload: {args.rows} rows, link {args.mbps} Mbit/s, RTT {args.rtt_ms} ms")
+    for name, compressed, accept in cases:
+        if accept == "zstd" and zstandard is None:
+            print(f"{name:<20} skipped (zstandard is not installed)")
+            continue
+        seconds, wire = await measure(server, compressed, accept, args.runs)
+        link = wire * 8 / (args.mbps * 1e6) + args.rtt_ms / 1000
+        print(f"{name:<20} {wire / 1024:9.1f} KiB {seconds * 1000:8.1f} ms server {(seconds + link) * 1000:9.1f} ms total")
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1700)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--mbps", type=float, default=2.0)
+    parser.add_argument("--rtt-ms", type=float, default=80.0)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Technical indicator engine benchmark.
+
+Computes SMA/EMA/RSI/MACD/Bollinger/ATR for a HOSE-sized universe (about
+400 symbols of daily bars) with :func:`personal_mcp.shared.indicators.compute_indicators`,
+once per symbol (as an agent looping over ``quote_history`` would) and
+once over the whole panel, and reports the per-symbol cost of each.
+Fetching is excluded: histories are synthetic and already in memory, as
+they are once the adapter cache or OHLC store is warm.
+
+Usage::
+
+    uv run python benchmarks/indicators.py --symbols 400 --bars 1250 --runs 3
+"""
+
+import argparse
+import statistics
+import time
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from personal_mcp.shared.indicators import compute_indicators, panel_rows
+from personal_mcp.shared.panels import price_panel
+
+SPECS = ["sma:20", "sma:50", "ema:20", "rsi:14", "macd:12,26,9", "bbands:20,2", "atr:14"]
+
+
+def histories(symbols: int, bars: int) -> dict[str, pd.DataFrame]:
+    """Random-walk daily bars; a tenth of the symbols listed halfway through."""
+    rng = np.random.default_rng(0)
+    times = pd.bdate_range("2020-01-01", periods=bars)
+    frames = {}
+    for i in range(symbols):
+        close = 20 * np.exp(rng.normal(0, 0.02, bars).cumsum())
+        spread = close * rng.uniform(0, 0.03, bars)
+        frame = pd.DataFrame(
+            {
+                "time": times,
+                "open": close,
+                "high": close + spread,
+                "low": close - spread,
+                "close": close,
+                "volume": rng.integers(1_000, 1_000_000, bars),
+            }
+        )
+        frames[f"S{i:03d}"] = frame.iloc[bars // 2 :] if i % 10 == 0 else frame
+    return frames
+
+
+def measure(run: Callable[[], object], runs: int) -> float:
+    """Median seconds over ``runs`` calls."""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main() -> None:
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--symbols", type=int, default=400)
+    parser.add_argument("--bars", type=int, default=1250)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    frames = histories(args.symbols, args.bars)
+
+    def per_symbol() -> None:
+        for symbol, frame in frames.items():
+            panel = price_panel({symbol: frame})
+            panel_rows(panel, compute_indicators(panel, SPECS))
+
+    def whole_panel() -> None:
+        panel = price_panel(frames)
+        panel_rows(panel, compute_indicators(panel, SPECS))
+
+    def whole_panel_compute_only(panel=price_panel(frames)) -> None:
+        compute_indicators(panel, SPECS)
+
+    print(f"universe: {args.symbols} symbols x {args.bars} bars, indicators: {' '.join(SPECS)}")
+    cases = {
+        "per symbol": per_symbol,
+        "panel (align + rows)": whole_panel,
+        "panel (compute only)": whole_panel_compute_only,
+    }
+    for name, run in cases.items():
+        seconds = measure(run, args.runs)
+        print(f"{name:<22} {seconds * 1000:9.1f} ms total {seconds / args.symbols * 1e6:9.1f} µs/symbol")
+
+
+if __name__ == "__main__":
+    main()
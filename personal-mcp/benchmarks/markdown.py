@@ -0,0 +1,69 @@
+"""Markdown rendering benchmark.
+
+Compares the previous ``DataFrame.to_markdown(tablefmt="grid")`` rendering
+with :func:`personal_mcp.shared.markdown.render_markdown` on screener-sized
+frames (about 1700 rows by 80 mixed columns), reporting time and output size.
+
+Usage::
+
+    uv run python benchmarks/markdown.py --rows 1700 --cols 80 --runs 3
+"""
+
+import argparse
+import statistics
+import time
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from personal_mcp.shared.markdown import render_markdown
+
+
+def screener_frame(rows: int, cols: int) -> pd.DataFrame:
+    """Build a frame shaped like a screener result: tickers, text and ratios."""
+    rng = np.random.default_rng(0)
+    data: dict[str, object] = {
+        "ticker": [f"T{i:04d}" for i in range(rows)],
+        "exchange": rng.choice(["HOSE", "HNX", "UPCOM"], rows),
+        "industry": rng.choice(["Ngân hàng", "Bất động sản", "Thép", "Bán lẻ"], rows),
+    }
+    for i in range(cols - len(data)):
+        values = rng.normal(10, 5, rows)
+        values[rng.random(rows) < 0.1] = np.nan
+        data[f"ratio_{i}"] = values
+    return pd.DataFrame(data)
+
+
+def measure(render: Callable[[], str], runs: int) -> tuple[float, int]:
+    """Return (median seconds, output characters) over ``runs`` renders."""
+    times, size = [], 0
+    for _ in range(runs):
+        start = time.perf_counter()
+        size = len(render())
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), size
+
+
+def main() -> None:
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1700)
+    parser.add_argument("--cols", type=int, default=80)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    frame = screener_frame(args.rows, args.cols)
+    cases = {
+        "grid (previous)": lambda: frame.to_markdown(index=False, tablefmt="grid"),
+        "bounded (default caps)": lambda: render_markdown(frame),
+        "uncapped fast path": lambda: render_markdown(frame, max_rows=0, max_cols=0, max_width=0),
+    }
+    print(f"frame: {args.rows} rows x {args.cols} columns")
+    for name, render in cases.items():
+        seconds, size = measure(render, args.runs)
+        print(f"{name:<24} {seconds * 1000:9.1f} ms {size / 1024:10.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
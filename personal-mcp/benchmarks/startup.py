@@ -0,0 +1,54 @@
+"""Server startup benchmark.
+
+Measures, in fresh interpreters, how long it takes to import
+``personal_mcp.server`` (which builds the FastMCP app and registers every
+tool) and to list the registered tools. This is the cold-start cost paid on
+every container restart before the first request can be served.
+
+Usage::
+
+    uv run python benchmarks/startup.py --runs 5
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+_PROBE = """
+import asyncio, time
+t0 = time.perf_counter()
+from personal_mcp.server import mcp
+t1 = time.perf_counter()
+tools = asyncio.run(mcp.get_tools())
+t2 = time.perf_counter()
+print(f"{t1 - t0:.6f} {t2 - t1:.6f} {len(tools)} {'vnstock.api' in __import__('sys').modules}")
+"""
+
+
+def run_once() -> tuple[float, float, int, bool]:
+    """Start one interpreter and return (import s, list s, tool count, vnstock loaded)."""
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE], capture_output=True, text=True, check=True
+    ).stdout.split()[-4:]
+    return float(out[0]), float(out[1]), int(out[2]), out[3] == "True"
+
+
+def main() -> None:
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="number of cold starts")
+    args = parser.parse_args()
+
+    results = [run_once() for _ in range(args.runs)]
+    imports = [r[0] for r in results]
+    listings = [r[1] for r in results]
+    print(f"tools registered:        {results[0][2]}")
+    print(f"vnstock loaded at start: {results[0][3]}")
+    print(f"import server (median):  {statistics.median(imports) * 1000:.0f} ms")
+    print(f"list tools (median):     {statistics.median(listings) * 1000:.0f} ms")
+    print(f"import server (min/max): {min(imports) * 1000:.0f} / {max(imports) * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
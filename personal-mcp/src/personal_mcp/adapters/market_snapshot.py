@@ -0,0 +1,134 @@
+"""Columnar snapshot of the whole market for local screening.
+
+The remote screener answers one fixed ``params`` query per call. Instead,
+:class:`MarketSnapshot` fetches the full universe once (ratios, price and
+liquidity from the TCBS screener, joined with each symbol's ICB industries)
+and keeps it in memory and on disk as Parquet. Queries then run locally
+(see ``shared/expressions.py``).
+
+The snapshot is rebuilt in the background once it is older than
+``settings.screener_refresh_seconds``; until the new one is ready, queries
+keep reading the previous one, so only the very first build (with nothing
+on disk) sits on the interactive path.
+"""
+
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+import pandas as pd
+from fastmcp.utilities.logging import get_logger
+
+from personal_mcp.config import settings
+from personal_mcp.shared.exports import decode_frame, encode_frame
+
+logger = get_logger(__name__)
+
+# Screener filter covering every listed stock
+UNIVERSE_PARAMS = {"exchangeName": "HOSE,HNX,UPCOM"}
+
+
+class MarketSnapshot:
+    """Market-wide screening table, refreshed in the background."""
+
+    def __init__(self, adapter: Any, path: Optional[Path | str] = None) -> None:
+        """Initialize an empty snapshot.
+
+        Args:
+            adapter: VNStockAdapter used to fetch the universe.
+            path: Parquet file the snapshot is persisted to (default:
+                ``settings.screener_snapshot_path``; empty disables persistence).
+        """
+        self.adapter = adapter
+        path = settings.screener_snapshot_path if path is None else path
+        self.path = Path(path) if path else None
+        self.frame: Optional[pd.DataFrame] = None
+        self.built_at = 0.0
+        self._lock = threading.Lock()
+        self._refreshing = False
+
+    def build(self) -> pd.DataFrame:
+        """Fetch the universe and join the ICB industries of each symbol.
+
+        Returns:
+            One row per symbol with a ``symbol`` column first.
+        """
+        market = self.adapter.screener_stock(params=UNIVERSE_PARAMS, limit=settings.screener_universe_size)
+        market = market.rename(columns={"ticker": "symbol"})
+        try:
+            industries = self.adapter.listing_symbols_by_industries()
+        except Exception as e:
+            # Industries only enrich the table; ratios alone are still useful
+            logger.warning(f"Market snapshot built without ICB industries: {e}")
+        else:
+            if isinstance(industries, pd.DataFrame) and "symbol" in industries.columns:
+                extra = [c for c in industries.columns if c == "symbol" or c not in market.columns]
+                market = market.merge(industries[extra].drop_duplicates("symbol"), on="symbol", how="left")
+        return market[["symbol", *[c for c in market.columns if c != "symbol"]]].reset_index(drop=True)
+
+    def refresh(self) -> pd.DataFrame:
+        """Rebuild the snapshot now, persist it and return it."""
+        frame = self.build()
+        with self._lock:
+            self.frame, self.built_at = frame, time.time()
+        if self.path is not None:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                partial = self.path.with_suffix(".tmp")
+                partial.write_bytes(encode_frame(frame, "parquet"))
+                partial.replace(self.path)
+            except OSError as e:
+                logger.warning(f"Could not persist market snapshot: {e}")
+        logger.info(f"Market snapshot refreshed: {len(frame)} symbols")
+        return frame
+
+    def _load(self) -> None:
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            frame = decode_frame(self.path.read_bytes(), "parquet")
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable market snapshot {self.path}: {e}")
+            return
+        self.frame, self.built_at = frame, self.path.stat().st_mtime
+
+    def _refresh_in_background(self) -> None:
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def run() -> None:
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.warning(f"Market snapshot refresh failed, keeping the previous one: {e}")
+            finally:
+                self._refreshing = False
+
+        threading.Thread(target=run, name="market-snapshot", daemon=True).start()
+
+    def get(self, refresh: bool = False) -> tuple[pd.DataFrame, float]:
+        """Return the current snapshot and the time it was built.
+
+        Blocks only when ``refresh`` is set or no snapshot exists yet in
+        memory or on disk; a stale snapshot is returned as-is while a
+        background rebuild runs.
+
+        Args:
+            refresh: Rebuild before returning.
+
+        Returns:
+            (snapshot frame, build time as a Unix timestamp).
+        """
+        with self._lock:
+            if self.frame is None:
+                self._load()
+            frame, built_at = self.frame, self.built_at
+        if refresh or frame is None:
+            frame = self.refresh()
+            return frame, self.built_at
+        if time.time() - built_at > settings.screener_refresh_seconds:
+            self._refresh_in_background()
+        return frame, built_at
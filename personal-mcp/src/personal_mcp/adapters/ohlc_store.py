@@ -0,0 +1,338 @@
+"""Persistent incremental OHLC store.
+
+Bars are kept on disk as one Parquet file per ``<source>/<interval>/<SYMBOL>``
+next to a small JSON sidecar listing the calendar-date ranges already fetched.
+A request only goes upstream for the dates not covered yet; the slice is then
+served from the local file.
+
+The current day is never marked as covered because its bars are still
+forming, so it is refetched on every request that includes it.
+
+VCI serves prices adjusted for dividends and splits, so bars already on disk
+go stale on an ex-date. Once a day per file, a gap fetch is widened to take
+in one stored bar next to it; if upstream now reports a different close for
+that bar, the file and its coverage are dropped and the requested range is
+fetched again as a whole, instead of joining unadjusted and adjusted bars.
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Optional
+
+import numpy as np
+import pandas as pd
+from fastmcp.utilities.logging import get_logger
+
+from personal_mcp.shared.resample import INTRADAY_MINUTES, bucket_starts, can_resample, resample_bars
+
+logger = get_logger(__name__)
+
+# Intervals whose bars never span more than one trading day, so a gap fetch
+# cannot produce a bar that overlaps data already on disk. Weekly and monthly
+# bars are aggregated by the provider and bypass the store.
+STORED_INTERVALS = ("1m", "5m", "15m", "30m", "1H", "1D")
+
+# Derived series remembered for incremental resampling
+DERIVED_MAX_ENTRIES = 256
+
+_INTERVAL_ALIASES = {"D": "1D", "1d": "1D", "d": "1D", "H": "1H", "1h": "1H"}
+
+DateRange = tuple[date, date]
+Fetcher = Callable[[str, str], pd.DataFrame]
+
+# Relative close difference above which a refetched bar counts as re-adjusted
+REVALIDATE_RTOL = 1e-6
+
+
+def normalize_interval(interval: str) -> str:
+    """Map interval aliases (``"1d"``, ``"D"``, ``"1h"``) to vnstock's spelling."""
+    return _INTERVAL_ALIASES.get(interval, interval)
+
+
+def merge_ranges(ranges: list[DateRange]) -> list[DateRange]:
+    """Merge overlapping or adjacent inclusive date ranges."""
+    merged: list[DateRange] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + timedelta(days=1):
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def missing_ranges(covered: list[DateRange], start: date, end: date) -> list[DateRange]:
+    """Return the parts of ``start..end`` (inclusive) not in ``covered``."""
+    gaps: list[DateRange] = []
+    cursor = start
+    for lo, hi in merge_ranges(covered):
+        if hi < cursor:
+            continue
+        if lo > end:
+            break
+        if lo > cursor:
+            gaps.append((cursor, lo - timedelta(days=1)))
+        cursor = max(cursor, hi + timedelta(days=1))
+    if cursor <= end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+def _anchor(stored: pd.DataFrame, gaps: list[DateRange], today: date) -> Optional[pd.Timestamp]:
+    """Stored bar of a final day next to ``gaps``, to be fetched again.
+
+    The last bar before the first gap if there is one, else the first bar
+    after the last gap.
+    """
+    times = pd.to_datetime(stored["time"])
+    final = times[times.dt.date < today]
+    before = final[final.dt.date < gaps[0][0]]
+    if not before.empty:
+        return before.max()
+    after = final[final.dt.date > gaps[-1][1]]
+    return after.min() if not after.empty else None
+
+
+def _moved(stored: pd.DataFrame, fetched: list[pd.DataFrame], anchor: pd.Timestamp) -> bool:
+    """Whether upstream now reports another close for the ``anchor`` bar."""
+    old = stored.loc[pd.to_datetime(stored["time"]) == anchor, "close"]
+    new = [f.loc[pd.to_datetime(f["time"]) == anchor, "close"] for f in fetched if f is not None and not f.empty]
+    new = [c for c in new if not c.empty]
+    if old.empty or not new:
+        return False
+    return not np.isclose(old.iloc[-1], new[0].iloc[-1], rtol=REVALIDATE_RTOL, atol=0, equal_nan=True)
+
+
+def _bounds(start: str, end: Optional[str]) -> tuple[pd.Timestamp, pd.Timestamp]:
+    """Inclusive time bounds of a ``start..end`` request."""
+    lo_ts = pd.Timestamp(start)
+    hi_ts = pd.Timestamp(end) if end else pd.Timestamp(date.today())
+    # A bare date means the whole day
+    if end is None or len(end) <= 10:
+        hi_ts = hi_ts + pd.Timedelta(1, unit="D") - pd.Timedelta(1, unit="us")
+    return lo_ts, hi_ts
+
+
+class OHLCStore:
+    """On-disk, per-symbol Parquet store of OHLCV bars."""
+
+    def __init__(self, root: Path | str) -> None:
+        """Initialize the store.
+
+        Args:
+            root: Directory holding the Parquet files (created on demand).
+        """
+        self.root = Path(root)
+        self._locks: dict[Path, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        # (source, symbol, fine, coarse, start, end) -> last derived bars, so
+        # repeated polls only re-aggregate the newest bucket
+        self._derived: OrderedDict[tuple[str, ...], pd.DataFrame] = OrderedDict()
+        self._derived_lock = threading.Lock()
+
+    def _lock(self, path: Path) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(path, threading.Lock())
+
+    def _paths(self, source: str, interval: str, symbol: str) -> tuple[Path, Path]:
+        base = self.root / source.upper() / interval / symbol.upper()
+        return base.with_suffix(".parquet"), base.with_suffix(".json")
+
+    @staticmethod
+    def _read_sidecar(path: Path) -> dict:
+        return json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+
+    @staticmethod
+    def _ranges(sidecar: dict) -> list[DateRange]:
+        return [(date.fromisoformat(lo), date.fromisoformat(hi)) for lo, hi in sidecar.get("ranges", [])]
+
+    @classmethod
+    def _read_coverage(cls, path: Path) -> list[DateRange]:
+        return cls._ranges(cls._read_sidecar(path))
+
+    def _forget_derived(self, source: str, symbol: str) -> None:
+        """Drop memoized derived series of ``symbol``, whose bars changed."""
+        with self._derived_lock:
+            for key in [k for k in self._derived if k[:2] == (source.upper(), symbol.upper())]:
+                del self._derived[key]
+
+    @staticmethod
+    def _write_atomic(path: Path, write: Callable[[Path], None]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        write(tmp)
+        os.replace(tmp, path)
+
+    def history(
+        self,
+        symbol: str,
+        start: str,
+        end: Optional[str],
+        interval: str,
+        fetch: Fetcher,
+        source: str = "VCI",
+    ) -> pd.DataFrame:
+        """Return bars for ``start..end``, fetching only the uncovered dates.
+
+        The first gap fetch of the day is widened by one stored bar to check
+        it against upstream (see the module docstring).
+
+        Args:
+            symbol: Stock symbol.
+            start: Start date (YYYY-MM-DD or YYYY-MM-DD HH:MM:SS).
+            end: End date, inclusive (default: today).
+            interval: One of ``STORED_INTERVALS``.
+            fetch: ``fetch(start, end)`` returning bars from upstream for a gap.
+            source: Data source the bars come from.
+
+        Returns:
+            DataFrame of bars sorted by ``time``.
+        """
+        interval = normalize_interval(interval)
+        if interval not in STORED_INTERVALS:
+            raise ValueError(f"Interval {interval} is not stored locally")
+
+        lo_ts, hi_ts = _bounds(start, end)
+        today = date.today()
+        lo_day, hi_day = lo_ts.date(), min(hi_ts.date(), today)
+
+        data_path, coverage_path = self._paths(source, interval, symbol)
+        with self._lock(data_path):
+            sidecar = self._read_sidecar(coverage_path)
+            covered = self._ranges(sidecar)
+            gaps = missing_ranges(covered, lo_day, hi_day)
+            stored = pd.read_parquet(data_path) if data_path.exists() else None
+
+            if gaps:
+                anchor = None
+                if stored is not None and not stored.empty and sidecar.get("checked") != today.isoformat():
+                    anchor = _anchor(stored, gaps, today)
+                windows = list(gaps)
+                if anchor is not None:
+                    if anchor.date() < gaps[0][0]:
+                        windows[0] = (anchor.date(), windows[0][1])
+                    else:
+                        windows[-1] = (windows[-1][0], anchor.date())
+                fetched = [fetch(lo.isoformat(), hi.isoformat()) for lo, hi in windows]
+                if anchor is not None and _moved(stored, fetched, anchor):
+                    logger.warning(
+                        f"ohlc_store: {symbol} {interval} close of {anchor} changed upstream; refetching"
+                    )
+                    covered, stored = [], None
+                    gaps = [(lo_day, hi_day)]
+                    fetched = [fetch(lo_day.isoformat(), hi_day.isoformat())]
+                    self._forget_derived(source, symbol)
+                checked = today.isoformat() if anchor is not None or stored is None else sidecar.get("checked")
+                frames = [f for f in [stored, *fetched] if f is not None and not f.empty]
+                if frames:
+                    stored = (
+                        pd.concat(frames, ignore_index=True)
+                        .drop_duplicates(subset="time", keep="last")
+                        .sort_values("time", ignore_index=True)
+                    )
+                    self._write_atomic(data_path, lambda p: stored.to_parquet(p, index=False))
+                # Everything before today is final; today's bars are still forming
+                done = [(lo, min(hi, today - timedelta(days=1))) for lo, hi in gaps]
+                covered = merge_ranges(covered + [(lo, hi) for lo, hi in done if lo <= hi])
+                payload = {
+                    "ranges": [[lo.isoformat(), hi.isoformat()] for lo, hi in covered],
+                    "checked": checked,
+                }
+                self._write_atomic(
+                    coverage_path,
+                    lambda p: p.write_text(json.dumps(payload), encoding="utf-8"),
+                )
+                logger.info(f"ohlc_store fetched {len(gaps)} gap(s) for {symbol} {interval}")
+
+        if stored is None or stored.empty:
+            return pd.DataFrame() if stored is None else stored
+        times = pd.to_datetime(stored["time"])
+        return stored[(times >= lo_ts) & (times <= hi_ts)].reset_index(drop=True)
+
+    def _source_interval(
+        self, symbol: str, interval: str, start: str, end: Optional[str], source: str
+    ) -> Optional[str]:
+        """Coarsest stored interval finer than ``interval`` covering ``start..end``.
+
+        Every past day of the range must be covered. A range of today only
+        qualifies if bars of that interval were stored before. None if
+        ``interval`` itself is stored for the range, which is then served
+        as is, and for daily and coarser intervals when only intraday bars
+        are stored: provider daily bars are adjusted for corporate actions,
+        intraday bars are not.
+        """
+        lo_ts, hi_ts = _bounds(start, end)
+        today = date.today()
+        lo_day, hi_day = lo_ts.date(), min(hi_ts.date(), today - timedelta(days=1))
+        if interval in STORED_INTERVALS and lo_day <= hi_day:
+            _, own_coverage = self._paths(source, interval, symbol)
+            if not missing_ranges(self._read_coverage(own_coverage), lo_day, hi_day):
+                return None
+        for fine in reversed(STORED_INTERVALS):
+            if fine == interval or not can_resample(fine, interval):
+                continue
+            if fine in INTRADAY_MINUTES and interval not in INTRADAY_MINUTES:
+                continue
+            data_path, coverage_path = self._paths(source, fine, symbol)
+            if not data_path.exists():
+                continue
+            if lo_day > hi_day or not missing_ranges(self._read_coverage(coverage_path), lo_day, hi_day):
+                return fine
+        return None
+
+    def derived_history(
+        self,
+        symbol: str,
+        start: str,
+        end: Optional[str],
+        interval: str,
+        fetch: Callable[[str, str, str], pd.DataFrame],
+        source: str = "VCI",
+    ) -> Optional[pd.DataFrame]:
+        """Build ``interval`` bars from finer bars already stored, if any.
+
+        Asking for 5m, then 15m, then 1H of the same symbol and dates thus
+        costs one upstream fetch: the coarser ones are aggregated locally
+        (see ``shared/resample.py``). Only today's finer bars, which are
+        never final, may be fetched again. Weekly and monthly bars come from
+        stored daily bars; daily bars are never rebuilt from intraday ones.
+
+        Args:
+            symbol: Stock symbol.
+            start: Start date (YYYY-MM-DD or YYYY-MM-DD HH:MM:SS).
+            end: End date, inclusive (default: today).
+            interval: Requested interval (``5m`` ... ``1H``, ``1W`` or ``1M``).
+            fetch: ``fetch(start, end, interval)`` returning bars from upstream.
+            source: Data source the bars come from.
+
+        Returns:
+            Bars sorted by ``time``, or None if no finer stored interval covers
+            the range (the caller then fetches ``interval`` itself).
+        """
+        interval = normalize_interval(interval)
+        fine = self._source_interval(symbol, interval, start, end, source)
+        if fine is None:
+            return None
+        bars = self.history(symbol, start, end, fine, lambda lo, hi: fetch(lo, hi, fine), source=source)
+        if bars.empty:
+            return bars
+
+        key = (source.upper(), symbol.upper(), fine, interval, start, end or "")
+        with self._derived_lock:
+            previous = self._derived.get(key)
+        derived = resample_bars(bars, interval, previous=previous)
+        with self._derived_lock:
+            self._derived[key] = derived
+            self._derived.move_to_end(key)
+            while len(self._derived) > DERIVED_MAX_ENTRIES:
+                self._derived.popitem(last=False)
+        logger.debug(f"ohlc_store derived {symbol} {interval} from {fine} bars")
+        # A bucket is kept if it starts in the range or holds its first bar
+        # (e.g. the week of a mid-week start date)
+        lo_ts, hi_ts = _bounds(start, end)
+        first = bucket_starts(np.array([lo_ts.to_datetime64()], dtype="datetime64[ns]"), interval)[0]
+        times = pd.to_datetime(derived["time"]).to_numpy()
+        return derived[(times >= first) & (times <= hi_ts.to_datetime64())].reset_index(drop=True)
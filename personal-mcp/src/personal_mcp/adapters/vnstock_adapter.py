@@ -4,39 +4,227 @@ Wraps vnstock library functions to provide a clean, typed interface for MCP tool
 All methods here are pure adapters that delegate to vnstock library.
 """
 
-from typing import Any, Optional
+import functools
+import importlib.util
+import inspect
+import json
+import sys
+import threading
+import time
+from datetime import datetime
+from types import ModuleType
+from typing import Any, Callable, Optional
 
 import pandas as pd
-import vnstock
 from fastmcp.utilities.logging import get_logger
 
+from personal_mcp.adapters.ohlc_store import STORED_INTERVALS, OHLCStore, normalize_interval
+from personal_mcp.config import settings
+from personal_mcp.shared.cache import MISSING, TTLCache
+from personal_mcp.shared.http import install_session_pool
+from personal_mcp.shared.pool import ObjectPool
+from personal_mcp.shared.precision import downcast_frame, restore_frame
+from personal_mcp.shared.resilience import get_source_guard
+from personal_mcp.shared.singleflight import SingleFlight
+
 logger = get_logger(__name__)
 
 
+def _lazy_import(name: str) -> ModuleType:
+    """Import a module whose body runs on first attribute access.
+
+    Importing vnstock takes seconds (it pulls in plotting libraries and
+    phones home), which would otherwise be paid at server start.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+vnstock = _lazy_import("vnstock")
+
+# Months in which Vietnamese listed companies publish financial statements:
+# quarterly reports after each quarter end and audited annual reports in March.
+_FILING_MONTHS = (1, 3, 4, 7, 10)
+
+
+def _finance_expiry(now: float) -> float:
+    """Expiry for finance data: the start of the next filing month.
+
+    Inside a filing month new statements arrive daily, so a short TTL applies.
+    """
+    today = datetime.fromtimestamp(now)
+    if today.month in _FILING_MONTHS:
+        return now + settings.cache_ttl_finance_filing
+    month = next((m for m in _FILING_MONTHS if m > today.month), None)
+    if month is None:
+        return datetime(today.year + 1, _FILING_MONTHS[0], 1).timestamp()
+    return datetime(today.year, month, 1).timestamp()
+
+
+def _expires_at(category: str, now: float) -> float:
+    """Absolute expiry timestamp for a freshly fetched value of ``category``."""
+    if category == "finance":
+        return _finance_expiry(now)
+    return now + getattr(settings, f"cache_ttl_{category}")
+
+
+def _canonical(name: str, value: Any) -> Any:
+    """Normalize an argument so equivalent calls share a cache key."""
+    if isinstance(value, dict):
+        return {k: _canonical(k, v) for k, v in sorted(value.items())}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(name, v) for v in value]
+    if isinstance(value, str) and name in ("symbol", "symbols_list", "source"):
+        return value.strip().upper()
+    return value
+
+
+def _cache_key(name: str, signature: inspect.Signature, args: tuple, kwargs: dict) -> str:
+    """Build a key from the method name and its bound, defaulted arguments."""
+    bound = signature.bind(None, *args, **kwargs)
+    bound.apply_defaults()
+    arguments = dict(bound.arguments)
+    arguments.pop("self")
+    arguments.update(arguments.pop("kwargs", {}))
+    canonical = {k: _canonical(k, v) for k, v in arguments.items()}
+    return f"{name}:{json.dumps(canonical, sort_keys=True, default=str)}"
+
+
+def _cached(
+    category: str, source: Optional[str] = "VCI"
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Serve an adapter method from ``self.cache`` using the TTL of ``category``.
+
+    On a miss, concurrent identical calls are coalesced through
+    ``self.inflight`` so only one upstream request is made, and the call is
+    paced by the guard of its upstream: a ``source`` keyword argument if
+    given, else ``source``. With ``source=None`` the method guards its own
+    upstream calls. If the upstream fails or its circuit is open, an expired
+    cache entry is served when one exists.
+
+    DataFrames are narrowed with ``downcast_frame`` before they are cached
+    and widened back with ``restore_frame`` on the way out, as shallow
+    copies so callers can add or drop columns without touching the shared
+    frame; the narrow dtypes never leave the cache.
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(self: "VNStockAdapter", *args: Any, **kwargs: Any) -> Any:
+            key = _cache_key(func.__name__, signature, args, kwargs)
+
+            def fetch() -> Any:
+                return func(self, *args, **kwargs)
+
+            def load() -> Any:
+                upstream = kwargs.get("source") or source
+                try:
+                    result = get_source_guard(upstream).call(fetch) if upstream else fetch()
+                except OSError as e:
+                    stale = self.cache.get(key, allow_stale=True)
+                    if stale is MISSING:
+                        raise
+                    logger.warning(f"{func.__name__} serving stale data: {e}")
+                    return stale
+                if isinstance(result, pd.DataFrame) and settings.downcast_cached_frames:
+                    result = downcast_frame(result)
+                if result is not None:
+                    self.cache.set(key, result, _expires_at(category, time.time()))
+                return result
+
+            result = self.cache.get(key)
+            if result is MISSING:
+                result = self.inflight.do(key, load)
+            else:
+                logger.debug(f"{func.__name__} served from cache")
+            if isinstance(result, pd.DataFrame):
+                return restore_frame(result)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
 class VNStockAdapter:
     """Adapter for vnstock library.
 
     Initializes vnstock classes and provides wrapper methods for all public functions.
+    Data methods are cached in-process with a TTL per category (see ``config``).
     """
 
     def __init__(self) -> None:
-        """Initialize vnstock adapter with singleton instances of each class.
-        
-        Note: Some classes require parameters, so they are initialized lazily.
+        """Initialize vnstock adapter.
+
+        Note: vnstock clients are created on first use (some constructors
+        call upstream APIs). Classes bound to a symbol are taken from
+        ``self.objects`` so each (class, symbol, source) is built once.
+        All upstream HTTP traffic goes through the shared session pool.
         """
-        self.listing = vnstock.Listing()
         self.quote: Optional[vnstock.Quote] = None  # Lazy - requires symbol
-        self.trading = vnstock.Trading()
         self.finance: Optional[vnstock.Finance] = None  # Lazy - requires source and symbol
         self.company: Optional[vnstock.Company] = None  # Lazy - requires symbol
-        self.fund = vnstock.Fund()
-        self.screener = vnstock.Screener()
-        self.vnstock_root = vnstock.Vnstock()
+        self._clients_lock = threading.Lock()
+        install_session_pool()
+        self.cache = TTLCache(max_bytes=settings.cache_max_bytes)
+        self.inflight = SingleFlight()
+        self.objects = ObjectPool(
+            max_size=settings.object_pool_max_size,
+            idle_seconds=settings.object_pool_idle_seconds,
+        )
+        self.ohlc_store = OHLCStore(settings.ohlc_store_dir) if settings.ohlc_store_dir else None
+
+    def _client(self, name: str, factory: Callable[[], Any]) -> Any:
+        """Return the client cached under ``name``, building it once."""
+        client = self.__dict__.get(name)
+        if client is None:
+            with self._clients_lock:
+                client = self.__dict__.get(name)
+                if client is None:
+                    client = self.__dict__[name] = factory()
+        return client
+
+    @property
+    def listing(self) -> Any:
+        """Shared ``vnstock.Listing`` client."""
+        return self._client("_listing", lambda: vnstock.Listing())
+
+    @property
+    def trading(self) -> Any:
+        """Shared ``vnstock.Trading`` client."""
+        return self._client("_trading", lambda: vnstock.Trading())
+
+    @property
+    def fund(self) -> Any:
+        """Shared ``vnstock.Fund`` client (its constructor calls Fmarket)."""
+        return self._client("_fund", lambda: vnstock.Fund())
+
+    @property
+    def screener(self) -> Any:
+        """Shared ``vnstock.Screener`` client."""
+        return self._client("_screener", lambda: vnstock.Screener())
+
+    @property
+    def vnstock_root(self) -> Any:
+        """Shared ``vnstock.Vnstock`` entry point."""
+        return self._client("_vnstock_root", lambda: vnstock.Vnstock())
 
     # =========================================================================
     # LISTING METHODS (10 methods)
     # =========================================================================
 
+    @_cached("listing")
     def listing_all_bonds(self, **kwargs: Any) -> Any:
         """Get all bonds.
 
@@ -54,6 +242,7 @@ class VNStockAdapter:
             logger.error(f"Error in listing_all_bonds: {e}")
             raise
 
+    @_cached("listing")
     def listing_all_covered_warrant(self, **kwargs: Any) -> Any:
         """Get all covered warrants.
 
@@ -71,6 +260,7 @@ class VNStockAdapter:
             logger.error(f"Error in listing_all_covered_warrant: {e}")
             raise
 
+    @_cached("listing")
     def listing_all_future_indices(self, **kwargs: Any) -> Any:
         """Get all future indices.
 
@@ -88,6 +278,7 @@ class VNStockAdapter:
             logger.error(f"Error in listing_all_future_indices: {e}")
             raise
 
+    @_cached("listing")
     def listing_all_government_bonds(self, **kwargs: Any) -> Any:
         """Get all government bonds.
 
@@ -105,6 +296,7 @@ class VNStockAdapter:
             logger.error(f"Error in listing_all_government_bonds: {e}")
             raise
 
+    @_cached("listing")
     def listing_all_symbols(self, *args: Any, **kwargs: Any) -> Any:
         """Get all symbols.
 
@@ -123,6 +315,7 @@ class VNStockAdapter:
             logger.error(f"Error in listing_all_symbols: {e}")
             raise
 
+    @_cached("listing")
     def listing_history(self, *args: Any, **kwargs: Any) -> Any:
         """Get listing history.
 
@@ -141,6 +334,7 @@ class VNStockAdapter:
             logger.error(f"Error in listing_history: {e}")
             raise
 
+    @_cached("listing")
     def listing_industries_icb(self, *args: Any, **kwargs: Any) -> Any:
         """Get industries by ICB classification.
 
@@ -159,6 +353,7 @@ class VNStockAdapter:
             logger.error(f"Error in listing_industries_icb: {e}")
             raise
 
+    @_cached("listing")
     def listing_symbols_by_exchange(self, *args: Any, **kwargs: Any) -> Any:
         """Get symbols by exchange.
 
@@ -177,6 +372,7 @@ class VNStockAdapter:
             logger.error(f"Error in listing_symbols_by_exchange: {e}")
             raise
 
+    @_cached("listing")
     def listing_symbols_by_group(self, *args: Any, **kwargs: Any) -> Any:
         """Get symbols by group.
 
@@ -195,6 +391,7 @@ class VNStockAdapter:
             logger.error(f"Error in listing_symbols_by_group: {e}")
             raise
 
+    @_cached("listing")
     def listing_symbols_by_industries(self, *args: Any, **kwargs: Any) -> Any:
         """Get symbols by industries.
 
@@ -217,6 +414,7 @@ class VNStockAdapter:
     # QUOTE METHODS (3 methods)
     # =========================================================================
 
+    @_cached("quote_history", source=None)
     def quote_history(
         self,
         symbol: Optional[str] = None,
@@ -227,6 +425,14 @@ class VNStockAdapter:
     ) -> pd.DataFrame:
         """Get quote history for a symbol.
 
+        Intraday and daily bars are served from the local OHLC store when one
+        is configured; only dates not stored yet are fetched from vnstock.
+        An interval not stored for the dates is aggregated from finer bars
+        already stored for them when there are some: intraday from intraday,
+        weekly and monthly from daily (see ``OHLCStore.derived_history``).
+        Only those upstream fetches go through the VCI guard, so stored data
+        stays available while VCI is down.
+
         Args:
             symbol: Stock symbol.
             start: Start date (format: YYYY-MM-DD).
@@ -237,15 +443,44 @@ class VNStockAdapter:
         Returns:
             DataFrame with history data.
         """
+        guard = get_source_guard("VCI")
         try:
             if symbol:
-                quote = vnstock.Quote(symbol=symbol)
-                result = quote.history(
-                    symbol=symbol, start=start, end=end, interval=interval, **kwargs
-                )
+                quote = self.objects.get(vnstock.Quote, symbol=symbol)
+                def fetch(lo: str, hi: str, iv: str = interval) -> pd.DataFrame:
+                    return guard.call(lambda: quote.history(symbol=symbol, start=lo, end=hi, interval=iv))
+
+                derived = None
+                if self.ohlc_store is not None and start and not kwargs:
+                    derived = self.ohlc_store.derived_history(
+                        symbol=symbol, start=start, end=end, interval=interval, fetch=fetch
+                    )
+                if derived is not None:
+                    result = derived
+                elif (
+                    self.ohlc_store is not None
+                    and start
+                    and not kwargs
+                    and normalize_interval(interval) in STORED_INTERVALS
+                ):
+                    result = self.ohlc_store.history(
+                        symbol=symbol,
+                        start=start,
+                        end=end,
+                        interval=normalize_interval(interval),
+                        fetch=fetch,
+                    )
+                else:
+                    result = guard.call(
+                        lambda: quote.history(
+                            symbol=symbol, start=start, end=end, interval=interval, **kwargs
+                        )
+                    )
             else:
-                result = self.quote.history(
-                    symbol=symbol, start=start, end=end, interval=interval, **kwargs
+                result = guard.call(
+                    lambda: self.quote.history(
+                        symbol=symbol, start=start, end=end, interval=interval, **kwargs
+                    )
                 )
             logger.info(f"quote_history completed for symbol: {symbol}")
             return result
@@ -253,6 +488,7 @@ class VNStockAdapter:
             logger.error(f"Error in quote_history: {e}")
             raise
 
+    @_cached("realtime")
     def quote_intraday(
         self,
         symbol: Optional[str] = None,
@@ -273,7 +509,7 @@ class VNStockAdapter:
         """
         try:
             if symbol:
-                quote = vnstock.Quote(symbol=symbol)
+                quote = self.objects.get(vnstock.Quote, symbol=symbol)
                 result = quote.intraday(
                     symbol=symbol, page_size=page_size, page=page, **kwargs
                 )
@@ -287,6 +523,7 @@ class VNStockAdapter:
             logger.error(f"Error in quote_intraday: {e}")
             raise
 
+    @_cached("realtime")
     def quote_price_depth(
         self, symbol: Optional[str] = None, **kwargs: Any
     ) -> pd.DataFrame:
@@ -301,7 +538,7 @@ class VNStockAdapter:
         """
         try:
             if symbol:
-                quote = vnstock.Quote(symbol=symbol)
+                quote = self.objects.get(vnstock.Quote, symbol=symbol)
                 result = quote.price_depth(symbol=symbol, **kwargs)
             else:
                 result = self.quote.price_depth(symbol=symbol, **kwargs)
@@ -315,6 +552,7 @@ class VNStockAdapter:
     # TRADING METHODS (9 methods)
     # =========================================================================
 
+    @_cached("trading")
     def trading_foreign_trade(self, *args: Any, **kwargs: Any) -> Any:
         """Get foreign trade data.
 
@@ -333,6 +571,7 @@ class VNStockAdapter:
             logger.error(f"Error in trading_foreign_trade: {e}")
             raise
 
+    @_cached("trading")
     def trading_history(self, *args: Any, **kwargs: Any) -> Any:
         """Get trading history.
 
@@ -351,6 +590,7 @@ class VNStockAdapter:
             logger.error(f"Error in trading_history: {e}")
             raise
 
+    @_cached("trading")
     def trading_insider_deal(self, *args: Any, **kwargs: Any) -> Any:
         """Get insider deals.
 
@@ -369,6 +609,7 @@ class VNStockAdapter:
             logger.error(f"Error in trading_insider_deal: {e}")
             raise
 
+    @_cached("trading")
     def trading_order_stats(self, *args: Any, **kwargs: Any) -> Any:
         """Get order statistics.
 
@@ -387,6 +628,7 @@ class VNStockAdapter:
             logger.error(f"Error in trading_order_stats: {e}")
             raise
 
+    @_cached("realtime")
     def trading_price_board(self, *args: Any, **kwargs: Any) -> Any:
         """Get price board data.
 
@@ -405,6 +647,7 @@ class VNStockAdapter:
             logger.error(f"Error in trading_price_board: {e}")
             raise
 
+    @_cached("trading")
     def trading_price_history(self, *args: Any, **kwargs: Any) -> Any:
         """Get price history.
 
@@ -423,6 +666,7 @@ class VNStockAdapter:
             logger.error(f"Error in trading_price_history: {e}")
             raise
 
+    @_cached("trading")
     def trading_prop_trade(self, *args: Any, **kwargs: Any) -> Any:
         """Get proprietary trade data.
 
@@ -441,6 +685,7 @@ class VNStockAdapter:
             logger.error(f"Error in trading_prop_trade: {e}")
             raise
 
+    @_cached("trading")
     def trading_side_stats(self, *args: Any, **kwargs: Any) -> Any:
         """Get side statistics.
 
@@ -459,6 +704,7 @@ class VNStockAdapter:
             logger.error(f"Error in trading_side_stats: {e}")
             raise
 
+    @_cached("trading")
     def trading_trading_stats(self, *args: Any, **kwargs: Any) -> Any:
         """Get trading statistics.
 
@@ -481,6 +727,7 @@ class VNStockAdapter:
     # FINANCE METHODS (5 methods)
     # =========================================================================
 
+    @_cached("finance")
     def finance_balance_sheet(self, *args: Any, **kwargs: Any) -> Any:
         """Get balance sheet data.
 
@@ -497,7 +744,7 @@ class VNStockAdapter:
             symbol = kwargs.pop("symbol", None)
             if not symbol:
                 raise ValueError("symbol parameter is required for finance_balance_sheet")
-            finance = vnstock.Finance(source=source, symbol=symbol)
+            finance = self.objects.get(vnstock.Finance, source=source, symbol=symbol)
             result = finance.balance_sheet(*args, **kwargs)
             logger.info("finance_balance_sheet completed successfully")
             return result
@@ -505,6 +752,7 @@ class VNStockAdapter:
             logger.error(f"Error in finance_balance_sheet: {e}")
             raise
 
+    @_cached("finance")
     def finance_cash_flow(self, *args: Any, **kwargs: Any) -> Any:
         """Get cash flow data.
 
@@ -520,7 +768,7 @@ class VNStockAdapter:
             symbol = kwargs.pop("symbol", None)
             if not symbol:
                 raise ValueError("symbol parameter is required for finance_cash_flow")
-            finance = vnstock.Finance(source=source, symbol=symbol)
+            finance = self.objects.get(vnstock.Finance, source=source, symbol=symbol)
             result = finance.cash_flow(*args, **kwargs)
             logger.info("finance_cash_flow completed successfully")
             return result
@@ -528,6 +776,7 @@ class VNStockAdapter:
             logger.error(f"Error in finance_cash_flow: {e}")
             raise
 
+    @_cached("finance")
     def finance_history(self, *args: Any, **kwargs: Any) -> Any:
         """Get finance history.
 
@@ -543,7 +792,7 @@ class VNStockAdapter:
             symbol = kwargs.pop("symbol", None)
             if not symbol:
                 raise ValueError("symbol parameter is required for finance_history")
-            finance = vnstock.Finance(source=source, symbol=symbol)
+            finance = self.objects.get(vnstock.Finance, source=source, symbol=symbol)
             result = finance.history(*args, **kwargs)
             logger.info("finance_history completed successfully")
             return result
@@ -551,6 +800,7 @@ class VNStockAdapter:
             logger.error(f"Error in finance_history: {e}")
             raise
 
+    @_cached("finance")
     def finance_income_statement(self, *args: Any, **kwargs: Any) -> Any:
         """Get income statement data.
 
@@ -566,7 +816,7 @@ class VNStockAdapter:
             symbol = kwargs.pop("symbol", None)
             if not symbol:
                 raise ValueError("symbol parameter is required for finance_income_statement")
-            finance = vnstock.Finance(source=source, symbol=symbol)
+            finance = self.objects.get(vnstock.Finance, source=source, symbol=symbol)
             result = finance.income_statement(*args, **kwargs)
             logger.info("finance_income_statement completed successfully")
             return result
@@ -574,6 +824,7 @@ class VNStockAdapter:
             logger.error(f"Error in finance_income_statement: {e}")
             raise
 
+    @_cached("finance")
     def finance_ratio(self, *args: Any, **kwargs: Any) -> Any:
         """Get financial ratios.
 
@@ -589,7 +840,7 @@ class VNStockAdapter:
             symbol = kwargs.pop("symbol", None)
             if not symbol:
                 raise ValueError("symbol parameter is required for finance_ratio")
-            finance = vnstock.Finance(source=source, symbol=symbol)
+            finance = self.objects.get(vnstock.Finance, source=source, symbol=symbol)
             result = finance.ratio(*args, **kwargs)
             logger.info("finance_ratio completed successfully")
             return result
@@ -601,6 +852,7 @@ class VNStockAdapter:
     # COMPANY METHODS (8 methods)
     # =========================================================================
 
+    @_cached("company")
     def company_affiliate(self, *args: Any, **kwargs: Any) -> Any:
         """Get company affiliates.
 
@@ -616,7 +868,7 @@ class VNStockAdapter:
             symbol = kwargs.pop("symbol", None)
             if not symbol:
                 raise ValueError("symbol parameter is required for company_affiliate")
-            company = vnstock.Company(source=source, symbol=symbol)
+            company = self.objects.get(vnstock.Company, source=source, symbol=symbol)
             result = company.affiliate(*args, **kwargs)
             logger.info("company_affiliate completed successfully")
             return result
@@ -624,6 +876,7 @@ class VNStockAdapter:
             logger.error(f"Error in company_affiliate: {e}")
             raise
 
+    @_cached("company")
     def company_events(self, *args: Any, **kwargs: Any) -> Any:
         """Get company events.
 
@@ -639,7 +892,7 @@ class VNStockAdapter:
             symbol = kwargs.pop("symbol", None)
             if not symbol:
                 raise ValueError("symbol parameter is required for company_events")
-            company = vnstock.Company(source=source, symbol=symbol)
+            company = self.objects.get(vnstock.Company, source=source, symbol=symbol)
             result = company.events(*args, **kwargs)
             logger.info("company_events completed successfully")
             return result
@@ -647,6 +900,7 @@ class VNStockAdapter:
             logger.error(f"Error in company_events: {e}")
             raise
 
+    @_cached("company")
     def company_history(self, *args: Any, **kwargs: Any) -> Any:
         """Get company history.
 
@@ -662,7 +916,7 @@ class VNStockAdapter:
             symbol = kwargs.pop("symbol", None)
             if not symbol:
                 raise ValueError("symbol parameter is required for company_history")
-            company = vnstock.Company(source=source, symbol=symbol)
+            company = self.objects.get(vnstock.Company, source=source, symbol=symbol)
             result = company.history(*args, **kwargs)
             logger.info("company_history completed successfully")
             return result
@@ -670,6 +924,7 @@ class VNStockAdapter:
             logger.error(f"Error in company_history: {e}")
             raise
 
+    @_cached("company")
     def company_news(self, *args: Any, **kwargs: Any) -> Any:
         """Get company news.
 
@@ -685,7 +940,7 @@ class VNStockAdapter:
             symbol = kwargs.pop("symbol", None)
             if not symbol:
                 raise ValueError("symbol parameter is required for company_news")
-            company = vnstock.Company(source=source, symbol=symbol)
+            company = self.objects.get(vnstock.Company, source=source, symbol=symbol)
             result = company.news(*args, **kwargs)
             logger.info("company_news completed successfully")
             return result
@@ -693,6 +948,7 @@ class VNStockAdapter:
             logger.error(f"Error in company_news: {e}")
             raise
 
+    @_cached("company")
     def company_officers(self, *args: Any, **kwargs: Any) -> Any:
         """Get company officers.
 
@@ -708,7 +964,7 @@ class VNStockAdapter:
             symbol = kwargs.pop("symbol", None)
             if not symbol:
                 raise ValueError("symbol parameter is required for company_officers")
-            company = vnstock.Company(source=source, symbol=symbol)
+            company = self.objects.get(vnstock.Company, source=source, symbol=symbol)
             result = company.officers(*args, **kwargs)
             logger.info("company_officers completed successfully")
             return result
@@ -716,6 +972,7 @@ class VNStockAdapter:
             logger.error(f"Error in company_officers: {e}")
             raise
 
+    @_cached("company")
     def company_overview(self, *args: Any, **kwargs: Any) -> Any:
         """Get company overview.
 
@@ -731,7 +988,7 @@ class VNStockAdapter:
             symbol = kwargs.pop("symbol", None)
             if not symbol:
                 raise ValueError("symbol parameter is required for company_overview")
-            company = vnstock.Company(source=source, symbol=symbol)
+            company = self.objects.get(vnstock.Company, source=source, symbol=symbol)
             result = company.overview(*args, **kwargs)
             logger.info("company_overview completed successfully")
             return result
@@ -739,6 +996,7 @@ class VNStockAdapter:
             logger.error(f"Error in company_overview: {e}")
             raise
 
+    @_cached("company")
     def company_shareholders(self, *args: Any, **kwargs: Any) -> Any:
         """Get company shareholders.
 
@@ -754,7 +1012,7 @@ class VNStockAdapter:
             symbol = kwargs.pop("symbol", None)
             if not symbol:
                 raise ValueError("symbol parameter is required for company_shareholders")
-            company = vnstock.Company(source=source, symbol=symbol)
+            company = self.objects.get(vnstock.Company, source=source, symbol=symbol)
             result = company.shareholders(*args, **kwargs)
             logger.info("company_shareholders completed successfully")
             return result
@@ -762,6 +1020,7 @@ class VNStockAdapter:
             logger.error(f"Error in company_shareholders: {e}")
             raise
 
+    @_cached("company")
     def company_subsidiaries(self, *args: Any, **kwargs: Any) -> Any:
         """Get company subsidiaries.
 
@@ -777,7 +1036,7 @@ class VNStockAdapter:
             symbol = kwargs.pop("symbol", None)
             if not symbol:
                 raise ValueError("symbol parameter is required for company_subsidiaries")
-            company = vnstock.Company(source=source, symbol=symbol)
+            company = self.objects.get(vnstock.Company, source=source, symbol=symbol)
             result = company.subsidiaries(*args, **kwargs)
             logger.info("company_subsidiaries completed successfully")
             return result
@@ -789,6 +1048,7 @@ class VNStockAdapter:
     # FUND METHODS (7 methods)
     # =========================================================================
 
+    @_cached("fund", source="FMARKET")
     def fund_asset_holding(self, fund_id: int = 23) -> pd.DataFrame:
         """Get fund asset holdings.
 
@@ -806,6 +1066,7 @@ class VNStockAdapter:
             logger.error(f"Error in fund_asset_holding: {e}")
             raise
 
+    @_cached("fund", source="FMARKET")
     def fund_filter(self, symbol: str = "") -> pd.DataFrame:
         """Filter funds by symbol.
 
@@ -823,6 +1084,7 @@ class VNStockAdapter:
             logger.error(f"Error in fund_filter: {e}")
             raise
 
+    @_cached("fund", source="FMARKET")
     def fund_industry_holding(self, fund_id: int = 23) -> pd.DataFrame:
         """Get fund industry holdings.
 
@@ -840,6 +1102,7 @@ class VNStockAdapter:
             logger.error(f"Error in fund_industry_holding: {e}")
             raise
 
+    @_cached("fund", source="FMARKET")
     def fund_listing(self, fund_type: str = "") -> pd.DataFrame:
         """Get fund listings.
 
@@ -857,6 +1120,7 @@ class VNStockAdapter:
             logger.error(f"Error in fund_listing: {e}")
             raise
 
+    @_cached("fund", source="FMARKET")
     def fund_nav_report(self, fund_id: int = 23) -> pd.DataFrame:
         """Get fund NAV report.
 
@@ -874,6 +1138,7 @@ class VNStockAdapter:
             logger.error(f"Error in fund_nav_report: {e}")
             raise
 
+    @_cached("fund", source="FMARKET")
     def fund_top_holding(self, fund_id: int = 23) -> pd.DataFrame:
         """Get fund top holdings.
 
@@ -895,6 +1160,7 @@ class VNStockAdapter:
     # SCREENER METHODS (1 method)
     # =========================================================================
 
+    @_cached("screener", source="TCBS")
     def screener_stock(
         self, params: Optional[dict] = None, limit: int = 50, id: Optional[str] = None, lang: str = "vi"
     ) -> pd.DataFrame:
@@ -1,11 +1,106 @@
+from typing import Literal, Optional
+
 from fastmcp import settings
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class AppSettings(BaseSettings):
     model_config = SettingsConfigDict(
-        env_file=".env", 
+        env_file=".env",
         env_file_encoding="utf-8",
         extra="ignore"
     )
 
-settings = AppSettings()    
\ No newline at end of file
+    # Thread pool that runs blocking vnstock calls off the event loop
+    executor_max_workers: int = 16
+    # Deadline (seconds) applied to every adapter call made by a tool
+    tool_timeout_seconds: float = 60.0
+    # Concurrent upstream calls per data source when a tool fans out
+    source_concurrency: int = 4
+
+    # Text block sent next to structured tool results: a one-line summary
+    # (rows travel once, in structuredContent), a bounded markdown table or
+    # the full JSON (opt-in, for clients that ignore structuredContent)
+    tool_text_content: Literal["full", "summary", "markdown"] = "summary"
+
+    # Markdown tables: row cap (head and tail are kept), column cap and cell
+    # width cap; 0 disables a cap
+    markdown_max_rows: int = 40
+    markdown_max_cols: int = 30
+    markdown_max_cell_chars: int = 60
+
+    # Bytes per token assumed when a client caps a result with max_tokens
+    budget_bytes_per_token: float = 4.0
+
+    # Adapter response cache: total byte budget (0 disables) and TTLs in seconds
+    cache_max_bytes: int = 256 * 1024 * 1024
+    cache_ttl_listing: float = 24 * 3600
+    cache_ttl_company: float = 24 * 3600
+    cache_ttl_fund: float = 3600
+    cache_ttl_screener: float = 300
+    cache_ttl_trading: float = 60
+    cache_ttl_quote_history: float = 60
+    cache_ttl_realtime: float = 3
+    # Finance statements live until the next filing season; during one they
+    # are refreshed at this interval instead
+    cache_ttl_finance_filing: float = 6 * 3600
+
+    # Per-source pacing (requests/second) and circuit breaker
+    source_rate_limits: dict[str, float] = {
+        "VCI": 5.0,
+        "TCBS": 3.0,
+        "MSN": 2.0,
+        "FMARKET": 2.0,
+    }
+    source_rate_default: float = 2.0
+    source_rate_burst: int = 5
+    source_rate_max_wait: float = 10.0
+    breaker_failure_threshold: int = 5
+    breaker_reset_seconds: float = 30.0
+
+    # Shared keep-alive HTTP pool for upstream requests
+    http_pool_hosts: int = 32
+    http_pool_per_host: int = 16
+    http_timeout_seconds: float = 30.0
+
+    # Compression of the server's own HTTP responses (zstd needs the optional
+    # zstandard package, gzip is always available)
+    http_compression: bool = True
+    http_compression_min_bytes: int = 1024
+    http_gzip_level: int = 6
+    http_zstd_level: int = 3
+
+    # Reused per-(class, symbol, source) vnstock objects
+    object_pool_max_size: int = 512
+    object_pool_idle_seconds: float = 15 * 60
+
+    # On-disk Parquet store behind quote_history (empty string disables it)
+    ohlc_store_dir: str = ".cache/ohlc"
+
+    # Large results are returned page by page (0 disables paging); the rest
+    # is held server-side for next_page/stream_pages
+    page_rows: int = 1000
+    cursor_ttl_seconds: float = 10 * 60
+    cursor_max_bytes: int = 128 * 1024 * 1024
+
+    # Local screener: market-wide snapshot rebuilt in the background once
+    # older than this, persisted as Parquet (empty path keeps it in memory)
+    screener_refresh_seconds: float = 15 * 60
+    screener_universe_size: int = 2000
+    screener_snapshot_path: str = ".cache/screener/market.parquet"
+
+    # Working memory of one correlation/covariance computation; wide
+    # universes are processed in blocks of symbols to stay within it
+    analytics_memory_mb: int = 512
+
+    # Serialization precision: floats are rounded to these decimals (None
+    # keeps every digit), midnight timestamps are written as plain dates and
+    # cached frames are stored in 32 bits where that loses nothing
+    price_decimals: Optional[int] = 2
+    float_decimals: Optional[int] = 4
+    compact_dates: bool = True
+    downcast_cached_frames: bool = True
+
+    # zstd level of Arrow/Parquet exports (1 fastest, 22 smallest)
+    export_zstd_level: int = 3
+
+settings = AppSettings()
\ No newline at end of file
@@ -4,13 +4,18 @@ Main entry point for the Personal MCP server.
 
 import asyncio
 from personal_mcp.server import mcp
+from personal_mcp.shared.compression import http_middleware
+from personal_mcp.shared.executor import get_executor
 
 
 async def main():
     """
     Start the Personal MCP server asynchronously.
     """
-    await mcp.run_async(transport="http", port=8000)
+    try:
+        await mcp.run_async(transport="http", port=8000, middleware=http_middleware())
+    finally:
+        get_executor().shutdown()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -3,6 +3,7 @@ Middleware registration for the personal MCP server.
 """
 
 from typing import Callable
+from fastmcp.server.middleware import Middleware
 from fastmcp.server.middleware.logging import (
     LoggingMiddleware
 )
@@ -14,26 +15,83 @@ from fastmcp.server.middleware.timing import (
 )
 import pandas as pd
 
+from personal_mcp.config import settings
+from personal_mcp.shared.budget import fit_payload
+from personal_mcp.shared.executor import run_blocking
+from personal_mcp.shared.markdown import render_markdown
+from personal_mcp.shared.payloads import OUTPUT_SCHEMA, tool_result
+
 
 class MarkdownFormatterMiddleware:
     """
     Middleware to format tool responses as markdown strings.
-    Wraps pandas.DataFrame responses in markdown tables.
+    Wraps pandas.DataFrame responses in bounded markdown tables
+    (see ``shared/markdown.py``).
     """
     def __init__(self, enable_markdown: bool = True):
         self.enable_markdown = enable_markdown
 
     async def __call__(self, request, call_next):
         response = await call_next(request)
-        if self.enable_markdown and hasattr(response, 'to_markdown'):
-            markdown = response.to_markdown(index=False, tablefmt="grid")
-            return f"```markdown\n{markdown}\n```"
+        if self.enable_markdown and isinstance(response, (pd.DataFrame, pd.Series)):
+            frame = response.to_frame() if isinstance(response, pd.Series) else response
+            return f"```markdown\n{render_markdown(frame)}\n```"
         if response is None:
             return "No data available."
         if isinstance(response, str) and response.startswith("Error"):
             return response
         return response
 
+class ResultBudgetMiddleware(Middleware):
+    """
+    Let clients cap the size of data tool results.
+
+    Every data tool advertises ``max_tokens`` and ``max_bytes`` arguments.
+    They are removed before the tool runs; its payload is then reduced with
+    ``shared/budget.fit_payload`` until it fits the tighter of the two.
+    """
+
+    _PARAMETERS = {
+        "max_tokens": {
+            "anyOf": [{"type": "integer", "minimum": 1}, {"type": "null"}],
+            "default": None,
+            "description": "Approximate token budget for the result.",
+        },
+        "max_bytes": {
+            "anyOf": [{"type": "integer", "minimum": 1}, {"type": "null"}],
+            "default": None,
+            "description": "Byte budget for the result JSON.",
+        },
+    }
+
+    async def on_list_tools(self, context, call_next):
+        tools = await call_next(context)
+        return [self._with_budget(tool) if tool.output_schema == OUTPUT_SCHEMA else tool for tool in tools]
+
+    def _with_budget(self, tool):
+        parameters = dict(tool.parameters)
+        parameters["properties"] = {**parameters.get("properties", {}), **self._PARAMETERS}
+        return tool.model_copy(update={"parameters": parameters})
+
+    async def on_call_tool(self, context, call_next):
+        arguments = dict(context.message.arguments or {})
+        max_tokens = arguments.pop("max_tokens", None)
+        max_bytes = arguments.pop("max_bytes", None)
+        if max_tokens is None and max_bytes is None:
+            return await call_next(context)
+
+        message = context.message.model_copy(update={"arguments": arguments})
+        result = await call_next(context.copy(message=message))
+        budgets = [int(b) for b in (max_bytes,) if b is not None]
+        if max_tokens is not None:
+            budgets.append(int(max_tokens * settings.budget_bytes_per_token))
+        payload = result.structured_content
+        if not isinstance(payload, dict) or "data" not in payload:
+            return result
+        fitted = await run_blocking(fit_payload, payload, min(budgets))
+        return result if fitted is payload else tool_result(fitted)
+
+
 def register_middwares(mcp):
     """
     Register middlewares to enhance server capabilities.
@@ -41,6 +99,9 @@ def register_middwares(mcp):
     # Markdown formatter middleware - formats responses as markdown strings (apply first)
     mcp.add_middleware(MarkdownFormatterMiddleware(enable_markdown=True))
 
+    # Size budgets (max_tokens / max_bytes) on data tool results
+    mcp.add_middleware(ResultBudgetMiddleware())
+
     # Comprehensive error logging and transformation
     mcp.add_middleware(ErrorHandlingMiddleware(
         include_traceback=True,
@@ -0,0 +1,8 @@
+"""Resources package for personal MCP server."""
+
+from .export_resources import setup_export_resources
+
+
+def register_resources(mcp):
+    """Register all resources with the MCP server."""
+    setup_export_resources(mcp)
@@ -0,0 +1,109 @@
+"""Binary export resources.
+
+Large datasets are exposed as MCP resources in Parquet or Arrow IPC
+(zstd-compressed, see ``shared/exports.py``) so notebooks and batch jobs can
+read them without going through JSON. Each resource exists in both formats,
+chosen by the URI extension:
+
+- ``vnstock://quote_history/{symbol}.parquet?start=...&end=...&interval=1D``
+- ``vnstock://finance/{report}/{symbol}.parquet?period=quarter`` where
+  ``report`` is ``balance_sheet``, ``cash_flow``, ``income_statement`` or ``ratio``
+- ``vnstock://results/{snapshot}.parquet`` for the full result behind a
+  ``next_cursor`` token ``<snapshot>:<offset>`` returned by any data tool
+"""
+
+from typing import Any, Optional
+
+import pandas as pd
+
+from personal_mcp.adapters.vnstock_adapter import get_vnstock_adapter
+from personal_mcp.shared import cursors
+from personal_mcp.shared.executor import run_blocking
+from personal_mcp.shared.exports import MIME_TYPES, ExportFormat, encode_frame
+
+FINANCE_REPORTS = ("balance_sheet", "cash_flow", "income_statement", "ratio")
+
+
+def _frame(result: Any) -> pd.DataFrame:
+    if isinstance(result, pd.Series):
+        return result.to_frame(name=result.name if result.name is not None else "value")
+    if not isinstance(result, pd.DataFrame):
+        raise ValueError(f"Result is not tabular: {type(result).__name__}")
+    return result
+
+
+def setup_export_resources(server) -> None:
+    """Set up the export resources for the MCP server.
+
+    Encoding runs on the shared executor, like the adapter calls.
+
+    Args:
+        server: FastMCP server instance.
+    """
+    adapter = get_vnstock_adapter()
+
+    for ext, mime_type in MIME_TYPES.items():
+        _register(server, adapter, ext, mime_type)
+
+
+def _register(server, adapter, format: ExportFormat, mime_type: str) -> None:
+    @server.resource(
+        f"vnstock://quote_history/{{symbol}}.{format}{{?start,end,interval}}",
+        name=f"quote_history_{format}",
+        mime_type=mime_type,
+    )
+    async def quote_history_export(
+        symbol: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        interval: str = "1D",
+    ) -> bytes:
+        """Quote history of a symbol as a zstd-compressed file.
+
+        Args:
+            symbol: Stock symbol.
+            start: Start date (YYYY-MM-DD).
+            end: End date (YYYY-MM-DD).
+            interval: Time interval (default: 1D).
+        """
+        result = await run_blocking(adapter.quote_history, symbol=symbol, start=start, end=end, interval=interval)
+        return await run_blocking(encode_frame, _frame(result), format)
+
+    @server.resource(
+        f"vnstock://finance/{{report}}/{{symbol}}.{format}{{?period,lang}}",
+        name=f"finance_{format}",
+        mime_type=mime_type,
+    )
+    async def finance_export(
+        report: str,
+        symbol: str,
+        period: Optional[str] = None,
+        lang: Optional[str] = None,
+    ) -> bytes:
+        """Financial statement of a symbol as a zstd-compressed file.
+
+        Args:
+            report: balance_sheet, cash_flow, income_statement or ratio.
+            symbol: Stock symbol.
+            period: Report period, e.g. quarter or year (vnstock default if omitted).
+            lang: Label language, e.g. vi or en (vnstock default if omitted).
+        """
+        if report not in FINANCE_REPORTS:
+            raise ValueError(f"Unknown report {report!r}, expected one of {', '.join(FINANCE_REPORTS)}")
+        options = {k: v for k, v in (("period", period), ("lang", lang)) if v is not None}
+        result = await run_blocking(getattr(adapter, f"finance_{report}"), symbol=symbol, **options)
+        return await run_blocking(encode_frame, _frame(result), format)
+
+    @server.resource(
+        f"vnstock://results/{{snapshot}}.{format}",
+        name=f"result_{format}",
+        mime_type=mime_type,
+    )
+    async def result_export(snapshot: str) -> bytes:
+        """Full result of a paged tool call as a zstd-compressed file.
+
+        Args:
+            snapshot: Part of a ``next_cursor`` token before the colon.
+        """
+        frame, _ = cursors.held(snapshot)
+        return await run_blocking(encode_frame, frame, format)
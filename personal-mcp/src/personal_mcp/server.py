@@ -5,8 +5,10 @@ from fastmcp import FastMCP
 from starlette.responses import PlainTextResponse
 
 from personal_mcp.tools import register_tools
+from personal_mcp.resources import register_resources
 from personal_mcp.prompts import register_prompts
 from personal_mcp.middwares import register_middwares
+from personal_mcp.shared.compression import http_middleware
 
 
 # Create server with a descriptive name
@@ -14,8 +16,9 @@ mcp = FastMCP("Personal MCP Server")
 
 # Register middlewares
 register_middwares(mcp)
-# Register all tools and prompts (now from modular registries)
+# Register all tools, resources and prompts (now from modular registries)
 register_tools(mcp)
+register_resources(mcp)
 register_prompts(mcp)
 
 
@@ -29,7 +32,7 @@ async def main():
     """
     Start the Personal MCP server asynchronously.
     """
-    await mcp.run_async(transport="http")
+    await mcp.run_async(transport="http", middleware=http_middleware())
 
 
 if __name__ == "__main__":
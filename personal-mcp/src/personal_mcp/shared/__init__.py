@@ -0,0 +1 @@
+"""Shared kernel: utilities used across adapters and tools."""
@@ -0,0 +1,261 @@
+"""Vectorized long-only portfolio backtests over a price panel.
+
+A backtest rebalances a portfolio to target weights on the first bar of
+each period (day, week, month or quarter). Targets are either fixed
+weights or the equal-weighted members of a signal: a boolean expression
+over panel prices and indicator outputs (see ``shared/indicators.py``),
+optionally keeping the ``top`` symbols by a ranking expression. Signals
+are read on the bar before the rebalance so that no trade uses a close it
+could not have seen; fixed weights are known upfront and trade from the
+first bar.
+
+Orders follow the Vietnamese market rules: prices are rounded to the
+exchange price step (buys up, sells down) and quantities to round lots of
+100 shares. Brokerage fees apply to both sides and the sales tax to sells.
+Settlement delay and price limits are not modelled.
+
+Only the rebalance bars are walked in Python, each with a few operations
+over the symbol vector; target weights, order prices, the equity curve and
+the trade list are computed for all bars and symbols at once.
+"""
+
+from typing import NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+
+from personal_mcp.shared import expressions
+
+TICK_SIZES: dict[str, tuple[tuple[float, float], ...]] = {
+    "HOSE": ((10_000, 10), (50_000, 50), (np.inf, 100)),
+    "HNX": ((np.inf, 100),),
+    "UPCOM": ((np.inf, 100),),
+}
+"""Price step by exchange, as (upper price bound in VND, step) brackets."""
+
+LOT_SIZE = 100
+
+REBALANCE_PERIODS = {"daily": "D", "weekly": "W", "monthly": "M", "quarterly": "Q"}
+
+TRADING_DAYS = 252
+
+
+class BacktestResult(NamedTuple):
+    """Outcome of :func:`run_backtest`."""
+
+    summary: pd.DataFrame
+    equity: pd.DataFrame
+    trades: pd.DataFrame
+
+
+def price_steps(prices: np.ndarray, exchange: str = "HOSE") -> np.ndarray:
+    """Price step of each price (in VND) on ``exchange``."""
+    if exchange not in TICK_SIZES:
+        raise ValueError(f"Unknown exchange {exchange!r}, expected one of {', '.join(TICK_SIZES)}")
+    bounds, steps = zip(*TICK_SIZES[exchange])
+    return np.asarray(steps)[np.searchsorted(bounds, np.nan_to_num(prices), side="right")]
+
+
+def rebalance_rows(index: pd.DatetimeIndex, rebalance: str) -> np.ndarray:
+    """Positions of the first bar of each rebalance period in ``index``."""
+    if rebalance not in REBALANCE_PERIODS:
+        raise ValueError(f"Unknown rebalance {rebalance!r}, expected one of {', '.join(REBALANCE_PERIODS)}")
+    periods = index.to_period(REBALANCE_PERIODS[rebalance]).asi8
+    return np.flatnonzero(np.r_[True, periods[1:] != periods[:-1]])
+
+
+def evaluate_panel(panel: dict[str, pd.DataFrame], expression: str) -> np.ndarray:
+    """Evaluate an expression over every bar and symbol of a panel.
+
+    Args:
+        panel: Name (price field or indicator output) to time × symbol frame,
+            all with the same shape.
+        expression: Expression over those names (see ``shared/expressions.py``).
+
+    Returns:
+        Time × symbol array of the results.
+    """
+    shape = next(iter(panel.values())).shape
+    cells = pd.DataFrame({name: frame.to_numpy().ravel() for name, frame in panel.items()})
+    return expressions.evaluate(cells, expression).to_numpy().reshape(shape)
+
+
+def signal_weights(
+    panel: dict[str, pd.DataFrame],
+    signal: str,
+    rank: Optional[str] = None,
+    top: Optional[int] = None,
+) -> np.ndarray:
+    """Equal weights over the symbols selected by a signal on each bar.
+
+    Args:
+        panel: See :func:`evaluate_panel`.
+        signal: Boolean expression; missing values count as false.
+        rank: Expression ranking the selected symbols, highest first.
+        top: Keep at most this many symbols by ``rank`` (or in column order
+            without one).
+
+    Returns:
+        Time × symbol weights, each row summing to 1 or 0.
+    """
+    selected = evaluate_panel(panel, signal)
+    if selected.dtype != bool:
+        if selected.dtype != object:
+            raise ValueError(f"Signal {signal!r} does not evaluate to true/false")
+        selected = pd.DataFrame(selected).fillna(False).to_numpy(dtype=bool)
+    if top is not None:
+        if top < 1:
+            raise ValueError("top must be at least 1")
+        score = evaluate_panel(panel, rank).astype(float) if rank else np.zeros(selected.shape)
+        score = np.where(selected & ~np.isnan(score), score, -np.inf)
+        # Stable descending order keeps column order among ties
+        order = np.argsort(-score, axis=1, kind="stable")[:, :top]
+        keep = np.zeros_like(selected)
+        np.put_along_axis(keep, order, True, axis=1)
+        selected &= keep & np.isfinite(score)
+    count = selected.sum(axis=1, keepdims=True)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(selected, 1.0 / count, 0.0)
+
+
+def static_weights(weights: dict[str, float], symbols: list[str], bars: int) -> np.ndarray:
+    """Repeat fixed symbol weights over ``bars`` bars.
+
+    Raises:
+        ValueError: If a weight is negative or they sum to more than 1.
+    """
+    weights = {s.upper(): w for s, w in weights.items()}
+    if any(w < 0 for w in weights.values()):
+        raise ValueError("Weights must not be negative (long-only backtest)")
+    if sum(weights.values()) > 1 + 1e-9:
+        raise ValueError("Weights must sum to at most 1; the rest is held as cash")
+    row = np.array([weights.get(s, 0.0) for s in symbols])
+    return np.broadcast_to(row, (bars, len(symbols)))
+
+
+def run_backtest(
+    close: pd.DataFrame,
+    weights: np.ndarray,
+    rebalance: str = "monthly",
+    capital: float = 1e9,
+    fee_bps: float = 15,
+    sell_tax_bps: float = 10,
+    exchange: str = "HOSE",
+    price_unit: float = 1000,
+    lag: int = 1,
+) -> BacktestResult:
+    """Simulate rebalancing a portfolio to target weights.
+
+    Args:
+        close: Close panel (time × symbol), NaN where a symbol has no bar.
+        weights: Time × symbol target weights; row ``t - lag`` sets the
+            target of a rebalance on bar ``t``. The first period rebalances
+            on bar ``lag`` at the latest.
+        rebalance: "daily", "weekly", "monthly" or "quarterly".
+        capital: Starting cash in VND.
+        fee_bps: Brokerage fee on each trade's value, in basis points.
+        sell_tax_bps: Tax on sale proceeds, in basis points.
+        exchange: Exchange whose price steps apply.
+        price_unit: VND per unit of ``close`` (quote prices are in thousands).
+        lag: Bars between the weights and the trades they trigger (0 for
+            fixed weights, 1 for signals read on the previous close).
+
+    Returns:
+        Summary (one row), daily equity curve and trade list.
+    """
+    times, symbols = close.index, list(close.columns)
+    prices = close.to_numpy(dtype=np.float64) * price_unit
+    # Halted symbols are valued at their last close
+    marks = np.nan_to_num(pd.DataFrame(prices).ffill().to_numpy())
+    # A period starting before the first usable weights rebalances as soon
+    # as they exist rather than waiting for the next period
+    rows = np.unique(np.maximum(rebalance_rows(times, rebalance), lag))
+    rows = rows[rows < len(times)]
+    targets = np.nan_to_num(np.asarray(weights, dtype=np.float64)[rows - lag])
+
+    steps = price_steps(prices[rows], exchange)
+    with np.errstate(invalid="ignore"):
+        # Snap to the step grid first: a price stored in float32 upstream
+        # (23.45 read back as 23.4500008) must not round up a whole step
+        ticks = np.round(prices[rows] / steps, 3)
+        buy_prices = np.ceil(ticks) * steps
+        sell_prices = np.floor(ticks) * steps
+    tradable = buy_prices > 0
+    buy_prices, sell_prices = np.where(tradable, buy_prices, np.inf), np.nan_to_num(sell_prices)
+    fee, tax = fee_bps / 1e4, sell_tax_bps / 1e4
+
+    held = np.zeros((len(rows), len(symbols)))
+    cash = np.zeros(len(rows))
+    shares, balance = np.zeros(len(symbols)), float(capital)
+    for k, row in enumerate(rows):
+        value = balance + shares @ marks[row]
+        wanted = np.floor(targets[k] * value / (1 + fee) / buy_prices[k] / LOT_SIZE) * LOT_SIZE
+        target = np.where(tradable[k], wanted, shares)
+        delta = target - shares
+        bought, sold = np.clip(delta, 0, None), np.clip(-delta, 0, None)
+        proceeds = sold @ sell_prices[k] * (1 - fee - tax)
+        cost = bought @ np.where(tradable[k], buy_prices[k], 0) * (1 + fee)
+        if cost > balance + proceeds and cost > 0:
+            # Rounding left the buys short of cash: scale them down to whole lots
+            bought = np.floor(bought * (balance + proceeds) / cost / LOT_SIZE) * LOT_SIZE
+            cost = bought @ np.where(tradable[k], buy_prices[k], 0) * (1 + fee)
+            target = shares + bought - sold
+        balance += proceeds - cost
+        shares = target
+        held[k], cash[k] = shares, balance
+
+    # Holdings and cash of each bar: those of the last rebalance on or before
+    # it, or the starting state (no shares, all cash) before the first one
+    state = np.searchsorted(rows, np.arange(len(times)), side="right")
+    invested = np.einsum("tn,tn->t", np.vstack([np.zeros(len(symbols)), held])[state], marks)
+    equity = np.r_[capital, cash][state] + invested
+    curve = pd.DataFrame(
+        {
+            "time": times,
+            "equity": equity,
+            "return": np.r_[0.0, equity[1:] / equity[:-1] - 1],
+            "drawdown": equity / np.maximum.accumulate(equity) - 1,
+            "exposure": invested / equity,
+        }
+    )
+
+    delta = np.diff(held, axis=0, prepend=0)
+    k, j = np.nonzero(delta)
+    quantity = delta[k, j]
+    price = np.where(quantity > 0, buy_prices[k, j], sell_prices[k, j])
+    trades = pd.DataFrame(
+        {
+            "time": times[rows[k]],
+            "symbol": np.asarray(symbols, dtype=object)[j],
+            "shares": quantity,
+            "price": price,
+            "value": quantity * price,
+            "cost": np.abs(quantity) * price * (fee + np.where(quantity < 0, tax, 0)),
+        }
+    )
+    return BacktestResult(_summary(curve, trades, capital, len(rows)), curve, trades)
+
+
+def _summary(curve: pd.DataFrame, trades: pd.DataFrame, capital: float, rebalances: int) -> pd.DataFrame:
+    equity, daily = curve["equity"].to_numpy(), curve["return"].to_numpy()[1:]
+    years = max((curve["time"].iloc[-1] - curve["time"].iloc[0]).days / 365.25, 1 / 365.25)
+    volatility = daily.std(ddof=1) * np.sqrt(TRADING_DAYS) if len(daily) > 1 else np.nan
+    with np.errstate(invalid="ignore", divide="ignore"):
+        sharpe = daily.mean() * TRADING_DAYS / volatility if len(daily) > 1 else np.nan
+    return pd.DataFrame(
+        {
+            "start": [curve["time"].iloc[0]],
+            "end": [curve["time"].iloc[-1]],
+            "initial_capital": [capital],
+            "final_equity": [equity[-1]],
+            "total_return": [equity[-1] / capital - 1],
+            "cagr": [(equity[-1] / capital) ** (1 / years) - 1],
+            "volatility": [volatility],
+            "sharpe": [sharpe],
+            "max_drawdown": [curve["drawdown"].min()],
+            "turnover": [trades["value"].abs().sum() / np.mean(equity) / years],
+            "costs": [trades["cost"].sum()],
+            "rebalances": [rebalances],
+            "trades": [len(trades)],
+        }
+    )
@@ -0,0 +1,169 @@
+"""Fit tool payloads into a size budget.
+
+LLM clients pay for every token of a tool result. :func:`fit_payload`
+shrinks a tabular payload step by step until its JSON fits ``max_bytes``,
+stopping at the first step that is enough:
+
+1. Drop columns that are empty or hold a single value.
+2. Round floats to 4, then 2 decimals.
+3. For long tables, keep evenly spaced rows (always the first and last);
+   for wide ones, drop the rightmost columns (key columns such as ``time``
+   or ``symbol`` are kept). Then the other one.
+4. Replace the rows by per-column statistics.
+
+Each step applied is described in the payload's ``notes`` so the caller
+knows what it is looking at.
+"""
+
+import math
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pydantic_core
+
+from personal_mcp.shared.payloads import OutputFormat, frame_data
+
+# Columns never dropped when narrowing a table
+KEY_COLUMNS = ("time", "date", "symbol", "ticker", "code", "organ_name")
+
+# Below this many rows, a downsampled table says less than a summary
+MIN_SAMPLE_ROWS = 10
+
+
+def _size(payload: dict[str, Any]) -> int:
+    return len(pydantic_core.to_json(payload, inf_nan_mode="null"))
+
+
+def _frame(payload: dict[str, Any]) -> pd.DataFrame:
+    data = payload["data"]
+    if isinstance(data, dict):
+        return pd.DataFrame(data)
+    if "columns" in payload:
+        return pd.DataFrame(data, columns=payload["columns"])
+    return pd.DataFrame.from_records(data)
+
+
+def _keys(frame: pd.DataFrame) -> list[Any]:
+    keys = [c for c in frame.columns if str(c).lower() in KEY_COLUMNS]
+    return keys or list(frame.columns[:1])
+
+
+def _column_costs(frame: pd.DataFrame, total: int) -> pd.Series:
+    """Share of the payload size ``total`` taken by each column."""
+    costs = pd.Series(
+        {c: len(pydantic_core.to_json(frame[c].tolist(), inf_nan_mode="null")) for c in frame.columns},
+        dtype=float,
+    )
+    # Spread the layout's overhead (keys, separators) in proportion
+    return costs * total / max(costs.sum(), 1.0)
+
+
+def _names(columns: list[Any], limit: int = 10) -> str:
+    names = ", ".join(map(str, columns[:limit]))
+    return names + (f" and {len(columns) - limit} more" if len(columns) > limit else "")
+
+
+def _summary(frame: pd.DataFrame) -> pd.DataFrame:
+    rows = []
+    for name in frame.columns:
+        column = frame[name]
+        numeric = pd.to_numeric(column, errors="coerce")
+        row: dict[str, Any] = {"column": str(name), "count": int(column.notna().sum())}
+        if numeric.notna().sum() == row["count"] and row["count"]:
+            row.update(
+                min=float(numeric.min()),
+                max=float(numeric.max()),
+                mean=round(float(numeric.mean()), 4),
+            )
+        else:
+            row["unique"] = int(column.nunique())
+        valid = column.dropna()
+        row["first"] = valid.iloc[0] if len(valid) else None
+        row["last"] = valid.iloc[-1] if len(valid) else None
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def fit_payload(payload: dict[str, Any], max_bytes: int) -> dict[str, Any]:
+    """Shrink a tabular payload until its JSON fits ``max_bytes``.
+
+    Args:
+        payload: Payload from ``frame_payload`` (any output format).
+        max_bytes: Budget for the payload's compact JSON.
+
+    Returns:
+        ``payload`` itself if it fits or holds no table, otherwise a reduced
+        copy in the same format with a ``notes`` list.
+    """
+    if _size(payload) <= max_bytes or not isinstance(payload.get("data"), (list, dict)):
+        return payload
+    format: OutputFormat = (
+        "split" if "columns" in payload else "columns" if isinstance(payload["data"], dict) else "records"
+    )
+    extra = {k: v for k, v in payload.items() if k not in ("data", "columns", "dtypes")}
+    frame = _frame(payload)
+    rows = len(frame)
+    notes: list[str] = []
+
+    def build(table: pd.DataFrame) -> dict[str, Any]:
+        return {**frame_data(table, format), **extra, "notes": notes}
+
+    constant = [c for c in frame.columns if frame[c].nunique(dropna=True) <= 1 and c not in _keys(frame)]
+    if constant:
+        frame = frame.drop(columns=constant)
+        notes.append(f"dropped empty or constant columns: {_names(constant)}")
+        if _size(candidate := build(frame)) <= max_bytes:
+            return candidate
+
+    floats = [c for c in frame.columns if pd.api.types.is_float_dtype(frame[c].dtype)]
+    if floats:
+        notes.append("")
+        for decimals in (4, 2):
+            frame[floats] = frame[floats].round(decimals)
+            notes[-1] = f"rounded floats to {decimals} decimals"
+            if _size(candidate := build(frame)) <= max_bytes:
+                return candidate
+
+    def sample(table: pd.DataFrame) -> pd.DataFrame:
+        size = _size(build(table))
+        keep = max(2, math.floor(len(table) * max_bytes / size * 0.95))
+        while keep >= MIN_SAMPLE_ROWS and keep < len(table):
+            picked = table.iloc[np.unique(np.linspace(0, len(table) - 1, keep).round().astype(int))]
+            if _size(build(picked)) <= max_bytes:
+                notes.append(f"kept {len(picked)} of {rows} rows, evenly spaced")
+                return picked
+            keep = math.floor(keep * 0.9)
+        return table
+
+    def narrow(table: pd.DataFrame) -> pd.DataFrame:
+        keys = _keys(table)
+        size = _size(build(table))
+        costs = _column_costs(table, size)
+        excess = size - max_bytes
+        dropped = []
+        # Keep at least one data column: a table of keys alone says nothing
+        for name in [c for c in reversed(table.columns) if c not in keys][:-1]:
+            if excess <= 0:
+                break
+            dropped.append(name)
+            excess -= costs[name]
+        if dropped:
+            table = table.drop(columns=dropped)
+            notes.append(f"dropped {len(dropped)} columns: {_names(dropped[::-1])}")
+        return table
+
+    steps = (sample, narrow) if len(frame) >= frame.shape[1] else (narrow, sample)
+    for step in steps:
+        frame = step(frame)
+        if _size(candidate := build(frame)) <= max_bytes:
+            return candidate
+
+    summary = _summary(_frame(payload))
+    notes[:] = [f"replaced {rows} rows by per-column statistics"]
+    if _size(build(summary)) > max_bytes:
+        notes.append("")
+        while len(summary) > 1 and _size(build(summary)) > max_bytes:
+            summary = summary.iloc[: len(summary) // 2]
+            notes[-1] = f"kept statistics of the first {len(summary)} columns"
+    return build(summary)
@@ -0,0 +1,116 @@
+"""In-process response cache.
+
+A thread-safe LRU map whose entries carry their own expiry time and whose
+total size is bounded in bytes. DataFrames are measured with
+``memory_usage(deep=True)`` so object (string) columns are counted properly.
+"""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, NamedTuple
+
+import pandas as pd
+
+MISSING: Any = object()
+"""Sentinel returned by :meth:`TTLCache.get` on a miss."""
+
+
+class _Entry(NamedTuple):
+    value: Any
+    expires_at: float
+    nbytes: int
+
+
+def sizeof(value: Any) -> int:
+    """Estimate the in-memory size of a cached value in bytes.
+
+    Args:
+        value: Object to measure.
+
+    Returns:
+        Deep size for pandas objects (also inside tuples), ``sys.getsizeof`` otherwise.
+    """
+    if isinstance(value, tuple):
+        return sys.getsizeof(value) + sum(sizeof(v) for v in value)
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    return sys.getsizeof(value)
+
+
+class TTLCache:
+    """LRU cache with per-entry expiry and a total byte budget.
+
+    Expired entries are not served but stay in place until they are
+    overwritten or evicted, so callers can still ask for them explicitly
+    with ``allow_stale=True``.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_bytes: Total size budget; 0 disables caching.
+        """
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, allow_stale: bool = False) -> Any:
+        """Look up a key and mark it most recently used.
+
+        Args:
+            key: Cache key.
+            allow_stale: Return the value even if it has expired.
+
+        Returns:
+            The cached value, or ``MISSING``.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or (not allow_stale and entry.expires_at <= time.time()):
+                self.misses += 1
+                return MISSING
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def set(self, key: str, value: Any, expires_at: float) -> bool:
+        """Store a value, evicting least recently used entries to fit.
+
+        Args:
+            key: Cache key.
+            value: Value to store.
+            expires_at: Absolute expiry as a ``time.time()`` timestamp.
+
+        Returns:
+            False if the value is larger than the whole budget and was not stored.
+        """
+        nbytes = sizeof(value)
+        if nbytes > self.max_bytes:
+            return False
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= old.nbytes
+            while self._entries and self.nbytes + nbytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.nbytes -= evicted.nbytes
+            self._entries[key] = _Entry(value, expires_at, nbytes)
+            self.nbytes += nbytes
+        return True
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
@@ -0,0 +1,191 @@
+"""Negotiated response compression for the HTTP transport.
+
+JSON payloads of listings and statements compress 5-10x, which matters for
+clients behind slow links. :class:`CompressionMiddleware` picks ``zstd``
+(when the optional ``zstandard`` package is installed) or ``gzip`` from the
+request's ``Accept-Encoding`` and compresses:
+
+- complete responses of at least ``settings.http_compression_min_bytes``;
+- streamed responses, including the ``text/event-stream`` replies of the
+  streamable HTTP transport, chunk by chunk with a flush after each chunk so
+  every SSE event reaches the client as soon as it is sent.
+
+Starlette's ``GZipMiddleware`` skips event streams altogether, and those carry
+nearly every MCP result, hence this middleware.
+"""
+
+import zlib
+from typing import Any, Callable, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.middleware import Middleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from personal_mcp.config import settings
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+# Already compressed or not worth compressing
+_SKIPPED_TYPES = ("image/", "audio/", "video/", "application/zip", "application/gzip", "application/zstd")
+
+
+class _Gzip:
+    def __init__(self, level: int) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def chunk(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_FINISH)
+
+
+class _Zstd:
+    def __init__(self, level: int) -> None:
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def chunk(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush()
+
+
+def _encoders() -> dict[str, Callable[[], Any]]:
+    encoders: dict[str, Callable[[], Any]] = {}
+    if zstandard is not None:
+        encoders["zstd"] = lambda: _Zstd(settings.http_zstd_level)
+    encoders["gzip"] = lambda: _Gzip(settings.http_gzip_level)
+    return encoders
+
+
+def negotiate(accept_encoding: str) -> Optional[str]:
+    """Pick the content coding to use for an ``Accept-Encoding`` header.
+
+    Args:
+        accept_encoding: Header value, e.g. ``"gzip, deflate, zstd;q=0.9"``.
+
+    Returns:
+        ``zstd`` or ``gzip`` (the client's preference by q-value, zstd first
+        on ties), or None if the client accepts neither.
+    """
+    weights: dict[str, float] = {}
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.strip().partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[coding.strip()] = q
+    best, best_q = None, 0.0
+    for coding in _encoders():
+        q = weights.get(coding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing responses with the negotiated coding."""
+
+    def __init__(self, app: ASGIApp, minimum_size: Optional[int] = None) -> None:
+        """Wrap an ASGI app.
+
+        Args:
+            app: Application to wrap.
+            minimum_size: Smallest complete response body that gets compressed
+                (default: ``settings.http_compression_min_bytes``).
+        """
+        self.app = app
+        self.minimum_size = settings.http_compression_min_bytes if minimum_size is None else minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        coding = negotiate(Headers(scope=scope).get("accept-encoding", ""))
+        if coding is None:
+            await self.app(scope, receive, send)
+            return
+        await self.app(scope, receive, _Responder(send, coding, self.minimum_size).send)
+
+
+class _Responder:
+    """Rewrites the messages of one response."""
+
+    def __init__(self, send: Send, coding: str, minimum_size: int) -> None:
+        self._send = send
+        self._coding = coding
+        self._minimum_size = minimum_size
+        self._start: Optional[Message] = None
+        self._encoder: Any = None
+        self._passthrough = False
+
+    def _compressed_start(self, length: Optional[int]) -> Message:
+        assert self._start is not None
+        headers = MutableHeaders(raw=list(self._start["headers"]))
+        headers["Content-Encoding"] = self._coding
+        headers.add_vary_header("Accept-Encoding")
+        if length is None:
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(length)
+        return {**self._start, "headers": headers.raw}
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            content_type = headers.get("content-type", "")
+            self._start = message
+            self._passthrough = "content-encoding" in headers or content_type.startswith(_SKIPPED_TYPES)
+            if self._passthrough:
+                await self._send(message)
+            elif content_type.startswith("text/event-stream"):
+                # Event streams are never complete up front: compress them
+                # chunk by chunk from the start
+                self._encoder = _encoders()[self._coding]()
+                await self._send(self._compressed_start(None))
+            return
+
+        if message["type"] != "http.response.body" or self._passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more = message.get("more_body", False)
+        if self._encoder is None:
+            if not more:
+                # Complete response in one message
+                if len(body) < self._minimum_size:
+                    await self._send(self._start)
+                    await self._send(message)
+                else:
+                    compressed = _encoders()[self._coding]().finish(body)
+                    await self._send(self._compressed_start(len(compressed)))
+                    await self._send({"type": "http.response.body", "body": compressed})
+                self._passthrough = True
+                return
+            self._encoder = _encoders()[self._coding]()
+            await self._send(self._compressed_start(None))
+
+        data = self._encoder.chunk(body) if more else self._encoder.finish(body)
+        await self._send({"type": "http.response.body", "body": data, "more_body": more})
+
+
+def http_middleware() -> list[Middleware]:
+    """ASGI middleware to pass to ``run_async(transport="http", middleware=...)``.
+
+    Returns:
+        The compression middleware, or an empty list when
+        ``settings.http_compression`` is off.
+    """
+    if not settings.http_compression:
+        return []
+    return [Middleware(CompressionMiddleware)]
@@ -0,0 +1,232 @@
+"""Pairwise correlation and covariance of a return panel.
+
+Returns come from a close panel (see ``shared/panels.py``) as a time ×
+symbol matrix in which missing bars are NaN. Statistics use pairwise
+complete observations: for each pair of symbols, only the bars both have.
+Every pairwise sum is a matrix product over the zero-filled returns and
+their observation mask, so the whole matrix costs a handful of BLAS calls.
+
+The products are taken for a block of symbols against all symbols at a
+time, with the block sized so that temporaries stay within
+``settings.analytics_memory_mb``; the full market (about 1600 symbols)
+therefore runs in fixed memory regardless of its size.
+
+Shrinkage pulls the off-diagonal entries towards zero, i.e. the target is
+the diagonal of the sample matrix. With ``shrinkage="auto"`` the intensity
+is estimated with the Schäfer-Strimmer formula from the standardized
+returns (each symbol standardized over all its bars, pairs over their
+common bars).
+"""
+
+from typing import Iterator, Literal, Optional
+
+import numpy as np
+import pandas as pd
+
+from personal_mcp.config import settings
+
+Statistic = Literal["correlation", "covariance"]
+Shrinkage = Optional[float | Literal["auto"]]
+
+# b × N float64 temporaries alive at once while computing one block
+_BLOCK_TEMPORARIES = 12
+
+
+def returns(close: pd.DataFrame) -> pd.DataFrame:
+    """Simple returns of a close panel.
+
+    A return is NaN when either of its two bars is missing, so halts and
+    listing gaps never produce a return spanning several bars. Symbols
+    without any return are dropped.
+    """
+    return close.pct_change(fill_method=None).iloc[1:].dropna(axis=1, how="all")
+
+
+def window_ends(length: int, window: Optional[int], step: Optional[int]) -> list[int]:
+    """End positions (exclusive) of the rolling windows over ``length`` rows.
+
+    Windows end on the last row and every ``step`` rows (default: ``window``)
+    before it; no window means a single one over all rows.
+    """
+    if window is None:
+        return [length]
+    if window < 2:
+        raise ValueError("window must be at least 2")
+    step = step or window
+    if step < 1:
+        raise ValueError("step must be at least 1")
+    return list(range(length, window - 1, -step))[::-1]
+
+
+def _blocks(columns: int, fixed: int) -> Iterator[slice]:
+    budget = settings.analytics_memory_mb * 1024 * 1024 - fixed
+    if budget <= 0:
+        raise ValueError(
+            f"Return matrix needs {fixed / 1024 / 1024:.0f} MiB, over the "
+            f"{settings.analytics_memory_mb} MiB budget: narrow the date range or the universe"
+        )
+    size = max(1, min(columns, budget // (_BLOCK_TEMPORARIES * 8 * columns)))
+    for start in range(0, columns, size):
+        yield slice(start, start + size)
+
+
+def pairwise(
+    values: np.ndarray,
+    statistic: Statistic = "correlation",
+    shrinkage: Shrinkage = None,
+    min_periods: int = 20,
+) -> tuple[np.ndarray, Optional[float]]:
+    """Correlation or covariance matrix of returns with missing values.
+
+    Args:
+        values: Returns as a T × N float array, NaN where missing.
+        statistic: "correlation" or "covariance" (sample, ddof 1).
+        shrinkage: Intensity in [0, 1] applied to off-diagonal entries,
+            "auto" to estimate it, or None.
+        min_periods: Pairs with fewer common observations are NaN.
+
+    Returns:
+        (N × N matrix, shrinkage intensity applied or None).
+
+    Raises:
+        ValueError: If the shrinkage is out of range or the inputs do not
+            fit in ``settings.analytics_memory_mb``.
+    """
+    if shrinkage is not None and shrinkage != "auto" and not 0 <= shrinkage <= 1:
+        raise ValueError("shrinkage must be between 0 and 1, or 'auto'")
+    values = np.asarray(values, dtype=np.float64)
+    observed = ~np.isnan(values)
+    mask = observed.astype(np.float64)
+    x = np.where(observed, values, 0.0)
+    x2 = x * x
+    columns = values.shape[1]
+    out = np.empty((columns, columns))
+    fixed = 4 * x.nbytes + out.nbytes
+
+    auto = shrinkage == "auto"
+    if auto:
+        # Returns standardized over each symbol's own bars
+        with np.errstate(invalid="ignore", divide="ignore"):
+            counts = mask.sum(axis=0)
+            mean = x.sum(axis=0) / counts
+            std = np.sqrt(((x2.sum(axis=0) - counts * mean**2) / (counts - 1)).clip(min=0))
+            z = np.where(observed, (values - mean) / std, 0.0)
+        z = np.nan_to_num(z, nan=0.0, posinf=0.0, neginf=0.0)
+        z2 = z * z
+        fixed += 2 * z.nbytes
+        variance_sum = 0.0
+        squared_sum = 0.0
+
+    for block in _blocks(columns, fixed):
+        n = mask[:, block].T @ mask
+        sx = x[:, block].T @ mask
+        sy = mask[:, block].T @ x
+        with np.errstate(invalid="ignore", divide="ignore"):
+            cross = x[:, block].T @ x - sx * sy / n
+            vx = x2[:, block].T @ mask - sx * sx / n
+            vy = mask[:, block].T @ x2 - sy * sy / n
+            correlation = np.clip(cross / np.sqrt(vx * vy), -1.0, 1.0)
+            value = correlation if statistic == "correlation" else cross / (n - 1)
+        short = n < max(min_periods, 2)
+        value[short] = np.nan
+        out[block] = value
+
+        if auto:
+            off = ~short & np.isfinite(correlation)
+            # Leave out the diagonal: row r of the block is symbol start + r
+            rows = np.arange(len(off))
+            off[rows, rows + block.start] = False
+            w = z[:, block].T @ z
+            w2 = z2[:, block].T @ z2
+            with np.errstate(invalid="ignore", divide="ignore"):
+                spread = n / (n - 1) ** 3 * (w2 - w * w / n)
+            variance_sum += float(spread[off].sum())
+            squared_sum += float((correlation[off] ** 2).sum())
+
+    if auto:
+        shrinkage = float(np.clip(variance_sum / squared_sum, 0.0, 1.0)) if squared_sum > 0 else 0.0
+    if shrinkage:
+        diagonal = out.diagonal().copy()
+        out *= 1 - shrinkage
+        np.fill_diagonal(out, diagonal)
+    return out, shrinkage
+
+
+def correlation_rows(
+    panel: pd.DataFrame,
+    statistic: Statistic = "correlation",
+    shrinkage: Shrinkage = None,
+    min_periods: int = 20,
+    window: Optional[int] = None,
+    step: Optional[int] = None,
+    layout: Literal["matrix", "pairs"] = "matrix",
+) -> tuple[pd.DataFrame, list[float]]:
+    """Compute the matrix over the whole range or each rolling window.
+
+    Args:
+        panel: Return panel from :func:`returns`.
+        statistic: See :func:`pairwise`.
+        shrinkage: See :func:`pairwise`.
+        min_periods: See :func:`pairwise`.
+        window: Rows per rolling window (None for the whole range).
+        step: Rows between window ends (default: ``window``).
+        layout: See :func:`matrix_rows`.
+
+    Returns:
+        (rows of every window, shrinkage intensity of each window when
+        shrinkage was requested).
+
+    Raises:
+        ValueError: If the matrices of all windows would not fit in
+            ``settings.analytics_memory_mb``.
+    """
+    values, symbols = panel.to_numpy(dtype=np.float64), list(panel.columns)
+    ends = window_ends(len(values), window, step)
+    size = len(ends) * len(symbols) ** 2 * 8
+    if size > settings.analytics_memory_mb * 1024 * 1024:
+        raise ValueError(
+            f"{len(ends)} windows of {len(symbols)} symbols need {size / 1024 / 1024:.0f} MiB, over the "
+            f"{settings.analytics_memory_mb} MiB budget: use a larger step or fewer symbols"
+        )
+    rows, applied = [], []
+    for end in ends:
+        matrix, intensity = pairwise(values[end - window if window else 0 : end], statistic, shrinkage, min_periods)
+        rows.append(matrix_rows(matrix, symbols, layout, panel.index[end - 1] if window else None))
+        if intensity is not None:
+            applied.append(intensity)
+    return (pd.concat(rows, ignore_index=True) if rows else pd.DataFrame()), applied
+
+
+def matrix_rows(
+    matrix: np.ndarray,
+    symbols: list[str],
+    layout: Literal["matrix", "pairs"] = "matrix",
+    time: Optional[pd.Timestamp] = None,
+) -> pd.DataFrame:
+    """Lay out a symmetric matrix as a DataFrame.
+
+    Args:
+        matrix: N × N matrix.
+        symbols: Symbol of each row and column.
+        layout: "matrix" for one row per symbol with one column per symbol,
+            or "pairs" for one ``symbol_a``, ``symbol_b``, ``value`` row per
+            unordered pair (NaN pairs dropped), strongest first.
+        time: Window end, added as a leading ``time`` column when given.
+
+    Returns:
+        The rows.
+    """
+    if layout == "matrix":
+        frame = pd.DataFrame(matrix, columns=symbols)
+        frame.insert(0, "symbol", symbols)
+    else:
+        i, j = np.triu_indices(len(symbols), k=1)
+        value = matrix[i, j]
+        keep = ~np.isnan(value)
+        i, j, value = i[keep], j[keep], value[keep]
+        order = np.argsort(-np.abs(value), kind="stable")
+        names = np.asarray(symbols, dtype=object)
+        frame = pd.DataFrame({"symbol_a": names[i[order]], "symbol_b": names[j[order]], "value": value[order]})
+    if time is not None:
+        frame.insert(0, "time", time)
+    return frame
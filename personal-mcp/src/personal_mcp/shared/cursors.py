@@ -0,0 +1,72 @@
+"""Server-held result snapshots for cursor pagination.
+
+A result longer than ``settings.page_rows`` is returned one page at a time.
+The full (already shaped) frame is kept here under a random id, and each
+page carries a ``next_cursor`` token (``<id>:<row offset>``) that
+``next_page`` / ``stream_pages`` resolve without calling upstream again.
+Snapshots expire after ``settings.cursor_ttl_seconds`` and are evicted
+least recently used first once ``settings.cursor_max_bytes`` is reached.
+"""
+
+import secrets
+import time
+from typing import Optional
+
+import pandas as pd
+
+from personal_mcp.config import settings
+from personal_mcp.shared.cache import MISSING, TTLCache
+
+_snapshots = TTLCache(settings.cursor_max_bytes)
+
+
+def save(frame: pd.DataFrame, format: str) -> Optional[str]:
+    """Hold a result for later pages.
+
+    Args:
+        frame: Full result.
+        format: Output layout its pages are rendered in.
+
+    Returns:
+        Snapshot id, or None if the frame exceeds the whole snapshot budget.
+    """
+    snapshot = secrets.token_urlsafe(12)
+    if not _snapshots.set(snapshot, (frame, format), time.time() + settings.cursor_ttl_seconds):
+        return None
+    return snapshot
+
+
+def token(snapshot: str, offset: int) -> str:
+    """Build the cursor for the page of ``snapshot`` starting at ``offset``."""
+    return f"{snapshot}:{offset}"
+
+
+def load(cursor: str) -> tuple[str, pd.DataFrame, str, int]:
+    """Resolve a cursor.
+
+    Args:
+        cursor: Token from a previous ``next_cursor``.
+
+    Returns:
+        (snapshot id, full frame, output format, row offset).
+
+    Raises:
+        ValueError: If the cursor is malformed or its snapshot has expired.
+    """
+    snapshot, _, offset = cursor.rpartition(":")
+    if not snapshot or not offset.isdigit():
+        raise ValueError(f"Invalid cursor: {cursor}")
+    frame, format = held(snapshot)
+    return snapshot, frame, format, int(offset)
+
+
+def held(snapshot: str) -> tuple[pd.DataFrame, str]:
+    """Return the full result held under ``snapshot`` and its output format.
+
+    Raises:
+        ValueError: If the snapshot has expired.
+    """
+    value = _snapshots.get(snapshot)
+    if value is MISSING:
+        raise ValueError("Cursor has expired; run the original query again")
+    return value
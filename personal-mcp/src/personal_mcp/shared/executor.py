@@ -0,0 +1,127 @@
+"""Bounded thread-pool execution layer for blocking calls.
+
+vnstock is synchronous: every upstream call blocks on HTTP I/O. Tools are
+``async def`` and share the FastMCP event loop, so they dispatch adapter calls
+through :func:`run_blocking` instead of calling them inline.
+"""
+
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from fastmcp.utilities.logging import get_logger
+
+from personal_mcp.config import settings
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class CallTimeoutError(TimeoutError):
+    """Raised when a blocking call does not finish before its deadline."""
+
+
+class BlockingExecutor:
+    """Runs blocking callables on a fixed-size thread pool.
+
+    Each call gets a deadline; when it expires, or when the awaiting task is
+    cancelled (e.g. the MCP client disconnected), the pending work is
+    cancelled. A call that already started cannot be interrupted, but its
+    result is discarded and the caller is released immediately.
+    """
+
+    def __init__(self, max_workers: int, default_timeout: Optional[float] = None) -> None:
+        """Initialize the thread pool.
+
+        Args:
+            max_workers: Maximum number of concurrent blocking calls.
+            default_timeout: Deadline in seconds when a call gives none (None: no deadline).
+        """
+        self.max_workers = max_workers
+        self.default_timeout = default_timeout
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="blocking")
+
+    async def run(self, call: Callable[[], T], timeout: Optional[float] = None) -> T:
+        """Run ``call`` on the pool and await its result.
+
+        Args:
+            call: Zero-argument callable to execute.
+            timeout: Deadline in seconds (default: ``default_timeout``).
+
+        Returns:
+            Whatever ``call`` returns.
+
+        Raises:
+            CallTimeoutError: If the deadline expires first.
+        """
+        deadline = self.default_timeout if timeout is None else timeout
+        # Keep contextvars (request context, logging) visible inside the worker
+        ctx = contextvars.copy_context()
+        future = asyncio.wrap_future(self._pool.submit(ctx.run, call))
+        name = getattr(call, "__name__", None) or getattr(
+            getattr(call, "func", None), "__name__", repr(call)
+        )
+        try:
+            return await asyncio.wait_for(future, deadline)
+        except asyncio.TimeoutError as e:
+            logger.warning(f"{name} exceeded deadline of {deadline}s")
+            raise CallTimeoutError(f"{name} did not complete within {deadline}s") from e
+        except asyncio.CancelledError:
+            logger.info(f"{name} cancelled by caller")
+            raise
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop accepting work and cancel queued calls."""
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+
+# Singleton instance
+_executor_instance: Optional[BlockingExecutor] = None
+_source_semaphores: dict[str, asyncio.Semaphore] = {}
+
+
+def get_executor() -> BlockingExecutor:
+    """Get or create the shared executor singleton.
+
+    Returns:
+        BlockingExecutor sized from application settings.
+    """
+    global _executor_instance
+    if _executor_instance is None:
+        _executor_instance = BlockingExecutor(
+            max_workers=settings.executor_max_workers,
+            default_timeout=settings.tool_timeout_seconds,
+        )
+    return _executor_instance
+
+
+async def run_blocking(func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """Run ``func(*args, **kwargs)`` on the shared executor.
+
+    Args:
+        func: Blocking callable (typically a VNStockAdapter method).
+        *args: Positional arguments for ``func``.
+        **kwargs: Keyword arguments for ``func``.
+
+    Returns:
+        Whatever ``func`` returns.
+    """
+    return await get_executor().run(functools.partial(func, *args, **kwargs))
+
+
+def source_semaphore(source: str) -> asyncio.Semaphore:
+    """Semaphore capping concurrent fan-out calls to one data source.
+
+    Args:
+        source: Upstream name such as ``"VCI"`` or ``"TCBS"``.
+
+    Returns:
+        Shared semaphore sized by ``settings.source_concurrency``.
+    """
+    key = source.upper()
+    if key not in _source_semaphores:
+        _source_semaphores[key] = asyncio.Semaphore(settings.source_concurrency)
+    return _source_semaphores[key]
@@ -0,0 +1,76 @@
+"""Binary exports of tabular results.
+
+JSON turns every date into a string and every int64 into a number that
+JavaScript clients may round, and it is slow to produce and parse for large
+frames. :func:`encode_frame` writes a DataFrame as a zstd-compressed Arrow
+IPC file or Parquet file instead, keeping the column types as they are.
+The resources built on it are registered in ``resources/export_resources.py``.
+"""
+
+import io
+from typing import Literal
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from personal_mcp.config import settings
+
+ExportFormat = Literal["parquet", "arrow"]
+
+MIME_TYPES: dict[str, str] = {
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.file",
+}
+
+
+def _table(frame: pd.DataFrame) -> pa.Table:
+    """Convert a DataFrame to an Arrow table (index dropped)."""
+    frame = frame.rename(columns=str)
+    try:
+        return pa.Table.from_pandas(frame, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Object columns mixing types (e.g. numbers and labels) have no Arrow
+        # type: store them as strings, keeping missing values null
+        mixed = {
+            name: frame[name].astype(str).where(frame[name].notna(), None)
+            for name in frame.columns
+            if frame[name].dtype == object
+        }
+        return pa.Table.from_pandas(frame.assign(**mixed), preserve_index=False)
+
+
+def encode_frame(frame: pd.DataFrame, format: ExportFormat = "parquet") -> bytes:
+    """Serialize a DataFrame to a zstd-compressed binary file.
+
+    Args:
+        frame: DataFrame to export (its index is dropped).
+        format: ``parquet`` or ``arrow`` (Arrow IPC file format).
+
+    Returns:
+        File contents, compressed at ``settings.export_zstd_level``.
+
+    Raises:
+        ValueError: If ``format`` is unknown.
+    """
+    table = _table(frame)
+    sink = io.BytesIO()
+    if format == "parquet":
+        pq.write_table(table, sink, compression="zstd", compression_level=settings.export_zstd_level)
+    elif format == "arrow":
+        codec = pa.Codec("zstd", compression_level=settings.export_zstd_level)
+        options = pa.ipc.IpcWriteOptions(compression=codec)
+        with pa.ipc.new_file(sink, table.schema, options=options) as writer:
+            writer.write_table(table)
+    else:
+        raise ValueError(f"Unknown export format: {format}")
+    return sink.getvalue()
+
+
+def decode_frame(content: bytes, format: ExportFormat = "parquet") -> pd.DataFrame:
+    """Read back a file written by :func:`encode_frame`."""
+    if format == "parquet":
+        return pq.read_table(io.BytesIO(content)).to_pandas()
+    if format == "arrow":
+        return pa.ipc.open_file(pa.BufferReader(content)).read_all().to_pandas()
+    raise ValueError(f"Unknown export format: {format}")
@@ -0,0 +1,164 @@
+"""Safe column expressions over a DataFrame.
+
+Tools accept small expressions such as ``"pe < 12 and roe > 0.15"`` or
+``"-(roe / pb)"`` and evaluate them with ``DataFrame.eval``. Before that, the
+expression is parsed and checked against a whitelist: column names,
+literals, arithmetic, comparisons (including ``in`` / ``not in`` a list of
+literals) and ``and`` / ``or`` / ``not``. Function calls, attribute access,
+subscripts and names that are not columns are rejected, so a client cannot
+reach anything but the frame's values. Powers take small literal exponents
+only and lists may only follow ``in``, so no expression can build huge
+numbers or lists before the frame is even touched.
+"""
+
+import ast
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+_ALLOWED = (
+    ast.Expression,
+    ast.BoolOp,
+    ast.And,
+    ast.Or,
+    ast.UnaryOp,
+    ast.Not,
+    ast.USub,
+    ast.UAdd,
+    ast.BinOp,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.FloorDiv,
+    ast.Mod,
+    ast.Pow,
+    ast.Compare,
+    ast.Eq,
+    ast.NotEq,
+    ast.Lt,
+    ast.LtE,
+    ast.Gt,
+    ast.GtE,
+    ast.In,
+    ast.NotIn,
+    ast.Name,
+    ast.Load,
+    ast.Constant,
+    ast.List,
+    ast.Tuple,
+)
+
+# Largest literal exponent accepted in ``a ** b``
+MAX_EXPONENT = 16
+
+
+def validate_expression(expression: str, columns: Iterable[object]) -> None:
+    """Check that ``expression`` only uses whitelisted syntax and known columns.
+
+    Args:
+        expression: Expression to check.
+        columns: Columns it may refer to.
+
+    Raises:
+        ValueError: If the expression is malformed, uses unsupported syntax
+            or refers to an unknown column.
+    """
+    try:
+        tree = ast.parse(expression.strip(), mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Invalid expression {expression!r}: {e.msg}") from None
+    names = {str(c) for c in columns}
+    # ast.walk visits a comparison before its operands
+    membership_lists: set[int] = set()
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED):
+            raise ValueError(f"Unsupported syntax in {expression!r}: {type(node).__name__}")
+        if isinstance(node, ast.Name) and node.id not in names:
+            raise ValueError(f"Unknown field in {expression!r}: {node.id}")
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Pow):
+            _check_power(node, expression)
+        if isinstance(node, ast.Compare):
+            membership_lists.update(
+                id(right)
+                for op, right in zip(node.ops, node.comparators)
+                if isinstance(op, (ast.In, ast.NotIn)) and isinstance(right, (ast.List, ast.Tuple))
+            )
+        if isinstance(node, (ast.List, ast.Tuple)) and id(node) not in membership_lists:
+            # A list anywhere else could be repeated (``[0] * 10**12``)
+            raise ValueError(f"Lists are only allowed after in / not in: {expression!r}")
+        if isinstance(node, ast.BinOp) and any(_is_text(side) for side in (node.left, node.right)):
+            raise ValueError(f"Arithmetic on text is not supported: {expression!r}")
+
+
+def _is_text(node: ast.AST) -> bool:
+    return isinstance(node, ast.Constant) and isinstance(node.value, (str, bytes))
+
+
+def _check_power(node: ast.BinOp, expression: str) -> None:
+    """Bound ``a ** b`` so that evaluating it cannot run away.
+
+    Integer powers grow without limit (``9 ** 9 ** 7`` takes seconds before
+    anything fails, larger ones pin a worker thread for good), so the
+    exponent must be a literal of at most ``MAX_EXPONENT`` and the base must
+    not contain another power.
+    """
+    exponent = node.right
+    if isinstance(exponent, ast.UnaryOp) and isinstance(exponent.op, (ast.USub, ast.UAdd)):
+        exponent = exponent.operand
+    if not (
+        isinstance(exponent, ast.Constant)
+        and isinstance(exponent.value, (int, float))
+        and not isinstance(exponent.value, bool)
+        and abs(exponent.value) <= MAX_EXPONENT
+    ):
+        raise ValueError(f"Exponents must be numbers up to {MAX_EXPONENT}: {expression!r}")
+    if any(isinstance(n, ast.BinOp) and isinstance(n.op, ast.Pow) for n in ast.walk(node.left)):
+        raise ValueError(f"Nested powers are not supported: {expression!r}")
+
+
+def evaluate(frame: pd.DataFrame, expression: str) -> pd.Series:
+    """Evaluate a validated expression over ``frame``.
+
+    Raises:
+        ValueError: If the expression is invalid (see :func:`validate_expression`)
+            or cannot be evaluated on the frame's dtypes.
+    """
+    validate_expression(expression, frame.columns)
+    try:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result = frame.eval(expression.strip(), engine="python")
+    except Exception as e:
+        raise ValueError(f"Cannot evaluate {expression!r}: {e}") from None
+    if not isinstance(result, pd.Series):
+        # A constant expression: broadcast it
+        result = pd.Series(result, index=frame.index)
+    return result
+
+
+def where(frame: pd.DataFrame, expression: str) -> pd.DataFrame:
+    """Rows of ``frame`` for which a boolean expression holds (NaN counts as false)."""
+    mask = evaluate(frame, expression)
+    if not pd.api.types.is_bool_dtype(mask.dtype) and mask.dtype != object:
+        raise ValueError(f"Filter {expression!r} does not evaluate to true/false")
+    return frame[mask.fillna(False).astype(bool).to_numpy()]
+
+
+def sort_by(frame: pd.DataFrame, keys: list[str]) -> pd.DataFrame:
+    """Sort by expressions; a leading ``-`` sorts that key in descending order.
+
+    Missing values sort last whatever the direction.
+    """
+    if not keys:
+        return frame
+    values, ascending = {}, []
+    for i, key in enumerate(keys):
+        key = key.strip()
+        descending = key.startswith("-")
+        values[f"__key{i}"] = evaluate(frame, key[1:] if descending else key).to_numpy()
+        ascending.append(not descending)
+    order = pd.DataFrame(values).sort_values(
+        list(values), ascending=ascending, na_position="last", kind="stable"
+    ).index
+    return frame.iloc[order.to_numpy()]
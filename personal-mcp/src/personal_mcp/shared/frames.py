@@ -0,0 +1,216 @@
+"""Pure DataFrame helpers shared by tools."""
+
+import re
+from typing import Annotated, Hashable, Literal, Optional
+
+import numpy as np
+import pandas as pd
+from pydantic import Field
+
+
+def symbols_from(result: object) -> list[str]:
+    """Extract a list of ticker symbols from a vnstock listing result.
+
+    Args:
+        result: Series of symbols, or DataFrame with a ``symbol`` column.
+
+    Returns:
+        Upper-cased symbols in their original order.
+    """
+    if isinstance(result, pd.DataFrame):
+        column = "symbol" if "symbol" in result.columns else result.columns[0]
+        result = result[column]
+    return [str(s).upper() for s in result]
+
+
+def combine_histories(
+    frames: dict[str, pd.DataFrame],
+    layout: Literal["long", "wide"] = "long",
+    value: str = "close",
+) -> pd.DataFrame:
+    """Combine per-symbol OHLCV frames into one frame.
+
+    Args:
+        frames: Mapping of symbol to its history frame (with a ``time`` column).
+        layout: ``long`` stacks rows with a ``symbol`` column; ``wide`` pivots
+            ``value`` into one column per symbol indexed by ``time``.
+        value: Column used for the wide layout (default: ``close``).
+
+    Returns:
+        Combined DataFrame (empty if no frame has rows).
+    """
+    non_empty = {s: f for s, f in frames.items() if f is not None and not f.empty}
+    if not non_empty:
+        return pd.DataFrame()
+    long = pd.concat(
+        [f.assign(symbol=s) for s, f in non_empty.items()], ignore_index=True
+    )
+    long = long[["symbol", *[c for c in long.columns if c != "symbol"]]]
+    if layout == "long":
+        return long
+    wide = long.pivot_table(index="time", columns="symbol", values=value, aggfunc="last")
+    wide.columns.name = None
+    return wide[list(non_empty)].reset_index()
+
+
+_PREDICATE = re.compile(r"^\s*(.+?)\s*(==|!=|>=|<=|>|<|~)\s*(.*?)\s*$")
+
+
+def _predicate_mask(frame: pd.DataFrame, columns: dict[str, Hashable], predicate: str) -> pd.Series:
+    match = _PREDICATE.match(predicate)
+    if match is None:
+        raise ValueError(f"Invalid filter {predicate!r}, expected '<field> <op> <value>'")
+    name, op, raw = match.groups()
+    if name not in columns:
+        raise ValueError(f"Unknown filter field: {name}")
+    column = frame[columns[name]]
+    raw = raw.strip("'\"")
+    if op == "~":
+        return column.astype(str).str.contains(raw, case=False, regex=False)
+
+    value: object
+    if pd.api.types.is_bool_dtype(column.dtype):
+        value = raw.lower() in ("true", "1")
+    elif pd.api.types.is_numeric_dtype(column.dtype):
+        value = float(raw)
+    elif isinstance(column.dtype, pd.DatetimeTZDtype):
+        value = pd.Timestamp(raw)
+        if value.tzinfo is None:
+            value = value.tz_localize(column.dt.tz)
+    elif pd.api.types.is_datetime64_dtype(column.dtype):
+        value = pd.Timestamp(raw)
+    else:
+        column, value = column.astype(str), raw
+    compare = {
+        "==": column.__eq__,
+        "!=": column.__ne__,
+        ">=": column.__ge__,
+        "<=": column.__le__,
+        ">": column.__gt__,
+        "<": column.__lt__,
+    }[op]
+    return compare(value).fillna(False).astype(bool)
+
+
+# Type of the ``filter`` tool argument: the grammar is described once here
+# and shown in the input schema of every tool that takes it
+RowFilter = Annotated[
+    Optional[list[str]],
+    Field(
+        description=(
+            'Row predicates "<field> <op> <value>" on the columns of this tool\'s result, '
+            "combined with AND. op is one of == != > >= < <= or ~ (case-insensitive "
+            "substring); values are converted to the column's type."
+        )
+    ),
+]
+
+
+def shape_frame(
+    frame: pd.DataFrame,
+    fields: Optional[list[str]] = None,
+    filter: Optional[list[str]] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> pd.DataFrame:
+    """Select rows and columns of a tool result before it is serialized.
+
+    Rows are filtered first (on any column), then paged, then projected.
+
+    Args:
+        frame: Tool result.
+        fields: Columns to keep, in this order (default: all). Names are
+            matched as they appear in the payload.
+        filter: Predicates ``"<field> <op> <value>"`` combined with AND.
+            ``op`` is one of ``== != > >= < <=`` or ``~`` (case-insensitive
+            substring match); values are converted to the column's type.
+        limit: Maximum number of rows to keep (default: all).
+        offset: Number of matching rows to skip.
+
+    Returns:
+        The selected part of ``frame`` (``frame`` itself if nothing is selected).
+
+    Raises:
+        ValueError: On unknown fields, malformed predicates or negative paging.
+    """
+    if not fields and not filter and limit is None and not offset:
+        return frame
+    if offset < 0 or (limit is not None and limit < 0):
+        raise ValueError("limit and offset must not be negative")
+    columns = {str(c): c for c in frame.columns}
+
+    if filter:
+        mask = pd.Series(True, index=frame.index)
+        for predicate in filter:
+            mask &= _predicate_mask(frame, columns, predicate)
+        frame = frame[mask.to_numpy()]
+    if offset or limit is not None:
+        frame = frame.iloc[offset : None if limit is None else offset + limit]
+    if fields:
+        unknown = [f for f in fields if f not in columns]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+        frame = frame[[columns[f] for f in fields]]
+    return frame
+
+
+# Bars per year by interval, for annualized volatility. Case matters: "1m" is
+# one minute, and intraday bars are not annualized
+_BARS_PER_YEAR = {
+    **dict.fromkeys(("1D", "1d", "D", "d"), 252),
+    **dict.fromkeys(("1W", "1w", "W", "w"), 52),
+    **dict.fromkeys(("1M", "M"), 12),
+}
+
+
+def summarize_history(frame: pd.DataFrame, interval: str = "1D") -> pd.DataFrame:
+    """Reduce an OHLCV history to one row of statistics.
+
+    Args:
+        frame: History with ``close`` and optionally ``time``, ``high``,
+            ``low`` and ``volume`` columns, in time order.
+        interval: Bar interval, used to annualize volatility (daily, weekly
+            and monthly bars only).
+
+    Returns:
+        One-row DataFrame: period bounds, first/last close, change and return,
+        high/low, volatility of bar returns, maximum drawdown and average
+        volume (empty if ``frame`` has no bars).
+    """
+    if frame is None or "close" not in frame.columns:
+        return pd.DataFrame()
+    frame = frame[frame["close"].notna()]
+    if frame.empty:
+        return pd.DataFrame()
+    close = frame["close"].to_numpy(dtype=float)
+    high = frame["high"].to_numpy(dtype=float) if "high" in frame.columns else close
+    low = frame["low"].to_numpy(dtype=float) if "low" in frame.columns else close
+    # Zero prices (e.g. suspended symbols) give infinite returns, sent as null
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = close[1:] / close[:-1] - 1
+        total_return = close[-1] / close[0] - 1
+        drawdown = close / np.fmax.accumulate(close) - 1
+    trough = int(np.nanargmin(drawdown)) if np.isfinite(drawdown).any() else 0
+
+    row: dict[str, object] = {"bars": len(frame)}
+    if "time" in frame.columns:
+        row.update(start=frame["time"].iloc[0], end=frame["time"].iloc[-1])
+    row.update(
+        first_close=close[0],
+        last_close=close[-1],
+        change=close[-1] - close[0],
+        return_pct=total_return * 100,
+        high=np.nanmax(high),
+        low=np.nanmin(low),
+        mean_return_pct=returns.mean() * 100 if len(returns) else np.nan,
+        volatility_pct=returns.std(ddof=1) * 100 if len(returns) > 1 else np.nan,
+    )
+    bars_per_year = _BARS_PER_YEAR.get(interval)
+    if bars_per_year:
+        row["annualized_volatility_pct"] = row["volatility_pct"] * np.sqrt(bars_per_year)
+    row["max_drawdown_pct"] = drawdown[trough] * 100
+    if "time" in frame.columns:
+        row["max_drawdown_at"] = frame["time"].iloc[trough]
+    if "volume" in frame.columns:
+        row["avg_volume"] = frame["volume"].mean()
+    return pd.DataFrame([row])
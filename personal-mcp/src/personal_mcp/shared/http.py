@@ -0,0 +1,70 @@
+"""Process-wide pooled HTTP session for upstream calls.
+
+vnstock sends every request through the module-level ``requests.get`` /
+``requests.post`` / ``requests.request`` helpers, each of which opens a
+throwaway ``Session``: every call pays DNS, TCP and TLS setup again.
+:func:`install_session_pool` routes those helpers through one shared
+keep-alive ``Session`` whose connection pool is sized from settings, so
+polling tools (price board, intraday) reuse warm connections.
+"""
+
+import threading
+from typing import Any, Optional
+
+import requests
+import requests.api
+from fastmcp.utilities.logging import get_logger
+from requests.adapters import HTTPAdapter
+
+from personal_mcp.config import settings
+
+logger = get_logger(__name__)
+
+_session: Optional[requests.Session] = None
+_install_lock = threading.Lock()
+
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=settings.http_pool_hosts,
+        pool_maxsize=settings.http_pool_per_host,
+        pool_block=False,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def pooled_request(method: str, url: str, **kwargs: Any) -> requests.Response:
+    """Drop-in replacement for ``requests.request`` using the shared session.
+
+    Requests without an explicit ``timeout`` get ``settings.http_timeout_seconds``
+    so a stuck upstream cannot hold a worker thread forever.
+    """
+    if _session is None:
+        raise RuntimeError("install_session_pool() has not been called")
+    kwargs.setdefault("timeout", settings.http_timeout_seconds)
+    return _session.request(method=method, url=url, **kwargs)
+
+
+def install_session_pool() -> requests.Session:
+    """Route module-level ``requests`` calls through a shared pooled session.
+
+    Idempotent; safe to call from several entry points.
+
+    Returns:
+        The shared session.
+    """
+    global _session
+    with _install_lock:
+        if _session is None:
+            _session = _build_session()
+            # requests.get/post/... call requests.api.request; requests.request
+            # is a separate reference to the same function
+            requests.api.request = pooled_request
+            requests.request = pooled_request
+            logger.info(
+                f"HTTP session pool installed ({settings.http_pool_per_host} connections per host)"
+            )
+        return _session
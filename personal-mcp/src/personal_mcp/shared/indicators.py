@@ -0,0 +1,218 @@
+"""Vectorized technical indicators over a price panel.
+
+Each indicator is computed once for the whole panel (see ``shared/panels.py``):
+rolling windows and exponential averages run column-wise over a
+time × symbol frame, so adding symbols widens the arrays instead of adding
+Python-level loops. Indicators are requested as ``"name:param,param"``
+strings, e.g. ``"sma:20"``, ``"macd:12,26,9"`` or ``"rsi"`` (default
+parameters):
+
+=========  =====================  ==========================================
+Name       Parameters (default)   Output columns
+=========  =====================  ==========================================
+sma        n (20)                 ``sma_<n>``
+ema        n (20)                 ``ema_<n>``
+rsi        n (14)                 ``rsi_<n>`` (Wilder smoothing)
+macd       fast, slow, signal     ``macd_<p>``, ``macd_signal_<p>``,
+           (12, 26, 9)            ``macd_hist_<p>``
+bbands     n, k (20, 2)           ``bb_mid_<p>``, ``bb_upper_<p>``,
+                                  ``bb_lower_<p>``
+atr        n (14)                 ``atr_<n>`` (Wilder smoothing)
+=========  =====================  ==========================================
+
+``<p>`` stands for the parameters joined by ``_``. Each symbol's
+indicators run over its own bars only: a panel row where a symbol has no
+close (a halt, or a bar time only its peers have) is skipped by the
+windows and is NaN in the output, so a symbol's values never depend on
+which other symbols are in the request.
+"""
+
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+Panel = dict[str, pd.DataFrame]
+
+
+def _wilder(frame: pd.DataFrame, n: int) -> pd.DataFrame:
+    return frame.ewm(alpha=1 / n, adjust=False, min_periods=n).mean()
+
+
+def sma(panel: Panel, n: int = 20) -> dict[str, pd.DataFrame]:
+    """Simple moving average of closes."""
+    return {"sma": panel["close"].rolling(n, min_periods=n).mean()}
+
+
+def ema(panel: Panel, n: int = 20) -> dict[str, pd.DataFrame]:
+    """Exponential moving average of closes (span ``n``)."""
+    return {"ema": panel["close"].ewm(span=n, adjust=False, min_periods=n).mean()}
+
+
+def rsi(panel: Panel, n: int = 14) -> dict[str, pd.DataFrame]:
+    """Relative strength index with Wilder smoothing."""
+    delta = panel["close"].diff()
+    gain = _wilder(delta.clip(lower=0), n)
+    loss = _wilder(-delta.clip(upper=0), n)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        value = 100 - 100 / (1 + gain / loss)
+    # No losses in the window: RSI is 100 (gain / 0 is inf, or NaN if flat)
+    return {"rsi": value.mask(loss == 0, 100.0).where(gain.notna())}
+
+
+def macd(panel: Panel, fast: int = 12, slow: int = 26, signal: int = 9) -> dict[str, pd.DataFrame]:
+    """MACD line, signal line and histogram."""
+    close = panel["close"]
+    line = close.ewm(span=fast, adjust=False, min_periods=fast).mean() - close.ewm(
+        span=slow, adjust=False, min_periods=slow
+    ).mean()
+    trigger = line.ewm(span=signal, adjust=False, min_periods=signal).mean()
+    return {"macd": line, "macd_signal": trigger, "macd_hist": line - trigger}
+
+
+def bbands(panel: Panel, n: int = 20, k: float = 2) -> dict[str, pd.DataFrame]:
+    """Bollinger bands: moving average ± ``k`` population standard deviations."""
+    window = panel["close"].rolling(n, min_periods=n)
+    mid, std = window.mean(), window.std(ddof=0)
+    return {"bb_mid": mid, "bb_upper": mid + k * std, "bb_lower": mid - k * std}
+
+
+def atr(panel: Panel, n: int = 14) -> dict[str, pd.DataFrame]:
+    """Average true range with Wilder smoothing."""
+    high, low = panel["high"].to_numpy(), panel["low"].to_numpy()
+    previous = panel["close"].shift().to_numpy()
+    with np.errstate(invalid="ignore"):
+        # fmax ignores the missing previous close of the first bar
+        true_range = np.fmax(high - low, np.fmax(np.abs(high - previous), np.abs(low - previous)))
+    frame = pd.DataFrame(true_range, index=panel["close"].index, columns=panel["close"].columns)
+    return {"atr": _wilder(frame, n)}
+
+
+INDICATORS: dict[str, tuple[Callable[..., dict[str, pd.DataFrame]], tuple[type, ...], tuple[str, ...]]] = {
+    "sma": (sma, (int,), ("close",)),
+    "ema": (ema, (int,), ("close",)),
+    "rsi": (rsi, (int,), ("close",)),
+    "macd": (macd, (int, int, int), ("close",)),
+    "bbands": (bbands, (int, float), ("close",)),
+    "atr": (atr, (int,), ("high", "low", "close")),
+}
+"""Indicator name to (function, parameter types, panel fields it needs)."""
+
+
+def parse_spec(spec: str) -> tuple[str, list[int | float]]:
+    """Parse ``"name:param,param"`` into the indicator name and its parameters.
+
+    Omitted trailing parameters take their defaults.
+
+    Raises:
+        ValueError: If the indicator is unknown or its parameters are invalid.
+    """
+    name, _, raw = spec.strip().lower().partition(":")
+    if name not in INDICATORS:
+        raise ValueError(f"Unknown indicator {name!r}, expected one of {', '.join(INDICATORS)}")
+    types = INDICATORS[name][1]
+    parts = [p.strip() for p in raw.split(",")] if raw.strip() else []
+    if len(parts) > len(types):
+        raise ValueError(f"{name} takes at most {len(types)} parameters: {spec!r}")
+    try:
+        params = [kind(float(p)) if kind is int else kind(p) for kind, p in zip(types, parts)]
+    except ValueError:
+        raise ValueError(f"Invalid parameters for {name}: {spec!r}") from None
+    if any(p <= 0 for p in params):
+        raise ValueError(f"Indicator parameters must be positive: {spec!r}")
+    defaults = INDICATORS[name][0].__defaults__ or ()
+    return name, [*params, *defaults[len(params) :]]
+
+
+def required_fields(specs: list[str]) -> set[str]:
+    """Panel fields needed to compute ``specs``."""
+    return {field for spec in specs for field in INDICATORS[parse_spec(spec)[0]][2]}
+
+
+def compute_indicators(panel: Panel, specs: list[str]) -> dict[str, pd.DataFrame]:
+    """Compute indicators over every symbol of a panel.
+
+    Args:
+        panel: Field to wide frame (time × symbol), see ``price_panel``.
+        specs: Indicator specs, e.g. ``["sma:20", "rsi", "macd:12,26,9"]``.
+
+    Returns:
+        Output column name (e.g. ``sma_20``) to wide frame.
+
+    Raises:
+        ValueError: If a spec is invalid or the panel lacks a field it needs.
+    """
+    packed, order, valid = _pack(panel)
+    outputs: dict[str, pd.DataFrame] = {}
+    for spec in specs:
+        name, params = parse_spec(spec)
+        func, _, fields = INDICATORS[name]
+        missing = [f for f in fields if f not in panel]
+        if missing:
+            raise ValueError(f"{name} needs {', '.join(missing)} prices")
+        suffix = "_".join(f"{p:g}" for p in params)
+        for column, frame in func(packed, *params).items():
+            outputs[f"{column}_{suffix}"] = _unpack(frame, order, valid, panel["close"])
+    return outputs
+
+
+def _pack(panel: Panel) -> tuple[Panel, np.ndarray, np.ndarray]:
+    """Move each symbol's bars (rows with a close) to the top of its column.
+
+    Rolling windows and exponential averages then run over consecutive bars
+    of the symbol for all symbols at once; the NaN tail of shorter columns
+    comes after every real bar, so it cannot reach back into them.
+    """
+    close = panel["close"]
+    valid = close.notna().to_numpy()
+    # Stable sort of "missing" flags: a column's bars first, in time order
+    order = np.argsort(~valid, axis=0, kind="stable")[: max(int(valid.sum(axis=0).max(initial=0)), 1)]
+    packed = {
+        field: pd.DataFrame(np.take_along_axis(frame.to_numpy(dtype=np.float64), order, axis=0), columns=close.columns)
+        for field, frame in panel.items()
+    }
+    return packed, order, valid
+
+
+def _unpack(frame: pd.DataFrame, order: np.ndarray, valid: np.ndarray, like: pd.DataFrame) -> pd.DataFrame:
+    """Scatter a packed output back onto the panel's rows (see :func:`_pack`)."""
+    values = np.full(valid.shape, np.nan)
+    np.put_along_axis(values, order, frame.to_numpy(), axis=0)
+    # Rows past a column's last bar received the tail of its packed output
+    values[~valid] = np.nan
+    return pd.DataFrame(values, index=like.index, columns=like.columns)
+
+
+def panel_rows(panel: Panel, outputs: dict[str, pd.DataFrame], latest: bool = False) -> pd.DataFrame:
+    """Lay out panel prices and indicators as one row per symbol and bar.
+
+    Args:
+        panel: Price panel the indicators were computed on.
+        outputs: Result of :func:`compute_indicators`.
+        latest: Keep only the last bar of each symbol.
+
+    Returns:
+        Frame with ``symbol``, ``time``, ``close`` and one column per output,
+        ordered by symbol then time. Bars a symbol does not have are dropped.
+    """
+    close = panel["close"]
+    times, symbols = close.index, close.columns
+    if latest:
+        # Position of each symbol's last bar, read with fancy indexing
+        valid = close.notna().to_numpy()
+        last = len(times) - 1 - np.argmax(valid[::-1], axis=0)
+        keep = valid.any(axis=0)
+        rows, cols = last[keep], np.flatnonzero(keep)
+        data = {"symbol": symbols[cols], "time": times[rows], "close": close.to_numpy()[rows, cols]}
+        data.update({name: frame.to_numpy()[rows, cols] for name, frame in outputs.items()})
+        return pd.DataFrame(data)
+
+    # Symbol-major order: transpose then ravel
+    mask = close.notna().to_numpy().T.ravel()
+    data = {
+        "symbol": np.repeat(symbols.to_numpy(), len(times))[mask],
+        "time": np.tile(times.to_numpy(), len(symbols))[mask],
+        "close": close.to_numpy().T.ravel()[mask],
+    }
+    data.update({name: frame.to_numpy().T.ravel()[mask] for name, frame in outputs.items()})
+    return pd.DataFrame(data)
@@ -0,0 +1,153 @@
+"""Bounded markdown rendering of tabular results.
+
+``DataFrame.to_markdown(tablefmt="grid")`` renders every row through
+``tabulate``, padding each cell to its column width: slow and very large for
+screener-sized frames. :func:`render_markdown` caps rows (keeping the head
+and tail), columns and cell width, and adds a summary line when anything was
+elided. Small tables go through ``tabulate``'s aligned pipe style when it is
+installed; larger ones take a vectorized path that writes unpadded pipe rows.
+"""
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from personal_mcp.config import settings
+
+try:
+    import tabulate  # noqa: F401  (used by DataFrame.to_markdown)
+except ImportError:  # pragma: no cover - optional dependency
+    _HAS_TABULATE = False
+else:
+    _HAS_TABULATE = True
+
+# Above this many rendered rows, skip tabulate's per-cell width computation
+TABULATE_MAX_ROWS = 50
+
+_ELLIPSIS = "…"
+
+
+def _cells(column: pd.Series, max_width: int) -> pd.Series:
+    """Format one column as escaped, width-capped strings."""
+    if pd.api.types.is_float_dtype(column.dtype):
+        text = pd.Series(np.char.mod("%.6g", column.to_numpy(dtype=float)), index=column.index)
+    else:
+        text = column.astype(str)
+    text = text.where(column.notna(), "")
+    text = text.str.replace("|", "\\|", regex=False).str.replace("\n", " ", regex=False)
+    if max_width > 0:
+        long = text.str.len() > max_width
+        if long.any():
+            text = text.where(~long, text.str.slice(0, max_width - 1) + _ELLIPSIS)
+    return text
+
+
+def _fast_table(frame: pd.DataFrame, elide_after: Optional[int], max_width: int) -> list[str]:
+    names = [str(c).replace("|", "\\|") for c in frame.columns]
+    columns = [_cells(frame.iloc[:, i], max_width).tolist() for i in range(frame.shape[1])]
+    lines = ["| " + " | ".join(names) + " |", "|" + "|".join("---" for _ in names) + "|"]
+    lines.extend("| " + " | ".join(row) + " |" for row in zip(*columns))
+    if elide_after is not None:
+        lines.insert(2 + elide_after, "| " + " | ".join(_ELLIPSIS for _ in names) + " |")
+    return lines
+
+
+def _tabulate_table(frame: pd.DataFrame, elide_after: Optional[int], max_width: int) -> list[str]:
+    shown = pd.DataFrame(
+        {str(c): _cells(frame.iloc[:, i], max_width) for i, c in enumerate(frame.columns)}
+    )
+    if elide_after is not None:
+        gap = pd.DataFrame([[_ELLIPSIS] * shown.shape[1]], columns=shown.columns)
+        shown = pd.concat([shown.iloc[:elide_after], gap, shown.iloc[elide_after:]], ignore_index=True)
+    return shown.to_markdown(index=False, tablefmt="pipe", disable_numparse=True).splitlines()
+
+
+def render_markdown(
+    frame: pd.DataFrame,
+    max_rows: Optional[int] = None,
+    max_cols: Optional[int] = None,
+    max_width: Optional[int] = None,
+    total_rows: Optional[int] = None,
+) -> str:
+    """Render a DataFrame as a bounded pipe-style markdown table.
+
+    Args:
+        frame: Table to render (its index is dropped).
+        max_rows: Row cap; beyond it the first and last rows are shown around
+            an elision row (default: ``settings.markdown_max_rows``, 0 for no cap).
+        max_cols: Column cap (default: ``settings.markdown_max_cols``, 0 for no cap).
+        max_width: Cell width cap in characters (default:
+            ``settings.markdown_max_cell_chars``, 0 for no cap).
+        total_rows: Row count of the full result when ``frame`` only holds
+            part of it (e.g. its head and tail).
+
+    Returns:
+        Markdown table, followed by a summary line if rows or columns were elided.
+    """
+    max_rows = settings.markdown_max_rows if max_rows is None else max_rows
+    max_cols = settings.markdown_max_cols if max_cols is None else max_cols
+    max_width = settings.markdown_max_cell_chars if max_width is None else max_width
+    rows, cols = frame.shape
+    total_rows = rows if total_rows is None else total_rows
+
+    if frame.empty and cols == 0:
+        return "_No data._"
+    if max_cols > 0 and cols > max_cols:
+        frame = frame.iloc[:, :max_cols]
+
+    elide_after = None
+    if max_rows > 0 and rows > max_rows:
+        head = (max_rows + 1) // 2
+        frame = pd.concat([frame.iloc[:head], frame.iloc[rows - (max_rows - head) :]])
+        elide_after = head
+    elif total_rows > rows:
+        elide_after = rows // 2 + rows % 2
+
+    if _HAS_TABULATE and len(frame) <= TABULATE_MAX_ROWS:
+        lines = _tabulate_table(frame, elide_after, max_width)
+    else:
+        lines = _fast_table(frame, elide_after, max_width)
+
+    if elide_after is not None or frame.shape[1] < cols:
+        shown = f"{len(frame)} of {total_rows} rows"
+        if frame.shape[1] < cols:
+            shown += f", {frame.shape[1]} of {cols} columns"
+        lines.append(f"\n_{total_rows} rows × {cols} columns (showing {shown})._")
+    return "\n".join(lines)
+
+
+def payload_markdown(payload: dict) -> Optional[str]:
+    """Render the ``data`` of a tool payload as a bounded markdown table.
+
+    Only the rows that will be shown are turned back into a DataFrame, so the
+    cost does not grow with the size of the payload.
+
+    Args:
+        payload: Payload in any output format (see ``shared/payloads.py``).
+
+    Returns:
+        Markdown table, or None if the payload holds no table.
+    """
+    data = payload.get("data")
+    if isinstance(data, dict):
+        rows = len(next(iter(data.values()), []))
+        pick = _head_tail(rows)
+        frame = pd.DataFrame({name: [values[i] for i in pick] for name, values in data.items()})
+    elif isinstance(data, list) and "columns" in payload:
+        rows = len(data)
+        frame = pd.DataFrame([data[i] for i in _head_tail(rows)], columns=payload["columns"])
+    elif isinstance(data, list):
+        rows = len(data)
+        frame = pd.DataFrame([data[i] for i in _head_tail(rows)])
+    else:
+        return None
+    return render_markdown(frame, total_rows=rows)
+
+
+def _head_tail(rows: int) -> list[int]:
+    max_rows = settings.markdown_max_rows
+    if max_rows <= 0 or rows <= max_rows:
+        return list(range(rows))
+    head = (max_rows + 1) // 2
+    return [*range(head), *range(rows - (max_rows - head), rows)]
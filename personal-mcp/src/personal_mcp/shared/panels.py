@@ -0,0 +1,103 @@
+"""Multi-symbol price panels.
+
+Analytics tools work on a *panel*: one wide DataFrame per field (``close``,
+``volume``, ...) indexed by bar time with one column per symbol, so that a
+computation covers the whole universe in one vectorized pass instead of one
+call per symbol. :func:`fetch_histories` gathers the per-symbol histories
+through the adapter (and therefore its cache and OHLC store), and
+:func:`price_panel` aligns them on the union of bar times.
+"""
+
+import asyncio
+from typing import Any, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from personal_mcp.shared.executor import run_blocking, source_semaphore
+from personal_mcp.shared.frames import symbols_from
+
+PANEL_FIELDS = ("open", "high", "low", "close", "volume")
+
+
+async def resolve_symbols(adapter: Any, symbols: Optional[list[str]], group: Optional[str]) -> list[str]:
+    """Return ``symbols``, or the members of ``group`` when it is empty.
+
+    Raises:
+        ValueError: If neither is given.
+    """
+    if symbols:
+        return [s.upper() for s in symbols]
+    if not group:
+        raise ValueError("symbols or group is required")
+    return symbols_from(await run_blocking(adapter.listing_symbols_by_group, group=group))
+
+
+async def fetch_histories(
+    adapter: Any,
+    symbols: list[str],
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    interval: str = "1D",
+) -> tuple[dict[str, pd.DataFrame], dict[str, str]]:
+    """Fetch the history of many symbols concurrently, capped per data source.
+
+    Args:
+        adapter: VNStockAdapter (its cache and OHLC store are used).
+        symbols: Stock symbols.
+        start: Start date (YYYY-MM-DD).
+        end: End date (YYYY-MM-DD).
+        interval: Bar interval.
+
+    Returns:
+        (symbol to history frame, symbol to error message for failed fetches).
+    """
+    # quote_history goes through vnstock.Quote, whose default source is VCI
+    slots = source_semaphore("VCI")
+
+    async def fetch(symbol: str) -> pd.DataFrame:
+        async with slots:
+            return await run_blocking(adapter.quote_history, symbol=symbol, start=start, end=end, interval=interval)
+
+    results = await asyncio.gather(*(fetch(s) for s in symbols), return_exceptions=True)
+    frames = {s: r for s, r in zip(symbols, results) if isinstance(r, pd.DataFrame)}
+    errors = {s: str(r) for s, r in zip(symbols, results) if isinstance(r, BaseException)}
+    return frames, errors
+
+
+def price_panel(
+    frames: dict[str, pd.DataFrame],
+    fields: Iterable[str] = PANEL_FIELDS,
+) -> dict[str, pd.DataFrame]:
+    """Align per-symbol histories into one wide float64 frame per field.
+
+    Args:
+        frames: Symbol to history frame with a ``time`` column.
+        fields: Columns to pivot; fields missing from every frame are skipped.
+
+    Returns:
+        Field to DataFrame indexed by sorted bar time with one column per
+        symbol (in ``frames`` order, empty histories dropped). Bars a symbol
+        does not have are NaN; the last one wins when a time repeats.
+    """
+    frames = {s: f for s, f in frames.items() if f is not None and not f.empty}
+    if not frames:
+        return {}
+    stamps = {
+        s: pd.to_datetime(f["time"], cache=False).to_numpy(dtype="datetime64[ns]") for s, f in frames.items()
+    }
+    index = np.unique(np.concatenate(list(stamps.values())))
+    # Row of each bar in the shared index: filling whole columns by position
+    # is much cheaper than letting pandas align one Series per symbol
+    rows = {s: np.searchsorted(index, t) for s, t in stamps.items()}
+
+    panel: dict[str, pd.DataFrame] = {}
+    for field in fields:
+        if not any(field in f.columns for f in frames.values()):
+            continue
+        values = np.full((len(index), len(frames)), np.nan)
+        for j, (symbol, frame) in enumerate(frames.items()):
+            if field in frame.columns:
+                values[rows[symbol], j] = frame[field].to_numpy(dtype="float64")
+        panel[field] = pd.DataFrame(values, index=pd.DatetimeIndex(index, name="time"), columns=list(frames))
+    return panel
@@ -0,0 +1,286 @@
+"""Structured tool payloads.
+
+Tools return a :class:`FramePayload` as MCP ``structuredContent`` (described
+by ``OUTPUT_SCHEMA``) instead of a JSON string, so clients no longer parse
+JSON that was embedded in a JSON string. :func:`tool_result` encodes the
+text copy once with ``pydantic_core`` and hands FastMCP a payload that is
+already JSON-ready, skipping its generic conversion passes. The MCP layer
+still validates every result against ``OUTPUT_SCHEMA``, which declares the
+payload keys without per-cell schemas so that check stays cheap.
+
+Tables can be laid out in three formats (see :data:`OutputFormat`):
+
+- ``records``: ``{"data": [{"col": v, ...}, ...]}``, one object per row.
+- ``columns``: ``{"data": {"col": [v, ...], ...}}``, one array per column.
+- ``split``: ``{"columns": [...], "dtypes": [...], "data": [[v, ...], ...]}``,
+  a shared header plus one array per row.
+
+``columns`` and ``split`` name each column once instead of once per row,
+which makes wide frames several times smaller.
+
+Results longer than ``settings.page_rows`` are paged: the response holds the
+first page plus ``total`` and ``next_cursor`` (see ``shared/cursors.py``).
+"""
+
+from typing import Annotated, Any, Literal, Optional, TypedDict
+
+import numpy as np
+import pandas as pd
+import pydantic_core
+from fastmcp.tools.tool import ToolResult
+from mcp.types import TextContent
+from pydantic import TypeAdapter, WithJsonSchema
+
+from personal_mcp.config import settings
+from personal_mcp.shared import cursors
+from personal_mcp.shared.frames import shape_frame
+from personal_mcp.shared.markdown import payload_markdown
+from personal_mcp.shared.precision import date_strings, float_values
+
+OutputFormat = Literal["records", "columns", "split"]
+
+# Declared without per-cell schemas so output-schema validation of large
+# results stays cheap
+Records = Annotated[list[dict[str, Any]], WithJsonSchema({"type": "array", "items": {"type": "object"}})]
+Columns = Annotated[dict[str, list[Any]], WithJsonSchema({"type": "object"})]
+Table = Annotated[list[list[Any]], WithJsonSchema({"type": "array", "items": {"type": "array"}})]
+
+
+class FramePayload(TypedDict, total=False):
+    """Response of a data tool.
+
+    Attributes:
+        data: Rows in the requested format, or a text rendering for
+            non-tabular results.
+        columns: Column names (``split`` format only).
+        dtypes: Column dtypes (``split`` format only).
+        total: Rows in the whole result when it is paged.
+        next_cursor: Token for the next page (absent on the last page).
+        notes: How the result was reduced to fit a size budget.
+        errors: Per-item failures of a fan-out tool (e.g. symbol to message).
+        error: Message when the whole call failed.
+    """
+
+    data: Records | Columns | Table | str
+    columns: list[str]
+    dtypes: list[str]
+    total: int
+    next_cursor: str
+    notes: list[str]
+    errors: dict[str, str]
+    error: str
+
+
+OUTPUT_SCHEMA: dict[str, Any] = TypeAdapter(FramePayload).json_schema()
+"""Output schema declared by every data tool."""
+
+
+def _native(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        return value.item()
+    if value is pd.NaT:
+        return None
+    return value
+
+
+def _column_values(column: pd.Series) -> list[Any]:
+    """Convert one column to JSON-ready Python values."""
+    if isinstance(column.dtype, pd.DatetimeTZDtype) or pd.api.types.is_datetime64_dtype(column.dtype):
+        # Vectorized ISO formatting; NaT becomes None
+        return date_strings(column)
+    if isinstance(column.dtype, np.dtype) and column.dtype.kind == "f":
+        # Rounded per the precision policy; NaN is emitted as null
+        return float_values(column)
+    if isinstance(column.dtype, np.dtype) and column.dtype != object:
+        # tolist() boxes numpy scalars to Python ints/floats/bools; NaN is
+        # emitted as null by the encoder
+        return column.tolist()
+    # Object and extension dtypes may hold numpy scalars, NA or NaT
+    values = column.astype(object).where(column.notna(), None)
+    return [_native(v) for v in values.tolist()]
+
+
+def _columns(frame: pd.DataFrame) -> tuple[list[str], list[list[Any]]]:
+    names = [str(c) for c in frame.columns]
+    return names, [_column_values(frame.iloc[:, i]) for i in range(frame.shape[1])]
+
+
+def frame_records(frame: pd.DataFrame) -> list[dict[str, Any]]:
+    """Convert a DataFrame to a list of row objects, column by column.
+
+    Faster than ``DataFrame.to_dict(orient="records")``, which boxes every
+    cell individually. The index is dropped, as with ``to_json(orient="records")``.
+
+    Args:
+        frame: DataFrame to convert.
+
+    Returns:
+        One dict per row keyed by column name.
+    """
+    names, columns = _columns(frame)
+    return [dict(zip(names, row)) for row in zip(*columns)]
+
+
+def frame_data(frame: pd.DataFrame, format: OutputFormat = "records") -> FramePayload:
+    """Lay out a DataFrame in one of the output formats.
+
+    Args:
+        frame: DataFrame to convert (its index is dropped).
+        format: ``records``, ``columns`` or ``split``.
+
+    Returns:
+        Payload holding ``data`` (plus the header for ``split``).
+    """
+    if format == "records":
+        return {"data": frame_records(frame)}
+    names, columns = _columns(frame)
+    if format == "columns":
+        return {"data": dict(zip(names, columns))}
+    if format == "split":
+        return {
+            "columns": names,
+            "dtypes": [str(t) for t in frame.dtypes],
+            "data": [list(row) for row in zip(*columns)],
+        }
+    raise ValueError(f"Unknown output format: {format}")
+
+
+def page_payload(frame: pd.DataFrame, format: OutputFormat, snapshot: str, offset: int) -> FramePayload:
+    """Lay out the page of a held result starting at ``offset``.
+
+    Args:
+        frame: Full result held under ``snapshot``.
+        format: Output layout.
+        snapshot: Snapshot id (see ``cursors.save``).
+        offset: First row of the page.
+
+    Returns:
+        Page payload with ``total`` and, unless it is the last page, ``next_cursor``.
+    """
+    end = offset + max(settings.page_rows, 1)
+    payload = frame_data(frame.iloc[offset:end], format)
+    payload["total"] = len(frame)
+    if end < len(frame):
+        payload["next_cursor"] = cursors.token(snapshot, end)
+    return payload
+
+
+def paged_data(frame: pd.DataFrame, format: OutputFormat = "records") -> FramePayload:
+    """Lay out a result, holding it server-side if it spans several pages.
+
+    Args:
+        frame: Result to return.
+        format: Output layout.
+
+    Returns:
+        The whole result, or its first page when longer than ``settings.page_rows``.
+    """
+    if settings.page_rows <= 0 or len(frame) <= settings.page_rows:
+        return frame_data(frame, format)
+    snapshot = cursors.save(frame, format)
+    if snapshot is None:
+        # Too large to hold: fall back to a single response
+        return frame_data(frame, format)
+    return page_payload(frame, format, snapshot, 0)
+
+
+def cursor_payload(cursor: str) -> FramePayload:
+    """Return the page a ``next_cursor`` token points to."""
+    snapshot, frame, format, offset = cursors.load(cursor)
+    return page_payload(frame, format, snapshot, offset)
+
+
+def frame_payload(
+    result: Any,
+    format: OutputFormat = "records",
+    *,
+    fields: Optional[list[str]] = None,
+    filter: Optional[list[str]] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> FramePayload:
+    """Wrap an adapter result as a tool payload.
+
+    Args:
+        result: DataFrame, Series or any other vnstock result.
+        format: Layout for tabular results.
+        fields: Columns to keep (see ``shape_frame``).
+        filter: Row predicates (see ``shape_frame``).
+        limit: Maximum number of rows.
+        offset: Number of rows to skip.
+
+    Returns:
+        Tabular results laid out by ``paged_data``, ``{"data": str(result)}`` otherwise.
+    """
+    if isinstance(result, pd.Series):
+        result = result.to_frame(name=result.name if result.name is not None else "value")
+    if isinstance(result, pd.DataFrame):
+        result = shape_frame(result, fields=fields, filter=filter, limit=limit, offset=offset)
+        return paged_data(result, format)
+    return {"data": str(result)}
+
+
+def error_payload(error: BaseException) -> FramePayload:
+    """Wrap a failure as a tool payload."""
+    return {"error": str(error)}
+
+
+def _summary(payload: FramePayload) -> str:
+    if "error" in payload:
+        return payload["error"]
+    rows = row_count(payload)
+    if rows is not None:
+        return f"{rows} rows in structuredContent"
+    return str(payload.get("data"))
+
+
+def row_count(payload: FramePayload) -> int | None:
+    """Number of rows in a payload's ``data`` (None if it is not tabular)."""
+    data = payload.get("data")
+    if isinstance(data, list):
+        return len(data)
+    if isinstance(data, dict):
+        return len(next(iter(data.values()), []))
+    return None
+
+
+def payload_json(payload: FramePayload) -> str:
+    """Encode a payload as compact JSON (NaN and infinities become null)."""
+    return pydantic_core.to_json(payload, inf_nan_mode="null").decode()
+
+
+def tool_result(payload: FramePayload) -> ToolResult:
+    """Build the MCP result for a payload built by this module.
+
+    Depending on ``settings.tool_text_content``, the text block is a
+    one-line summary (the default, so that clients reading
+    ``structuredContent`` receive the rows only once), a bounded markdown
+    table or the payload's full JSON.
+
+    Args:
+        payload: JSON-ready payload (from ``frame_payload`` and friends).
+
+    Returns:
+        ToolResult carrying the payload as structured content plus a text block.
+    """
+    if settings.tool_text_content == "summary":
+        text = _summary(payload)
+    elif settings.tool_text_content == "markdown":
+        text = payload_markdown(payload) or _summary(payload)
+    else:
+        text = payload_json(payload)
+    result = ToolResult(content=[TextContent(type="text", text=text)])
+    # The payload only holds JSON types already; assigning it directly skips
+    # ToolResult's to_jsonable_python pass over every row
+    result.structured_content = dict(payload)
+    return result
+
+
+def frame_result(result: Any, format: OutputFormat = "records", **shape: Any) -> ToolResult:
+    """Shortcut for ``tool_result(frame_payload(result, format, **shape))``."""
+    return tool_result(frame_payload(result, format, **shape))
+
+
+def error_result(error: BaseException) -> ToolResult:
+    """Shortcut for ``tool_result(error_payload(error))``."""
+    return tool_result(error_payload(error))
@@ -0,0 +1,108 @@
+"""Pool of reusable vnstock client objects.
+
+Objects such as ``vnstock.Quote(symbol=...)`` or ``vnstock.Company(...)``
+are bound to one symbol and source. Building them resolves the provider
+module and sets up request state, so repeated calls for the same symbol reuse
+the instance. The pool is bounded and drops objects that have not been used
+for a while.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, NamedTuple, TypeVar
+
+T = TypeVar("T")
+
+# Keyword arguments vnstock treats case-insensitively
+_CASELESS = ("symbol", "source")
+
+
+class _Slot(NamedTuple):
+    obj: Any
+    last_used: float
+
+
+class ObjectPool:
+    """Bounded LRU pool of objects keyed on (factory, arguments).
+
+    Objects idle for longer than ``idle_seconds`` are evicted on the next
+    access; past ``max_size`` the least recently used object is dropped.
+    """
+
+    def __init__(self, max_size: int, idle_seconds: float) -> None:
+        """Initialize an empty pool.
+
+        Args:
+            max_size: Maximum number of pooled objects (0 disables pooling).
+            idle_seconds: Time after which an unused object is evicted.
+        """
+        self.max_size = max_size
+        self.idle_seconds = idle_seconds
+        self.hits = 0
+        self.misses = 0
+        self._slots: OrderedDict[Hashable, _Slot] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    @staticmethod
+    def _key(factory: Callable[..., Any], kwargs: dict[str, Any]) -> Hashable:
+        args = tuple(
+            sorted(
+                (name, value.upper() if name in _CASELESS and isinstance(value, str) else value)
+                for name, value in kwargs.items()
+            )
+        )
+        return (factory, args)
+
+    def _evict_idle(self, now: float) -> None:
+        # Slots are ordered by last use, so idle ones are at the front
+        while self._slots:
+            key, slot = next(iter(self._slots.items()))
+            if now - slot.last_used < self.idle_seconds:
+                break
+            del self._slots[key]
+
+    def get(self, factory: Callable[..., T], /, **kwargs: Any) -> T:
+        """Return a pooled ``factory(**kwargs)``, creating it on first use.
+
+        Args:
+            factory: Class or callable building the object.
+            **kwargs: Constructor arguments; ``symbol`` and ``source`` are
+                matched case-insensitively.
+
+        Returns:
+            Shared object for these arguments.
+        """
+        if self.max_size <= 0:
+            return factory(**kwargs)
+        key = self._key(factory, kwargs)
+        now = time.monotonic()
+        with self._lock:
+            self._evict_idle(now)
+            slot = self._slots.get(key)
+            if slot is not None:
+                self._slots[key] = slot._replace(last_used=now)
+                self._slots.move_to_end(key)
+                self.hits += 1
+                return slot.obj
+            self.misses += 1
+
+        # Build outside the lock; constructors may do I/O
+        obj = factory(**kwargs)
+        with self._lock:
+            slot = self._slots.get(key)
+            if slot is not None:
+                # Another thread built it first: share that one
+                return slot.obj
+            self._slots[key] = _Slot(obj, now)
+            while len(self._slots) > self.max_size:
+                self._slots.popitem(last=False)
+        return obj
+
+    def clear(self) -> None:
+        """Drop every pooled object."""
+        with self._lock:
+            self._slots.clear()
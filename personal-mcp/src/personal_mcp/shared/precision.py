@@ -0,0 +1,130 @@
+"""Numeric precision policy for payloads and cached frames.
+
+Upstream frames carry float64 prices with long fractional noise (``95.49999999``)
+and int64 counters, and every digit ends up in the JSON. This module decides
+how numbers and dates are written and stored:
+
+- Floats are rounded when serialized: price columns (see :func:`is_price_column`)
+  to ``settings.price_decimals``, other floats to ``settings.float_decimals``.
+  VCI quotes prices in thousands of VND, so two decimals keep every price step.
+- Dates at midnight are written as ``YYYY-MM-DD`` when ``settings.compact_dates``
+  is on, other timestamps as ``YYYY-MM-DDTHH:MM:SS``.
+- :func:`downcast_frame` stores float64 columns as float32 and int64 columns
+  as int32 when every value survives the round trip exactly, halving the
+  memory held by the response cache. :func:`restore_frame` widens them back
+  when a cached frame is handed out. Rounding only ever happens on output.
+"""
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from personal_mcp.config import settings
+
+PRICE_COLUMNS = frozenset(
+    {
+        "open",
+        "high",
+        "low",
+        "close",
+        "price",
+        "ceiling",
+        "floor",
+        "reference",
+        "ref_price",
+        "avg_price",
+        "match_price",
+        "bid",
+        "ask",
+    }
+)
+
+_INT32 = np.iinfo(np.int32)
+
+# attrs key listing the column positions narrowed by downcast_frame
+_NARROWED = "downcast_columns"
+
+
+def is_price_column(name: object) -> bool:
+    """Whether a column holds prices (``close``, ``match_price``, ``bid_1_price``, ...)."""
+    name = str(name).lower()
+    return name in PRICE_COLUMNS or name.endswith("_price")
+
+
+def decimals_for(name: object) -> Optional[int]:
+    """Decimals floats of column ``name`` are rounded to (None: no rounding)."""
+    decimals = settings.price_decimals if is_price_column(name) else settings.float_decimals
+    return None if decimals is None or decimals < 0 else decimals
+
+
+def float_values(column: pd.Series) -> list[float]:
+    """Float column as Python floats rounded by the policy (NaN kept)."""
+    values = column.to_numpy(dtype=np.float64)
+    decimals = decimals_for(column.name)
+    if decimals is not None:
+        values = values.round(decimals)
+    return values.tolist()
+
+
+def date_strings(column: pd.Series) -> list[Optional[str]]:
+    """Datetime column as ISO strings, date-only when every value is at midnight."""
+    valid = column.dropna()
+    compact = settings.compact_dates and bool((valid == valid.dt.normalize()).all())
+    text = column.dt.strftime("%Y-%m-%d" if compact else "%Y-%m-%dT%H:%M:%S")
+    return text.astype(object).where(column.notna(), None).tolist()
+
+
+def downcast_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    """Store numeric columns in 32 bits where that loses nothing.
+
+    Args:
+        frame: DataFrame to shrink (left untouched).
+
+    Returns:
+        ``frame`` itself if no column can be narrowed, otherwise a copy with
+        float64 columns as float32 and int64 columns as int32 where every
+        value converts back unchanged.
+        The narrowed columns are listed in ``attrs`` for :func:`restore_frame`.
+    """
+    narrowed = {}
+    for i, name in enumerate(frame.columns):
+        column = frame.iloc[:, i]
+        if column.dtype == np.float64:
+            values = column.to_numpy()
+            with np.errstate(invalid="ignore", over="ignore"):
+                narrow = values.astype(np.float32)
+            # NaN stays NaN; overflow gives inf, which compares unequal
+            if np.all((narrow.astype(np.float64) == values) | np.isnan(values)):
+                narrowed[i] = narrow
+        elif column.dtype == np.int64 and len(column):
+            if _INT32.min <= column.min() and column.max() <= _INT32.max:
+                narrowed[i] = column.to_numpy().astype(np.int32)
+    if not narrowed:
+        return frame
+    result = frame.copy(deep=False)
+    for i, values in narrowed.items():
+        result.isetitem(i, values)
+    result.attrs = {**frame.attrs, _NARROWED: list(narrowed)}
+    return result
+
+
+def restore_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    """Undo :func:`downcast_frame` for callers of a cached frame.
+
+    Narrowed columns come back as float64 and int64 with the exact values
+    they were cached with, so consumers never see dtypes that depend on the
+    values.
+
+    Returns:
+        A shallow copy of ``frame`` with the original dtypes.
+    """
+    positions = frame.attrs.get(_NARROWED)
+    result = frame.copy(deep=False)
+    if not positions:
+        return result
+    for i in positions:
+        values = frame.iloc[:, i].to_numpy()
+        result.isetitem(i, values.astype(np.float64 if values.dtype == np.float32 else np.int64))
+    result.attrs = {k: v for k, v in frame.attrs.items() if k != _NARROWED}
+    return result
@@ -0,0 +1,130 @@
+"""Session-aware OHLCV resampling.
+
+Coarser bars are derived from finer ones with a single vectorized pass:
+each bar gets the start of its bucket, bucket boundaries are found with one
+comparison of neighbouring keys, and open/high/low/close/volume are
+aggregated with ``ufunc.reduceat``.
+
+Intraday buckets are anchored at each session open rather than at midnight,
+and no bucket crosses the lunch break. Prints after a session's last bucket
+start, such as the 11:30 morning close and the 14:45 closing auction on
+HOSE/HNX, fold into that last bucket instead of forming a bar of their own.
+Daily bars are labelled with the date, weekly bars with the Monday and
+monthly bars with the first day of the month.
+"""
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+Session = tuple[int, int]
+"""Trading session as (open, close) in minutes after midnight."""
+
+SESSIONS: dict[str, tuple[Session, ...]] = {
+    "HOSE": ((9 * 60, 11 * 60 + 30), (13 * 60, 14 * 60 + 45)),
+    "HNX": ((9 * 60, 11 * 60 + 30), (13 * 60, 14 * 60 + 45)),
+    "UPCOM": ((9 * 60, 11 * 60 + 30), (13 * 60, 15 * 60)),
+}
+
+INTRADAY_MINUTES = {"1m": 1, "5m": 5, "15m": 15, "30m": 30, "1H": 60}
+
+_ORDER = ("1m", "5m", "15m", "30m", "1H", "1D", "1W", "1M")
+
+
+def can_resample(fine: str, coarse: str) -> bool:
+    """Whether ``coarse`` bars can be built exactly from ``fine`` bars."""
+    if fine not in _ORDER or coarse not in _ORDER or _ORDER.index(fine) >= _ORDER.index(coarse):
+        return False
+    if coarse in INTRADAY_MINUTES:
+        return INTRADAY_MINUTES[coarse] % INTRADAY_MINUTES[fine] == 0
+    return True
+
+
+def bucket_starts(
+    times: np.ndarray,
+    interval: str,
+    sessions: tuple[Session, ...] = SESSIONS["HOSE"],
+) -> np.ndarray:
+    """Start of the ``interval`` bucket of each bar time.
+
+    Args:
+        times: Bar times as ``datetime64[ns]``.
+        interval: Target interval (``5m`` ... ``1H``, ``1D``, ``1W`` or ``1M``).
+        sessions: Trading sessions of the exchange, in order.
+
+    Returns:
+        ``datetime64[ns]`` array of bucket starts, aligned with ``times``.
+    """
+    days = times.astype("datetime64[D]")
+    if interval == "1D":
+        return days.astype("datetime64[ns]")
+    if interval == "1W":
+        # 1970-01-01 was a Thursday: shift so weeks start on Monday
+        weekday = (days.astype(np.int64) + 3) % 7
+        return (days - weekday.astype("timedelta64[D]")).astype("datetime64[ns]")
+    if interval == "1M":
+        return times.astype("datetime64[M]").astype("datetime64[ns]")
+    if interval not in INTRADAY_MINUTES:
+        raise ValueError(f"Cannot resample to interval {interval}")
+
+    step = INTRADAY_MINUTES[interval]
+    minutes = (times - days).astype("timedelta64[m]").astype(np.int64)
+    opens = np.array([s[0] for s in sessions])
+    lasts = np.array([o + (c - o - 1) // step * step for o, c in sessions])
+    # Session of each bar: the last one opened by then (pre-open prints go to the first)
+    session = np.clip(np.searchsorted(opens, minutes, side="right") - 1, 0, len(sessions) - 1)
+    start = opens[session] + (minutes - opens[session]) // step * step
+    start = np.clip(start, opens[session], lasts[session])
+    return (days.astype("datetime64[ns]") + start.astype("timedelta64[m]")).astype("datetime64[ns]")
+
+
+def resample_bars(
+    bars: pd.DataFrame,
+    interval: str,
+    sessions: tuple[Session, ...] = SESSIONS["HOSE"],
+    previous: Optional[pd.DataFrame] = None,
+) -> pd.DataFrame:
+    """Aggregate OHLCV bars into coarser ``interval`` bars.
+
+    Args:
+        bars: Bars with ``time``, ``open``, ``high``, ``low``, ``close`` and
+            optionally ``volume``, in any order.
+        interval: Target interval, see :func:`bucket_starts`.
+        sessions: Trading sessions of the exchange.
+        previous: Result of an earlier call over the same series. Only the
+            bars from its last (possibly incomplete) bucket on are aggregated
+            again; earlier buckets are reused as they are.
+
+    Returns:
+        Bars labelled with their bucket start, sorted by ``time``.
+    """
+    kept = None
+    if previous is not None and not previous.empty:
+        last = pd.Timestamp(previous["time"].iloc[-1])
+        kept = previous[pd.to_datetime(previous["time"]) < last]
+        bars = bars[pd.to_datetime(bars["time"]) >= last]
+    if bars.empty:
+        return (kept if kept is not None else bars).reset_index(drop=True)
+
+    bars = bars.sort_values("time", kind="stable")
+    times = pd.to_datetime(bars["time"]).to_numpy(dtype="datetime64[ns]")
+    keys = bucket_starts(times, interval, sessions)
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    ends = np.r_[starts[1:], len(keys)] - 1
+
+    columns = {"time": keys[starts]}
+    if "open" in bars.columns:
+        columns["open"] = bars["open"].to_numpy()[starts]
+    if "high" in bars.columns:
+        columns["high"] = np.fmax.reduceat(bars["high"].to_numpy(dtype=float), starts)
+    if "low" in bars.columns:
+        columns["low"] = np.fmin.reduceat(bars["low"].to_numpy(dtype=float), starts)
+    if "close" in bars.columns:
+        columns["close"] = bars["close"].to_numpy()[ends]
+    if "volume" in bars.columns:
+        columns["volume"] = np.add.reduceat(bars["volume"].to_numpy(), starts)
+    result = pd.DataFrame(columns)
+    if kept is not None:
+        result = pd.concat([kept, result], ignore_index=True)
+    return result
@@ -0,0 +1,206 @@
+"""Per-source rate limiting and circuit breaking.
+
+Each upstream (VCI, TCBS, MSN, FMARKET, ...) throttles differently. A
+:class:`SourceGuard` paces calls to one source with a token bucket and stops
+calling it for a cool-down period after repeated failures, so requests fail
+fast instead of queueing behind a dead upstream.
+"""
+
+import threading
+import time
+from typing import Callable, Optional, TypeVar
+
+from fastmcp.utilities.logging import get_logger
+
+from personal_mcp.config import settings
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class RateLimitedError(ConnectionError):
+    """Raised when no request token becomes available in time."""
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised when a source is skipped because its circuit is open."""
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at ``rate`` per second."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second.
+            burst: Bucket capacity.
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Take one token, sleeping until one is available.
+
+        Args:
+            timeout: Maximum seconds to wait (None: wait indefinitely).
+
+        Returns:
+            False if the wait would exceed ``timeout``.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self.rate
+            if deadline is not None and now + wait > deadline:
+                return False
+            time.sleep(wait)
+
+
+class CircuitBreaker:
+    """Closed/open/half-open circuit breaker.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    calls are rejected for ``reset_timeout`` seconds. The next call is then
+    let through as a trial: success closes the circuit, failure reopens it.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float) -> None:
+        """Initialize a closed circuit.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit.
+            reset_timeout: Seconds to stay open before a trial call.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state: ``closed``, ``open`` or ``half_open``."""
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at < self.reset_timeout:
+            return "open"
+        return "half_open"
+
+    def allow(self) -> bool:
+        """Return True if a call may proceed now."""
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return True
+            if state == "half_open" and not self._trial_running:
+                self._trial_running = True
+                return True
+            return False
+
+    def release_trial(self) -> None:
+        """Give back a trial slot that was granted but not used."""
+        with self._lock:
+            self._trial_running = False
+
+    def record_success(self) -> None:
+        """Close the circuit."""
+        with self._lock:
+            self.failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self) -> None:
+        """Count a failure and open the circuit past the threshold."""
+        with self._lock:
+            self.failures += 1
+            if self._trial_running or self.failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial_running = False
+
+
+class SourceGuard:
+    """Token bucket plus circuit breaker for one upstream source."""
+
+    def __init__(self, name: str, limiter: TokenBucket, breaker: CircuitBreaker, max_wait: float) -> None:
+        """Initialize the guard.
+
+        Args:
+            name: Source name used in errors and logs.
+            limiter: Pacing for outgoing calls.
+            breaker: Failure tracking for the source.
+            max_wait: Longest time to wait for a rate-limit token.
+        """
+        self.name = name
+        self.limiter = limiter
+        self.breaker = breaker
+        self.max_wait = max_wait
+
+    def call(self, func: Callable[[], T]) -> T:
+        """Run ``func`` if the circuit allows it, after taking a token.
+
+        Network errors (``OSError``, which covers ``ConnectionError``,
+        ``TimeoutError`` and ``requests`` exceptions) count as failures;
+        other exceptions are caller errors and leave the circuit alone.
+
+        Raises:
+            CircuitOpenError: If the source is cooling down.
+            RateLimitedError: If no token is available within ``max_wait``.
+        """
+        if not self.breaker.allow():
+            raise CircuitOpenError(f"{self.name} is unavailable, retry in {self.breaker.reset_timeout:.0f}s")
+        if not self.limiter.acquire(timeout=self.max_wait):
+            self.breaker.release_trial()
+            raise RateLimitedError(f"{self.name} rate limit exceeded")
+        try:
+            result = func()
+        except OSError:
+            self.breaker.record_failure()
+            if self.breaker.state != "closed":
+                logger.warning(f"circuit for {self.name} is {self.breaker.state}")
+            raise
+        except Exception:
+            self.breaker.release_trial()
+            raise
+        self.breaker.record_success()
+        return result
+
+
+_guards: dict[str, SourceGuard] = {}
+_guards_lock = threading.Lock()
+
+
+def get_source_guard(source: str) -> SourceGuard:
+    """Get or create the guard for an upstream source.
+
+    Args:
+        source: Source name (case-insensitive), e.g. ``"vci"``.
+
+    Returns:
+        SourceGuard configured from application settings.
+    """
+    key = source.upper()
+    with _guards_lock:
+        if key not in _guards:
+            rate = settings.source_rate_limits.get(key, settings.source_rate_default)
+            _guards[key] = SourceGuard(
+                name=key,
+                limiter=TokenBucket(rate=rate, burst=settings.source_rate_burst),
+                breaker=CircuitBreaker(
+                    failure_threshold=settings.breaker_failure_threshold,
+                    reset_timeout=settings.breaker_reset_seconds,
+                ),
+                max_wait=settings.source_rate_max_wait,
+            )
+        return _guards[key]
@@ -0,0 +1,54 @@
+"""Single-flight coalescing of identical in-flight calls.
+
+When several threads ask for the same key at the same time, only the first
+(the leader) runs the call; the others block on the leader's future and
+receive the same result or exception.
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Deduplicates concurrent calls that share a key."""
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self.coalesced = 0
+        self._calls: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, call: Callable[[], T]) -> T:
+        """Run ``call`` unless an identical call is already running.
+
+        Args:
+            key: Identity of the call.
+            call: Zero-argument callable performing the work.
+
+        Returns:
+            The result of the leader's call.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+            else:
+                self.coalesced += 1
+        if not leader:
+            return future.result()
+        try:
+            result = call()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
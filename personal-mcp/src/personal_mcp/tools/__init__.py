@@ -1,8 +1,12 @@
 """Tools package for personal MCP server."""
 
+from .analytics_tools import setup_analytics_tools
+from .result_tools import setup_result_tools
 from .vnstock_tools import setup_vnstock_tools
 
 
 def register_tools(mcp):
     """Register all tools with the MCP server."""
     setup_vnstock_tools(mcp)
+    setup_analytics_tools(mcp)
+    setup_result_tools(mcp)
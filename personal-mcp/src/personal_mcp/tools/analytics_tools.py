@@ -0,0 +1,328 @@
+"""Analytics tools computed server-side over multi-symbol price panels.
+
+Histories come from the adapter, hence from its cache and OHLC store, and are
+aligned into a panel (see ``shared/panels.py``) so each computation runs once
+for the whole universe.
+"""
+
+import time
+from datetime import datetime
+from typing import Literal, Optional
+
+import pandas as pd
+from fastmcp.tools.tool import ToolResult
+
+from personal_mcp.adapters.market_snapshot import MarketSnapshot
+from personal_mcp.adapters.vnstock_adapter import get_vnstock_adapter
+from personal_mcp.shared import correlation, expressions
+from personal_mcp.shared.backtest import run_backtest, signal_weights, static_weights
+from personal_mcp.shared.correlation import Shrinkage, Statistic
+from personal_mcp.shared.executor import run_blocking
+from personal_mcp.shared.frames import RowFilter, shape_frame
+from personal_mcp.shared.indicators import compute_indicators, panel_rows, required_fields
+from personal_mcp.shared.panels import PANEL_FIELDS, fetch_histories, price_panel, resolve_symbols
+from personal_mcp.shared.payloads import (
+    OUTPUT_SCHEMA,
+    OutputFormat,
+    error_result,
+    paged_data,
+    tool_result,
+)
+
+
+def setup_analytics_tools(server) -> None:
+    """Set up the analytics tools for the MCP server.
+
+    Args:
+        server: FastMCP server instance.
+    """
+    adapter = get_vnstock_adapter()
+    market = MarketSnapshot(adapter)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def technical_indicators(
+        indicators: list[str],
+        symbols: Optional[list[str]] = None,
+        group: Optional[str] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        interval: str = "1D",
+        mode: Literal["series", "latest"] = "latest",
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
+        """Compute technical indicators for many symbols in one call.
+
+        Args:
+            indicators: Indicator specs "name:params", e.g. ["sma:20", "ema:50",
+                "rsi:14", "macd:12,26,9", "bbands:20,2", "atr:14"]; omitted
+                parameters take these defaults.
+            symbols: Stock symbols, e.g. ["SSI", "VCB"].
+            group: Symbol group resolved via listing_symbols_by_group (e.g. VN30),
+                used when symbols is empty.
+            start: Start date (YYYY-MM-DD); leave room for the longest window.
+            end: End date (YYYY-MM-DD).
+            interval: Time interval (default: 1D).
+            mode: "latest" for the last bar of each symbol, or "series" for
+                every bar.
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates combined with AND, e.g. ["rsi_14 < 30"].
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
+
+        Returns:
+            Payload {"data": [...], "errors": {symbol: message}} with symbol,
+            time, close and one column per indicator output (e.g. sma_20,
+            macd_12_26_9, macd_signal_12_26_9).
+        """
+        try:
+            needed = required_fields(indicators)
+            symbols = await resolve_symbols(adapter, symbols, group)
+            frames, errors = await fetch_histories(adapter, symbols, start=start, end=end, interval=interval)
+
+            def compute():
+                panel = price_panel(frames, fields=needed)
+                if "close" not in panel:
+                    # No symbol returned any bar
+                    return None
+                return panel_rows(panel, compute_indicators(panel, indicators), latest=mode == "latest")
+
+            rows = await run_blocking(compute)
+            if rows is None:
+                return tool_result({"data": [], "errors": errors})
+            rows = shape_frame(rows, fields=fields, filter=filter, limit=limit, offset=offset)
+            return tool_result({**paged_data(rows, format), "errors": errors})
+        except Exception as e:
+            return error_result(e)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def correlation_matrix(
+        symbols: Optional[list[str]] = None,
+        group: Optional[str] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        interval: str = "1D",
+        statistic: Statistic = "correlation",
+        shrinkage: Shrinkage = None,
+        window: Optional[int] = None,
+        step: Optional[int] = None,
+        min_periods: int = 20,
+        layout: Literal["matrix", "pairs"] = "matrix",
+        format: OutputFormat = "split",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
+        """Pairwise correlation or covariance of returns across many symbols.
+
+        Args:
+            symbols: Stock symbols, e.g. ["SSI", "VCB"].
+            group: Symbol group resolved via listing_symbols_by_group (e.g.
+                VN30, VN100, HOSE), used when symbols is empty.
+            start: Start date (YYYY-MM-DD).
+            end: End date (YYYY-MM-DD).
+            interval: Bar interval of the returns (default: 1D).
+            statistic: "correlation" or "covariance" (default: correlation).
+            shrinkage: Shrink off-diagonal entries towards zero by this
+                intensity (0 to 1), or "auto" for the Schäfer-Strimmer estimate.
+            window: Bars per rolling window (default: the whole range).
+            step: Bars between rolling window ends (default: window).
+            min_periods: Minimum common bars of a pair (default: 20).
+            layout: "matrix" for one row per symbol and one column per
+                symbol, or "pairs" for symbol_a/symbol_b/value rows sorted by
+                strength (default: matrix).
+            format: Output layout: "records", "columns" or "split" (default: split).
+            fields: Columns to return (default: all).
+            filter: Row predicates combined with AND, e.g. ["value > 0.8"].
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
+
+        Returns:
+            Payload with the matrix (rows led by time when window is set),
+            the shrinkage intensity in notes and per-symbol fetch errors.
+        """
+        try:
+            symbols = await resolve_symbols(adapter, symbols, group)
+            frames, errors = await fetch_histories(adapter, symbols, start=start, end=end, interval=interval)
+
+            def compute():
+                panel = price_panel(frames, fields=("close",))
+                if "close" not in panel:
+                    # No symbol returned any bar
+                    return pd.DataFrame(), []
+                return correlation.correlation_rows(
+                    correlation.returns(panel["close"]),
+                    statistic=statistic,
+                    shrinkage=shrinkage,
+                    min_periods=min_periods,
+                    window=window,
+                    step=step,
+                    layout=layout,
+                )
+
+            rows, applied = await run_blocking(compute)
+            rows = shape_frame(rows, fields=fields, filter=filter, limit=limit, offset=offset)
+            payload = {**paged_data(rows, format), "errors": errors}
+            if applied:
+                payload["notes"] = [
+                    f"Shrinkage intensity {min(applied):.4f}"
+                    if min(applied) == max(applied)
+                    else f"Shrinkage intensity {min(applied):.4f} to {max(applied):.4f} across windows"
+                ]
+            return tool_result(payload)
+        except Exception as e:
+            return error_result(e)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def backtest(
+        weights: Optional[dict[str, float]] = None,
+        signal: Optional[str] = None,
+        rank: Optional[str] = None,
+        top: Optional[int] = None,
+        indicators: Optional[list[str]] = None,
+        symbols: Optional[list[str]] = None,
+        group: Optional[str] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        rebalance: Literal["daily", "weekly", "monthly", "quarterly"] = "monthly",
+        capital: float = 1e9,
+        fee_bps: float = 15,
+        sell_tax_bps: float = 10,
+        exchange: Literal["HOSE", "HNX", "UPCOM"] = "HOSE",
+        output: Literal["summary", "equity", "trades"] = "summary",
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
+        """Backtest a long-only portfolio on daily bars.
+
+        The portfolio is rebalanced on the first bar of each period, either
+        to fixed weights or to equal weights over the symbols matching a
+        signal on the previous bar. Orders use exchange price steps, round
+        lots of 100 shares, brokerage fees and the sales tax.
+
+        Args:
+            weights: Fixed target weights, e.g. {"VCB": 0.5, "FPT": 0.3};
+                the rest is held as cash.
+            signal: Holding rule instead of weights, an expression over
+                open/high/low/close/volume and the indicator outputs, e.g.
+                "close > sma_200 and rsi_14 < 70".
+            rank: Expression ranking signalled symbols, highest first, e.g.
+                "close / sma_200".
+            top: Hold at most this many signalled symbols (by rank).
+            indicators: Indicator specs the signal uses, e.g. ["sma:200", "rsi"].
+            symbols: Universe (default: the keys of weights).
+            group: Symbol group resolved via listing_symbols_by_group (e.g.
+                VN100), used when symbols and weights are empty.
+            start: Start date (YYYY-MM-DD); leave room for indicator windows.
+            end: End date (YYYY-MM-DD).
+            rebalance: "daily", "weekly", "monthly" or "quarterly" (default: monthly).
+            capital: Starting cash in VND (default: 1 billion).
+            fee_bps: Brokerage fee per trade in basis points (default: 15).
+            sell_tax_bps: Tax on sales in basis points (default: 10).
+            exchange: Exchange whose price steps apply (default: HOSE).
+            output: "summary" (one row of statistics), "equity" (daily
+                equity, return, drawdown and exposure) or "trades".
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates combined with AND, e.g. ["symbol == FPT"].
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
+
+        Returns:
+            Payload with the requested output and per-symbol fetch errors.
+        """
+        try:
+            if (weights is None) == (signal is None):
+                raise ValueError("Pass exactly one of weights or signal")
+            symbols = await resolve_symbols(adapter, symbols or list(weights or {}), group)
+            frames, errors = await fetch_histories(adapter, symbols, start=start, end=end)
+
+            def simulate():
+                panel = price_panel(frames, fields=PANEL_FIELDS if signal else ("close",))
+                if "close" not in panel:
+                    # No symbol returned any bar
+                    return None
+                close = panel["close"]
+                if weights is not None:
+                    targets = static_weights(weights, list(close.columns), len(close))
+                else:
+                    names = {**panel, **compute_indicators(panel, indicators or [])}
+                    targets = signal_weights(names, signal, rank=rank, top=top)
+                return run_backtest(
+                    close,
+                    targets,
+                    rebalance=rebalance,
+                    capital=capital,
+                    fee_bps=fee_bps,
+                    sell_tax_bps=sell_tax_bps,
+                    exchange=exchange,
+                    lag=0 if weights is not None else 1,
+                )
+
+            result = await run_blocking(simulate)
+            if result is None:
+                return tool_result({"data": [], "errors": errors})
+            rows = getattr(result, output)
+            rows = shape_frame(rows, fields=fields, filter=filter, limit=limit, offset=offset)
+            return tool_result({**paged_data(rows, format), "errors": errors})
+        except Exception as e:
+            return error_result(e)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def screener_local(
+        where: Optional[str] = None,
+        sort: Optional[list[str]] = None,
+        refresh: bool = False,
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = 50,
+        offset: int = 0,
+    ) -> ToolResult:
+        """Screen the whole market locally, without calling the remote screener.
+
+        Runs over an in-memory snapshot of every listed stock (screener ratios,
+        price and liquidity joined with ICB industries), rebuilt in the
+        background every few minutes. Call with limit=1 to see the columns.
+
+        Args:
+            where: Row filter over snapshot columns with arithmetic,
+                comparisons, "in" lists and and/or/not, e.g.
+                "pe < 12 and roe > 15 and exchange in ['HOSE', 'HNX']" or
+                "market_cap / revenue > 2".
+            sort: Sort keys, each a column or expression; prefix with "-" for
+                descending, e.g. ["-roe", "pe"] or ["-(roe / pb)"].
+            refresh: Rebuild the snapshot before screening (slow).
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates combined with AND, e.g. ["icb_name2 ~ ngân hàng"].
+            limit: Maximum number of rows to return (default: 50).
+            offset: Number of rows to skip.
+
+        Returns:
+            Payload with the matching stocks; notes give the snapshot's build
+            time and age.
+        """
+        try:
+            frame, built_at = await run_blocking(market.get, refresh)
+
+            def screen():
+                result = expressions.where(frame, where) if where else frame
+                return expressions.sort_by(result, sort or [])
+
+            result = await run_blocking(screen)
+            result = shape_frame(result, fields=fields, filter=filter, limit=limit, offset=offset)
+            built = datetime.fromtimestamp(built_at).isoformat(timespec="seconds")
+            age = max(time.time() - built_at, 0) / 60
+            notes = [f"Market snapshot built {built} ({age:.0f} min ago)"]
+            return tool_result({**paged_data(result, format), "notes": notes})
+        except Exception as e:
+            return error_result(e)
@@ -0,0 +1,74 @@
+"""Tools for reading large results page by page."""
+
+from fastmcp import Context
+from fastmcp.tools.tool import ToolResult
+
+from personal_mcp.shared import cursors
+from personal_mcp.shared.payloads import (
+    OUTPUT_SCHEMA,
+    cursor_payload,
+    error_result,
+    payload_json,
+    row_count,
+    tool_result,
+)
+
+
+def setup_result_tools(server) -> None:
+    """Set up the pagination tools for the MCP server.
+
+    Data tools return results longer than ``settings.page_rows`` one page at a
+    time with a ``next_cursor`` token; these tools resolve such tokens against
+    the server-held snapshot without calling upstream again.
+
+    Args:
+        server: The FastMCP server instance.
+    """
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def next_page(cursor: str) -> ToolResult:
+        """Get the next page of a paged result.
+
+        Args:
+            cursor: The ``next_cursor`` of the previous page.
+
+        Returns:
+            Payload with the page rows, ``total`` and, unless it is the last
+            page, ``next_cursor``.
+        """
+        try:
+            return tool_result(cursor_payload(cursor))
+        except Exception as e:
+            return error_result(e)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def stream_pages(cursor: str, ctx: Context) -> ToolResult:
+        """Stream every remaining page of a paged result.
+
+        Each page is sent as the JSON message of an MCP progress notification
+        (progress counts rows sent, out of ``total``). Requests without a
+        progress token get the next page instead, as with ``next_page``.
+
+        Args:
+            cursor: The ``next_cursor`` of the previous page.
+
+        Returns:
+            Payload with ``total`` once every page has been sent.
+        """
+        try:
+            meta = ctx.request_context.meta if ctx.request_context else None
+            if meta is None or meta.progressToken is None:
+                return tool_result(cursor_payload(cursor))
+
+            start = sent = cursors.load(cursor)[3]
+            total = 0
+            next_cursor: str | None = cursor
+            while next_cursor:
+                payload = cursor_payload(next_cursor)
+                next_cursor = payload.pop("next_cursor", None)
+                total = payload["total"]
+                sent += row_count(payload) or 0
+                await ctx.report_progress(progress=sent, total=total, message=payload_json(payload))
+            return tool_result({"data": f"{sent - start} rows streamed as progress notifications", "total": total})
+        except Exception as e:
+            return error_result(e)
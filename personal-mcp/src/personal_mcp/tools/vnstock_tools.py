@@ -1,20 +1,33 @@
 """VNStock MCP tools registration.
 
 Registers all vnstock wrapper functions as MCP tools with proper parameter
-handling, response formatting, and JSON serialization.
+handling. Tools return structured payloads (see ``shared.payloads``).
 """
 
-import json
-from typing import Any, Optional
+from typing import Any, Literal, Optional
 
-import pandas as pd
+from fastmcp.tools.tool import ToolResult
 
 from personal_mcp.adapters.vnstock_adapter import get_vnstock_adapter
+from personal_mcp.shared.executor import run_blocking
+from personal_mcp.shared.frames import RowFilter, combine_histories, shape_frame, summarize_history
+from personal_mcp.shared.panels import fetch_histories, resolve_symbols
+from personal_mcp.shared.payloads import (
+    OUTPUT_SCHEMA,
+    OutputFormat,
+    error_result,
+    frame_result,
+    paged_data,
+    tool_result,
+)
 
 
 def setup_vnstock_tools(server) -> None:
     """Set up all VNStock tools for the MCP server.
 
+    Adapter calls are blocking, so every tool dispatches them through
+    ``run_blocking`` to keep the event loop responsive.
+
     Args:
         server: FastMCP server instance.
     """
@@ -24,208 +37,313 @@ def setup_vnstock_tools(server) -> None:
     # LISTING TOOLS (10 methods)
     # =========================================================================
 
-    @server.tool
-    async def listing_all_bonds(params: Optional[dict] = None) -> str:
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def listing_all_bonds(
+        params: Optional[dict] = None,
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get all bonds.
 
         Args:
             params: Additional parameters dictionary.
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates on the result columns, combined with AND.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with all bonds data.
+            Payload with all bonds data.
         """
         try:
             kwargs = params or {}
-            result = adapter.listing_all_bonds(**kwargs)
-            # Convert DataFrame to JSON if applicable
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.listing_all_bonds, **kwargs)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
-
-    @server.tool
-    async def listing_all_covered_warrant(params: Optional[dict] = None) -> str:
+            return error_result(e)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def listing_all_covered_warrant(
+        params: Optional[dict] = None,
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get all covered warrants.
 
         Args:
             params: Additional parameters dictionary.
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates on the result columns, combined with AND.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with covered warrants data.
+            Payload with covered warrants data.
         """
         try:
             kwargs = params or {}
-            result = adapter.listing_all_covered_warrant(**kwargs)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.listing_all_covered_warrant, **kwargs)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
-
-    @server.tool
-    async def listing_all_future_indices(params: Optional[dict] = None) -> str:
+            return error_result(e)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def listing_all_future_indices(
+        params: Optional[dict] = None,
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get all future indices.
 
         Args:
             params: Additional parameters dictionary.
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates on the result columns, combined with AND.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with future indices data.
+            Payload with future indices data.
         """
         try:
             kwargs = params or {}
-            result = adapter.listing_all_future_indices(**kwargs)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.listing_all_future_indices, **kwargs)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
-
-    @server.tool
-    async def listing_all_government_bonds(params: Optional[dict] = None) -> str:
+            return error_result(e)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def listing_all_government_bonds(
+        params: Optional[dict] = None,
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get all government bonds.
 
         Args:
             params: Additional parameters dictionary.
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates on the result columns, combined with AND.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with government bonds data.
+            Payload with government bonds data.
         """
         try:
             kwargs = params or {}
-            result = adapter.listing_all_government_bonds(**kwargs)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.listing_all_government_bonds, **kwargs)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
-
-    @server.tool
-    async def listing_all_symbols(params: Optional[dict] = None) -> str:
+            return error_result(e)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def listing_all_symbols(
+        params: Optional[dict] = None,
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get all symbols.
 
         Args:
             params: Additional parameters dictionary.
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates on the result columns, combined with AND.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with all symbols data.
+            Payload with all symbols data.
         """
         try:
             kwargs = params or {}
-            result = adapter.listing_all_symbols(**kwargs)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.listing_all_symbols, **kwargs)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
-
-    @server.tool
-    async def listing_history(params: Optional[dict] = None) -> str:
+            return error_result(e)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def listing_history(
+        params: Optional[dict] = None,
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get listing history.
 
         Args:
             params: Additional parameters dictionary.
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates on the result columns, combined with AND.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with listing history data.
+            Payload with listing history data.
         """
         try:
             kwargs = params or {}
-            result = adapter.listing_history(**kwargs)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.listing_history, **kwargs)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
-
-    @server.tool
-    async def listing_industries_icb(params: Optional[dict] = None) -> str:
+            return error_result(e)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def listing_industries_icb(
+        params: Optional[dict] = None,
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get industries by ICB classification.
 
         Args:
             params: Additional parameters dictionary.
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates on the result columns, combined with AND.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with industries data.
+            Payload with industries data.
         """
         try:
             kwargs = params or {}
-            result = adapter.listing_industries_icb(**kwargs)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.listing_industries_icb, **kwargs)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
-
-    @server.tool
-    async def listing_symbols_by_exchange(params: Optional[dict] = None) -> str:
+            return error_result(e)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def listing_symbols_by_exchange(
+        params: Optional[dict] = None,
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get symbols by exchange.
 
         Args:
             params: Additional parameters dictionary.
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates combined with AND, e.g. ["exchange == HOSE"].
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with symbols by exchange data.
+            Payload with symbols by exchange data.
         """
         try:
             kwargs = params or {}
-            result = adapter.listing_symbols_by_exchange(**kwargs)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.listing_symbols_by_exchange, **kwargs)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
-
-    @server.tool
-    async def listing_symbols_by_group(params: Optional[dict] = None) -> str:
+            return error_result(e)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def listing_symbols_by_group(
+        params: Optional[dict] = None,
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get symbols by group.
 
         Args:
             params: Additional parameters dictionary.
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates on the result columns, combined with AND.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with symbols by group data.
+            Payload with symbols by group data.
         """
         try:
             kwargs = params or {}
-            result = adapter.listing_symbols_by_group(**kwargs)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.listing_symbols_by_group, **kwargs)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
-
-    @server.tool
-    async def listing_symbols_by_industries(params: Optional[dict] = None) -> str:
+            return error_result(e)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def listing_symbols_by_industries(
+        params: Optional[dict] = None,
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get symbols by industries.
 
         Args:
             params: Additional parameters dictionary.
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates combined with AND, e.g. ["icb_name2 ~ ngân hàng"].
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with symbols by industries data.
+            Payload with symbols by industries data.
         """
         try:
             kwargs = params or {}
-            result = adapter.listing_symbols_by_industries(**kwargs)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.listing_symbols_by_industries, **kwargs)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
+            return error_result(e)
 
     # =========================================================================
-    # QUOTE TOOLS (3 methods)
+    # QUOTE TOOLS (4 methods)
     # =========================================================================
 
-    @server.tool
+    @server.tool(output_schema=OUTPUT_SCHEMA)
     async def quote_history(
         symbol: Optional[str] = None,
         start: Optional[str] = None,
         end: Optional[str] = None,
         interval: str = "1D",
-    ) -> str:
+        mode: Literal["bars", "summary"] = "bars",
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get quote history for a symbol.
 
         Args:
@@ -233,608 +351,972 @@ def setup_vnstock_tools(server) -> None:
             start: Start date (YYYY-MM-DD).
             end: End date (YYYY-MM-DD).
             interval: Time interval (default: 1D).
+            mode: "bars" for every bar, or "summary" for one row of statistics
+                (return, volatility, high/low, max drawdown, last close).
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates combined with AND, e.g. ["close > 20", "volume > 1000000"].
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with history data.
+            Payload with history data.
         """
         try:
-            result = adapter.quote_history(symbol=symbol, start=start, end=end, interval=interval)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.quote_history, symbol=symbol, start=start, end=end, interval=interval)
+            if mode == "summary":
+                result = summarize_history(result, interval)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
+            return error_result(e)
 
-    @server.tool
+    @server.tool(output_schema=OUTPUT_SCHEMA)
     async def quote_intraday(
-        symbol: Optional[str] = None, page_size: int = 100, page: int = 1
-    ) -> str:
+        symbol: Optional[str] = None,
+        page_size: int = 100,
+        page: int = 1,
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get intraday quote data.
 
         Args:
             symbol: Stock symbol.
             page_size: Records per page (default: 100).
             page: Page number (default: 1).
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates combined with AND, e.g. ["volume >= 10000"].
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with intraday data.
+            Payload with intraday data.
         """
         try:
-            result = adapter.quote_intraday(symbol=symbol, page_size=page_size, page=page)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.quote_intraday, symbol=symbol, page_size=page_size, page=page)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
+            return error_result(e)
 
-    @server.tool
-    async def quote_price_depth(symbol: Optional[str] = None) -> str:
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def quote_price_depth(
+        symbol: Optional[str] = None,
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get price depth data.
 
         Args:
             symbol: Stock symbol.
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates on the result columns, combined with AND.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
+
+        Returns:
+            Payload with price depth data.
+        """
+        try:
+            result = await run_blocking(adapter.quote_price_depth, symbol=symbol)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
+        except Exception as e:
+            return error_result(e)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def quote_history_batch(
+        symbols: Optional[list[str]] = None,
+        group: Optional[str] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        interval: str = "1D",
+        layout: Literal["long", "wide"] = "long",
+        mode: Literal["bars", "summary"] = "bars",
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
+        """Get quote history for many symbols in one call.
+
+        Symbols are fetched concurrently, capped per data source.
+
+        Args:
+            symbols: Stock symbols, e.g. ["SSI", "VCB"].
+            group: Symbol group resolved via listing_symbols_by_group (e.g. VN30),
+                used when symbols is empty.
+            start: Start date (YYYY-MM-DD).
+            end: End date (YYYY-MM-DD).
+            interval: Time interval (default: 1D).
+            layout: "long" (one row per symbol and bar) or "wide" (close prices,
+                one column per symbol).
+            mode: "bars" for every bar, or "summary" for one row of statistics
+                per symbol (layout is then ignored).
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates combined with AND, e.g. ["symbol == SSI", "close > 20"].
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with price depth data.
+            Payload {"data": [...], "errors": {symbol: message}}.
         """
         try:
-            result = adapter.quote_price_depth(symbol=symbol)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            symbols = await resolve_symbols(adapter, symbols, group)
+            frames, errors = await fetch_histories(adapter, symbols, start=start, end=end, interval=interval)
+            if mode == "summary":
+                combined = combine_histories({s: summarize_history(f, interval) for s, f in frames.items()})
+            else:
+                combined = combine_histories(frames, layout=layout)
+            combined = shape_frame(combined, fields=fields, filter=filter, limit=limit, offset=offset)
+            return tool_result({**paged_data(combined, format), "errors": errors})
         except Exception as e:
-            return json.dumps({"error": str(e)})
+            return error_result(e)
 
     # =========================================================================
     # TRADING TOOLS (9 methods)
     # =========================================================================
 
-    @server.tool
-    async def trading_foreign_trade(params: Optional[dict] = None) -> str:
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def trading_foreign_trade(
+        params: Optional[dict] = None,
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get foreign trade data.
 
         Args:
             params: Additional parameters dictionary.
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates on the result columns, combined with AND.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with foreign trade data.
+            Payload with foreign trade data.
         """
         try:
             kwargs = params or {}
-            result = adapter.trading_foreign_trade(**kwargs)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.trading_foreign_trade, **kwargs)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
-
-    @server.tool
-    async def trading_history(params: Optional[dict] = None) -> str:
+            return error_result(e)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def trading_history(
+        params: Optional[dict] = None,
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get trading history.
 
         Args:
             params: Additional parameters dictionary.
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates on the result columns, combined with AND.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with trading history data.
+            Payload with trading history data.
         """
         try:
             kwargs = params or {}
-            result = adapter.trading_history(**kwargs)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.trading_history, **kwargs)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
-
-    @server.tool
-    async def trading_insider_deal(params: Optional[dict] = None) -> str:
+            return error_result(e)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def trading_insider_deal(
+        params: Optional[dict] = None,
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get insider deals.
 
         Args:
             params: Additional parameters dictionary.
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates on the result columns, combined with AND.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with insider deals data.
+            Payload with insider deals data.
         """
         try:
             kwargs = params or {}
-            result = adapter.trading_insider_deal(**kwargs)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.trading_insider_deal, **kwargs)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
-
-    @server.tool
-    async def trading_order_stats(params: Optional[dict] = None) -> str:
+            return error_result(e)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def trading_order_stats(
+        params: Optional[dict] = None,
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get order statistics.
 
         Args:
             params: Additional parameters dictionary.
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates on the result columns, combined with AND.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with order statistics data.
+            Payload with order statistics data.
         """
         try:
             kwargs = params or {}
-            result = adapter.trading_order_stats(**kwargs)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.trading_order_stats, **kwargs)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
-
-    @server.tool
-    async def trading_price_board(params: Optional[dict] = None) -> str:
+            return error_result(e)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def trading_price_board(
+        params: Optional[dict] = None,
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get price board data.
 
         Args:
             params: Additional parameters dictionary.
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates on the result columns, combined with AND.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with price board data.
+            Payload with price board data.
         """
         try:
             kwargs = params or {}
-            result = adapter.trading_price_board(**kwargs)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.trading_price_board, **kwargs)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
-
-    @server.tool
-    async def trading_price_history(params: Optional[dict] = None) -> str:
+            return error_result(e)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def trading_price_history(
+        params: Optional[dict] = None,
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get price history.
 
         Args:
             params: Additional parameters dictionary.
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates on the result columns, combined with AND.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with price history data.
+            Payload with price history data.
         """
         try:
             kwargs = params or {}
-            result = adapter.trading_price_history(**kwargs)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.trading_price_history, **kwargs)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
-
-    @server.tool
-    async def trading_prop_trade(params: Optional[dict] = None) -> str:
+            return error_result(e)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def trading_prop_trade(
+        params: Optional[dict] = None,
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get proprietary trade data.
 
         Args:
             params: Additional parameters dictionary.
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates on the result columns, combined with AND.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with proprietary trade data.
+            Payload with proprietary trade data.
         """
         try:
             kwargs = params or {}
-            result = adapter.trading_prop_trade(**kwargs)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.trading_prop_trade, **kwargs)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
-
-    @server.tool
-    async def trading_side_stats(params: Optional[dict] = None) -> str:
+            return error_result(e)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def trading_side_stats(
+        params: Optional[dict] = None,
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get side statistics.
 
         Args:
             params: Additional parameters dictionary.
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates on the result columns, combined with AND.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with side statistics data.
+            Payload with side statistics data.
         """
         try:
             kwargs = params or {}
-            result = adapter.trading_side_stats(**kwargs)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.trading_side_stats, **kwargs)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
-
-    @server.tool
-    async def trading_trading_stats(params: Optional[dict] = None) -> str:
+            return error_result(e)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def trading_trading_stats(
+        params: Optional[dict] = None,
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get trading statistics.
 
         Args:
             params: Additional parameters dictionary.
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates on the result columns, combined with AND.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with trading statistics data.
+            Payload with trading statistics data.
         """
         try:
             kwargs = params or {}
-            result = adapter.trading_trading_stats(**kwargs)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.trading_trading_stats, **kwargs)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
+            return error_result(e)
 
     # =========================================================================
     # FINANCE TOOLS (5 methods)
     # =========================================================================
 
-    @server.tool
-    async def finance_balance_sheet(params: Optional[dict] = None) -> str:
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def finance_balance_sheet(
+        params: Optional[dict] = None,
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get balance sheet data.
 
         Args:
             params: Additional parameters dictionary.
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates on the result columns, combined with AND.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with balance sheet data.
+            Payload with balance sheet data.
         """
         try:
             kwargs = params or {}
-            result = adapter.finance_balance_sheet(**kwargs)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.finance_balance_sheet, **kwargs)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
-
-    @server.tool
-    async def finance_cash_flow(params: Optional[dict] = None) -> str:
+            return error_result(e)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def finance_cash_flow(
+        params: Optional[dict] = None,
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get cash flow data.
 
         Args:
             params: Additional parameters dictionary.
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates on the result columns, combined with AND.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with cash flow data.
+            Payload with cash flow data.
         """
         try:
             kwargs = params or {}
-            result = adapter.finance_cash_flow(**kwargs)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.finance_cash_flow, **kwargs)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
-
-    @server.tool
-    async def finance_history(params: Optional[dict] = None) -> str:
+            return error_result(e)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def finance_history(
+        params: Optional[dict] = None,
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get finance history.
 
         Args:
             params: Additional parameters dictionary.
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates on the result columns, combined with AND.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with finance history data.
+            Payload with finance history data.
         """
         try:
             kwargs = params or {}
-            result = adapter.finance_history(**kwargs)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.finance_history, **kwargs)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
-
-    @server.tool
-    async def finance_income_statement(params: Optional[dict] = None) -> str:
+            return error_result(e)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def finance_income_statement(
+        params: Optional[dict] = None,
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get income statement data.
 
         Args:
             params: Additional parameters dictionary.
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates on the result columns, combined with AND.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with income statement data.
+            Payload with income statement data.
         """
         try:
             kwargs = params or {}
-            result = adapter.finance_income_statement(**kwargs)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.finance_income_statement, **kwargs)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
-
-    @server.tool
-    async def finance_ratio(params: Optional[dict] = None) -> str:
+            return error_result(e)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def finance_ratio(
+        params: Optional[dict] = None,
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get financial ratios.
 
         Args:
             params: Additional parameters dictionary.
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates on the result columns, combined with AND.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with financial ratios data.
+            Payload with financial ratios data.
         """
         try:
             kwargs = params or {}
-            result = adapter.finance_ratio(**kwargs)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.finance_ratio, **kwargs)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
+            return error_result(e)
 
     # =========================================================================
     # COMPANY TOOLS (8 methods)
     # =========================================================================
 
-    @server.tool
-    async def company_affiliate(params: Optional[dict] = None) -> str:
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def company_affiliate(
+        params: Optional[dict] = None,
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get company affiliates.
 
         Args:
             params: Additional parameters dictionary.
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates on the result columns, combined with AND.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with affiliate data.
+            Payload with affiliate data.
         """
         try:
             kwargs = params or {}
-            result = adapter.company_affiliate(**kwargs)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.company_affiliate, **kwargs)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
-
-    @server.tool
-    async def company_events(params: Optional[dict] = None) -> str:
+            return error_result(e)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def company_events(
+        params: Optional[dict] = None,
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get company events.
 
         Args:
             params: Additional parameters dictionary.
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates on the result columns, combined with AND.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with company events data.
+            Payload with company events data.
         """
         try:
             kwargs = params or {}
-            result = adapter.company_events(**kwargs)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.company_events, **kwargs)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
-
-    @server.tool
-    async def company_history(params: Optional[dict] = None) -> str:
+            return error_result(e)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def company_history(
+        params: Optional[dict] = None,
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get company history.
 
         Args:
             params: Additional parameters dictionary.
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates on the result columns, combined with AND.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with company history data.
+            Payload with company history data.
         """
         try:
             kwargs = params or {}
-            result = adapter.company_history(**kwargs)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.company_history, **kwargs)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
-
-    @server.tool
-    async def company_news(params: Optional[dict] = None) -> str:
+            return error_result(e)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def company_news(
+        params: Optional[dict] = None,
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get company news.
 
         Args:
             params: Additional parameters dictionary.
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates on the result columns, combined with AND.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with company news data.
+            Payload with company news data.
         """
         try:
             kwargs = params or {}
-            result = adapter.company_news(**kwargs)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.company_news, **kwargs)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
-
-    @server.tool
-    async def company_officers(params: Optional[dict] = None) -> str:
+            return error_result(e)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def company_officers(
+        params: Optional[dict] = None,
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get company officers.
 
         Args:
             params: Additional parameters dictionary.
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates on the result columns, combined with AND.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with company officers data.
+            Payload with company officers data.
         """
         try:
             kwargs = params or {}
-            result = adapter.company_officers(**kwargs)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.company_officers, **kwargs)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
-
-    @server.tool
-    async def company_overview(params: Optional[dict] = None) -> str:
+            return error_result(e)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def company_overview(
+        params: Optional[dict] = None,
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get company overview.
 
         Args:
             params: Additional parameters dictionary.
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates on the result columns, combined with AND.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with company overview data.
+            Payload with company overview data.
         """
         try:
             kwargs = params or {}
-            result = adapter.company_overview(**kwargs)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.company_overview, **kwargs)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
-
-    @server.tool
-    async def company_shareholders(params: Optional[dict] = None) -> str:
+            return error_result(e)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def company_shareholders(
+        params: Optional[dict] = None,
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get company shareholders.
 
         Args:
             params: Additional parameters dictionary.
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates on the result columns, combined with AND.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with company shareholders data.
+            Payload with company shareholders data.
         """
         try:
             kwargs = params or {}
-            result = adapter.company_shareholders(**kwargs)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.company_shareholders, **kwargs)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
-
-    @server.tool
-    async def company_subsidiaries(params: Optional[dict] = None) -> str:
+            return error_result(e)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def company_subsidiaries(
+        params: Optional[dict] = None,
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get company subsidiaries.
 
         Args:
             params: Additional parameters dictionary.
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates on the result columns, combined with AND.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with company subsidiaries data.
+            Payload with company subsidiaries data.
         """
         try:
             kwargs = params or {}
-            result = adapter.company_subsidiaries(**kwargs)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.company_subsidiaries, **kwargs)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
+            return error_result(e)
 
     # =========================================================================
     # FUND TOOLS (7 methods)
     # =========================================================================
 
-    @server.tool
-    async def fund_asset_holding(fund_id: int = 23) -> str:
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def fund_asset_holding(
+        fund_id: int = 23,
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get fund asset holdings.
 
         Args:
             fund_id: Fund ID (default: 23).
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates on the result columns, combined with AND.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with asset holding data.
+            Payload with asset holding data.
         """
         try:
-            result = adapter.fund_asset_holding(fund_id=fund_id)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.fund_asset_holding, fund_id=fund_id)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
-
-    @server.tool
-    async def fund_filter(symbol: str = "") -> str:
+            return error_result(e)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def fund_filter(
+        symbol: str = "",
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Filter funds by symbol.
 
         Args:
             symbol: Fund symbol (optional).
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates on the result columns, combined with AND.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with filtered fund data.
+            Payload with filtered fund data.
         """
         try:
-            result = adapter.fund_filter(symbol=symbol)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.fund_filter, symbol=symbol)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
-
-    @server.tool
-    async def fund_industry_holding(fund_id: int = 23) -> str:
+            return error_result(e)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def fund_industry_holding(
+        fund_id: int = 23,
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get fund industry holdings.
 
         Args:
             fund_id: Fund ID (default: 23).
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates on the result columns, combined with AND.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with industry holding data.
+            Payload with industry holding data.
         """
         try:
-            result = adapter.fund_industry_holding(fund_id=fund_id)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.fund_industry_holding, fund_id=fund_id)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
-
-    @server.tool
-    async def fund_listing(fund_type: str = "") -> str:
+            return error_result(e)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def fund_listing(
+        fund_type: str = "",
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get fund listings.
 
         Args:
             fund_type: Fund type (optional).
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates on the result columns, combined with AND.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with fund listing data.
+            Payload with fund listing data.
         """
         try:
-            result = adapter.fund_listing(fund_type=fund_type)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.fund_listing, fund_type=fund_type)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
-
-    @server.tool
-    async def fund_nav_report(fund_id: int = 23) -> str:
+            return error_result(e)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def fund_nav_report(
+        fund_id: int = 23,
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get fund NAV report.
 
         Args:
             fund_id: Fund ID (default: 23).
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates on the result columns, combined with AND.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with NAV report data.
+            Payload with NAV report data.
         """
         try:
-            result = adapter.fund_nav_report(fund_id=fund_id)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.fund_nav_report, fund_id=fund_id)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
-
-    @server.tool
-    async def fund_top_holding(fund_id: int = 23) -> str:
+            return error_result(e)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def fund_top_holding(
+        fund_id: int = 23,
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> ToolResult:
         """Get fund top holdings.
 
         Args:
             fund_id: Fund ID (default: 23).
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates on the result columns, combined with AND.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
 
         Returns:
-            JSON string with top holding data.
+            Payload with top holding data.
         """
         try:
-            result = adapter.fund_top_holding(fund_id=fund_id)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.fund_top_holding, fund_id=fund_id)
+            return frame_result(result, format, fields=fields, filter=filter, limit=limit, offset=offset)
         except Exception as e:
-            return json.dumps({"error": str(e)})
+            return error_result(e)
 
     # =========================================================================
     # SCREENER TOOLS (1 method)
     # =========================================================================
 
-    @server.tool
+    @server.tool(output_schema=OUTPUT_SCHEMA)
     async def screener_stock(
-        params: Optional[dict] = None, limit: int = 50, id: Optional[str] = None, lang: str = "vi"
-    ) -> str:
+        params: Optional[dict] = None,
+        limit: int = 50,
+        id: Optional[str] = None,
+        lang: str = "vi",
+        format: OutputFormat = "records",
+        fields: Optional[list[str]] = None,
+        filter: RowFilter = None,
+    ) -> ToolResult:
         """Screen stocks based on parameters.
 
         Args:
@@ -842,24 +1324,25 @@ def setup_vnstock_tools(server) -> None:
             limit: Maximum number of results (default: 50).
             id: Screener ID (optional).
             lang: Language (default: 'vi').
+            format: Output layout: "records", "columns" or "split" (default: records).
+            fields: Columns to return (default: all).
+            filter: Row predicates on the result columns, combined with AND.
 
         Returns:
-            JSON string with screened stock data.
+            Payload with screened stock data.
         """
         try:
-            result = adapter.screener_stock(params=params, limit=limit, id=id, lang=lang)
-            if isinstance(result, pd.DataFrame):
-                return result.to_json(orient="records")
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.screener_stock, params=params, limit=limit, id=id, lang=lang)
+            return frame_result(result, format, fields=fields, filter=filter)
         except Exception as e:
-            return json.dumps({"error": str(e)})
+            return error_result(e)
 
     # =========================================================================
     # VNSTOCK ROOT TOOLS (5 methods)
     # =========================================================================
 
-    @server.tool
-    async def vnstock_stock(symbol: Optional[str] = None, source: Optional[str] = None) -> str:
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def vnstock_stock(symbol: Optional[str] = None, source: Optional[str] = None) -> ToolResult:
         """Get stock components.
 
         Args:
@@ -867,32 +1350,32 @@ def setup_vnstock_tools(server) -> None:
             source: Data source.
 
         Returns:
-            JSON string with stock components.
+            Payload with stock components.
         """
         try:
-            result = adapter.vnstock_stock(symbol=symbol, source=source)
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.vnstock_stock, symbol=symbol, source=source)
+            return frame_result(result)
         except Exception as e:
-            return json.dumps({"error": str(e)})
+            return error_result(e)
 
-    @server.tool
-    async def vnstock_fund(source: str = "FMARKET") -> str:
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def vnstock_fund(source: str = "FMARKET") -> ToolResult:
         """Get fund components.
 
         Args:
             source: Data source (default: 'FMARKET').
 
         Returns:
-            JSON string with fund components.
+            Payload with fund components.
         """
         try:
-            result = adapter.vnstock_fund(source=source)
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.vnstock_fund, source=source)
+            return frame_result(result)
         except Exception as e:
-            return json.dumps({"error": str(e)})
+            return error_result(e)
 
-    @server.tool
-    async def vnstock_crypto(symbol: Optional[str] = "BTC", source: Optional[str] = "MSN") -> str:
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def vnstock_crypto(symbol: Optional[str] = "BTC", source: Optional[str] = "MSN") -> ToolResult:
         """Get crypto components.
 
         Args:
@@ -900,16 +1383,16 @@ def setup_vnstock_tools(server) -> None:
             source: Data source (default: 'MSN').
 
         Returns:
-            JSON string with crypto components.
+            Payload with crypto components.
         """
         try:
-            result = adapter.vnstock_crypto(symbol=symbol, source=source)
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.vnstock_crypto, symbol=symbol, source=source)
+            return frame_result(result)
         except Exception as e:
-            return json.dumps({"error": str(e)})
+            return error_result(e)
 
-    @server.tool
-    async def vnstock_fx(symbol: Optional[str] = "EURUSD", source: Optional[str] = "MSN") -> str:
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def vnstock_fx(symbol: Optional[str] = "EURUSD", source: Optional[str] = "MSN") -> ToolResult:
         """Get forex components.
 
         Args:
@@ -917,16 +1400,16 @@ def setup_vnstock_tools(server) -> None:
             source: Data source (default: 'MSN').
 
         Returns:
-            JSON string with forex components.
+            Payload with forex components.
         """
         try:
-            result = adapter.vnstock_fx(symbol=symbol, source=source)
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.vnstock_fx, symbol=symbol, source=source)
+            return frame_result(result)
         except Exception as e:
-            return json.dumps({"error": str(e)})
+            return error_result(e)
 
-    @server.tool
-    async def vnstock_world_index(symbol: Optional[str] = "DJI", source: Optional[str] = "MSN") -> str:
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def vnstock_world_index(symbol: Optional[str] = "DJI", source: Optional[str] = "MSN") -> ToolResult:
         """Get world index components.
 
         Args:
@@ -934,10 +1417,10 @@ def setup_vnstock_tools(server) -> None:
             source: Data source (default: 'MSN').
 
         Returns:
-            JSON string with world index components.
+            Payload with world index components.
         """
         try:
-            result = adapter.vnstock_world_index(symbol=symbol, source=source)
-            return json.dumps({"data": str(result)})
+            result = await run_blocking(adapter.vnstock_world_index, symbol=symbol, source=source)
+            return frame_result(result)
         except Exception as e:
-            return json.dumps({"error": str(e)})
+            return error_result(e)
@@ -0,0 +1,28 @@
+"""
+Tests for VNStockAdapter construction.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from personal_mcp.adapters.vnstock_adapter import VNStockAdapter
+
+
+def test_construction_does_not_build_clients():
+    adapter = VNStockAdapter()
+
+    assert not any(name in adapter.__dict__ for name in ("_listing", "_trading", "_fund", "_screener"))
+
+
+def test_client_is_built_once_under_concurrency():
+    adapter = VNStockAdapter()
+    built = []
+
+    def factory():
+        built.append(1)
+        return object()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        clients = list(pool.map(lambda _: adapter._client("_fake", factory), range(32)))
+
+    assert len(built) == 1
+    assert all(c is clients[0] for c in clients)
@@ -0,0 +1,140 @@
+"""
+Tests for the vectorized backtest engine and the backtest tool.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from fastmcp import Client, FastMCP
+
+from personal_mcp.adapters import vnstock_adapter
+from personal_mcp.shared.backtest import (
+    price_steps,
+    rebalance_rows,
+    run_backtest,
+    signal_weights,
+    static_weights,
+)
+from personal_mcp.shared.panels import price_panel
+from personal_mcp.tools.analytics_tools import setup_analytics_tools
+
+TIMES = pd.bdate_range("2025-01-01", periods=60)
+
+
+def _close(**columns) -> pd.DataFrame:
+    return pd.DataFrame({s: np.asarray(c, dtype=float) for s, c in columns.items()}, index=TIMES)
+
+
+def test_price_steps_and_rebalance_rows():
+    assert price_steps(np.array([9_990, 10_000, 49_950, 50_000, np.nan])).tolist() == [10, 50, 50, 100, 10]
+    assert price_steps(np.array([5_000]), "HNX").tolist() == [100]
+    # First bar, then the first bar of February and March
+    assert rebalance_rows(TIMES, "monthly").tolist() == [0, 23, 43]
+    with pytest.raises(ValueError, match="rebalance"):
+        rebalance_rows(TIMES, "hourly")
+
+
+def test_orders_follow_lots_price_steps_and_costs():
+    # 23.47 thousand VND is not on the 50 VND step: buys at 23,500
+    close = _close(AAA=np.full(60, 23.47))
+
+    result = run_backtest(close, static_weights({"AAA": 1.0}, ["AAA"], 60), capital=100_000_000, lag=0)
+
+    (trade,) = result.trades.itertuples()
+    assert trade.time == TIMES[0] and trade.price == 23_500
+    assert trade.shares == 4200 and trade.shares % 100 == 0
+    assert trade.cost == pytest.approx(trade.value * 0.0015)
+    # Marked at the unrounded close after paying the step and the fee
+    assert result.equity["equity"].tolist() == pytest.approx([100_000_000 - 4200 * 30 - trade.cost] * 60)
+    assert result.summary.loc[0, "trades"] == 1
+
+
+def test_float32_prices_stay_on_the_step_grid():
+    close = _close(AAA=np.full(60, 23.45, dtype=np.float32))
+
+    result = run_backtest(close, static_weights({"AAA": 1.0}, ["AAA"], 60), rebalance="weekly")
+
+    assert (result.trades["price"] == 23_450).all()
+
+
+def test_rebalancing_sells_with_tax_and_keeps_cash_non_negative():
+    rising = np.linspace(10, 30, 60)
+    close = _close(AAA=rising, BBB=np.full(60, 10.0))
+
+    result = run_backtest(close, static_weights({"AAA": 0.5, "BBB": 0.5}, ["AAA", "BBB"], 60), rebalance="weekly")
+
+    sells = result.trades[result.trades["shares"] < 0]
+    assert not sells.empty and (sells["symbol"] == "AAA").all()
+    assert sells["cost"].to_numpy() == pytest.approx(-sells["value"].to_numpy() * 0.0025)
+    assert (result.equity["exposure"] <= 1).all()
+
+
+def test_signal_weights_select_top_ranked_symbols_on_the_previous_bar():
+    close = _close(AAA=np.arange(60) + 10, BBB=np.full(60, 20.0), CCC=60 - np.arange(60))
+    panel = {"close": close}
+
+    weights = signal_weights(panel, "close > 15", rank="close", top=1)
+    result = run_backtest(close, weights, rebalance="daily")
+
+    # On bar 10 AAA (20) ties with BBB and loses on column order; CCC leads
+    assert weights[10].tolist() == [0.0, 0.0, 1.0]
+    assert weights[59].tolist() == [1.0, 0.0, 0.0]
+    # The first trade uses the signal of bar 0 on bar 1
+    assert result.trades["time"].iloc[0] == TIMES[1]
+    with pytest.raises(ValueError, match="true/false"):
+        signal_weights(panel, "close + 1")
+
+
+def test_static_weights_are_validated():
+    with pytest.raises(ValueError, match="at most 1"):
+        static_weights({"AAA": 0.7, "BBB": 0.5}, ["AAA", "BBB"], 5)
+    with pytest.raises(ValueError, match="negative"):
+        static_weights({"AAA": -0.1}, ["AAA"], 5)
+
+
+class _Adapter:
+    def quote_history(self, symbol, start=None, end=None, interval="1D"):
+        if symbol == "BAD":
+            raise ValueError("no data")
+        close = np.linspace(20, 40, 60) if symbol == "AAA" else np.full(60, 15.0)
+        return pd.DataFrame({"time": TIMES, "open": close, "high": close, "low": close, "close": close, "volume": 1e5})
+
+    def listing_symbols_by_group(self, group):
+        return pd.Series(["AAA", "BBB", "BAD"])
+
+
+@pytest.mark.asyncio
+async def test_backtest_tool(monkeypatch):
+    monkeypatch.setattr(vnstock_adapter, "_adapter_instance", _Adapter())
+    server = FastMCP("test")
+    setup_analytics_tools(server)
+
+    async with Client(server) as client:
+        fixed = await client.call_tool("backtest", {"weights": {"AAA": 0.6, "BBB": 0.4}})
+        signal = await client.call_tool(
+            "backtest",
+            {"signal": "close > sma_5", "indicators": ["sma:5"], "group": "VN30", "output": "trades"},
+        )
+        invalid = await client.call_tool("backtest", {"symbols": ["AAA"]})
+
+    (summary,) = fixed.structured_content["data"]
+    assert summary["total_return"] > 0 and summary["rebalances"] == 3
+    payload = signal.structured_content
+    assert {row["symbol"] for row in payload["data"]} == {"AAA"}
+    assert payload["errors"] == {"BAD": "no data"}
+    assert "exactly one" in invalid.structured_content["error"]
+
+
+def test_first_period_trades_on_the_first_bar_with_weights():
+    frames = {s: _Adapter().quote_history(s) for s in ("AAA", "BBB")}
+    close = price_panel(frames, fields=("close",))["close"]
+    weights = static_weights({"AAA": 1.0}, list(close.columns), len(close))
+
+    # Every bar falls in the first quarter: it must not be spent in cash
+    lagged = run_backtest(close, weights, rebalance="quarterly")
+    upfront = run_backtest(close, weights, rebalance="quarterly", lag=0)
+
+    assert lagged.trades["time"].tolist() == [TIMES[1]]
+    assert upfront.trades["time"].tolist() == [TIMES[0]]
+    assert upfront.summary.loc[0, "rebalances"] == 1
+    assert upfront.equity["equity"].iloc[-1] > 1.9e9
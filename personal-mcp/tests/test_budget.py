@@ -0,0 +1,85 @@
+"""
+Tests for size-budgeted tool payloads.
+"""
+
+import numpy as np
+import pandas as pd
+import pydantic_core
+import pytest
+from fastmcp import Client, FastMCP
+from fastmcp.tools.tool import ToolResult
+
+from personal_mcp.middwares import ResultBudgetMiddleware
+from personal_mcp.shared.budget import fit_payload
+from personal_mcp.shared.payloads import OUTPUT_SCHEMA, frame_data, frame_result
+
+
+def _size(payload: dict) -> int:
+    return len(pydantic_core.to_json(payload, inf_nan_mode="null"))
+
+
+def _history(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "time": pd.bdate_range("2020-01-01", periods=rows),
+            "close": rng.random(rows) * 100,
+            "volume": rng.integers(0, 10**6, rows),
+            "source": "VCI",
+        }
+    )
+
+
+def test_payload_within_budget_is_unchanged():
+    payload = frame_data(_history(5))
+
+    assert fit_payload(payload, 10_000) is payload
+
+
+def test_long_tables_are_rounded_and_downsampled():
+    payload = frame_data(_history(2000), "columns")
+
+    fitted = fit_payload(payload, 20_000)
+
+    assert _size(fitted) <= 20_000
+    times = fitted["data"]["time"]
+    assert times[0] == payload["data"]["time"][0] and times[-1] == payload["data"]["time"][-1]
+    assert "source" not in fitted["data"]
+    assert fitted["notes"][-1].startswith("kept ")
+
+
+def test_wide_tables_drop_trailing_columns_but_keep_keys():
+    frame = pd.DataFrame(np.random.default_rng(0).random((20, 60)), columns=[f"r{i}" for i in range(60)])
+    frame.insert(0, "ticker", [f"T{i}" for i in range(20)])
+
+    fitted = fit_payload(frame_data(frame), 3_000)
+
+    assert _size(fitted) <= 3_000
+    assert list(fitted["data"][0])[:2] == ["ticker", "r0"]
+
+
+def test_tiny_budget_falls_back_to_statistics():
+    fitted = fit_payload(frame_data(_history(2000)), 650)
+
+    assert fitted["notes"] == ["replaced 2000 rows by per-column statistics"]
+    assert [row["column"] for row in fitted["data"]] == ["time", "close", "volume", "source"]
+
+
+@pytest.mark.asyncio
+async def test_middleware_advertises_and_applies_budget():
+    server = FastMCP("budget")
+    server.add_middleware(ResultBudgetMiddleware())
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def bars() -> ToolResult:
+        return frame_result(_history(500))
+
+    async with Client(server) as client:
+        tools = await client.list_tools()
+        full = await client.call_tool("bars", {})
+        small = await client.call_tool("bars", {"max_tokens": 1000})
+
+    assert {"max_tokens", "max_bytes"} <= set(tools[0].inputSchema["properties"])
+    assert len(full.structured_content["data"]) == 500
+    assert len(small.content[0].text) <= 4000
+    assert small.structured_content["notes"]
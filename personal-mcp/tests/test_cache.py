@@ -0,0 +1,102 @@
+"""
+Tests for the adapter response cache.
+"""
+
+import time
+from datetime import datetime
+
+import pandas as pd
+
+from personal_mcp.adapters.vnstock_adapter import _cached, _finance_expiry
+from personal_mcp.shared.cache import MISSING, TTLCache, sizeof
+from personal_mcp.shared.singleflight import SingleFlight
+
+
+def _frame(rows: int) -> pd.DataFrame:
+    return pd.DataFrame({"symbol": [f"S{i:04d}" for i in range(rows)], "close": range(rows)})
+
+
+def test_expired_entry_is_a_miss_unless_stale_allowed():
+    cache = TTLCache(max_bytes=1 << 20)
+    cache.set("k", "v", expires_at=time.time() - 1)
+
+    assert cache.get("k") is MISSING
+    assert cache.get("k", allow_stale=True) == "v"
+
+
+def test_byte_budget_evicts_least_recently_used():
+    frame = _frame(100)
+    cache = TTLCache(max_bytes=sizeof(frame) * 2)
+    future = time.time() + 60
+    cache.set("a", frame, future)
+    cache.set("b", frame, future)
+    cache.get("a")
+    cache.set("c", frame, future)
+
+    assert cache.get("b") is MISSING
+    assert cache.get("a") is not MISSING
+    assert cache.get("c") is not MISSING
+    assert cache.nbytes <= cache.max_bytes
+
+
+def test_value_larger_than_budget_is_not_stored():
+    cache = TTLCache(max_bytes=10)
+
+    assert cache.set("big", _frame(100), time.time() + 60) is False
+    assert len(cache) == 0
+
+
+def test_finance_expiry_outside_filing_season_is_next_filing_month():
+    may = datetime(2025, 5, 10).timestamp()
+    november = datetime(2025, 11, 10).timestamp()
+
+    assert _finance_expiry(may) == datetime(2025, 7, 1).timestamp()
+    assert _finance_expiry(november) == datetime(2026, 1, 1).timestamp()
+
+
+def test_finance_expiry_inside_filing_season_is_short():
+    april = datetime(2025, 4, 10).timestamp()
+
+    assert april < _finance_expiry(april) < april + 24 * 3600
+
+
+class _FakeAdapter:
+    def __init__(self):
+        self.cache = TTLCache(max_bytes=1 << 20)
+        self.inflight = SingleFlight()
+        self.calls = 0
+
+    @_cached("listing")
+    def listing_symbols_by_group(self, group: str = "VN30", **kwargs):
+        self.calls += 1
+        return _frame(3)
+
+
+def test_equivalent_calls_share_one_upstream_fetch():
+    adapter = _FakeAdapter()
+    adapter.listing_symbols_by_group()
+    adapter.listing_symbols_by_group("VN30")
+    adapter.listing_symbols_by_group(group="VN30")
+    adapter.listing_symbols_by_group(group="HNX30")
+
+    assert adapter.calls == 2
+
+
+def test_cached_frame_is_returned_as_copy():
+    adapter = _FakeAdapter()
+    first = adapter.listing_symbols_by_group()
+    first["extra"] = 1
+    second = adapter.listing_symbols_by_group()
+
+    assert "extra" not in second.columns
+
+
+def test_cached_frame_keeps_upstream_dtypes():
+    adapter = _FakeAdapter()
+    first = adapter.listing_symbols_by_group()
+    second = adapter.listing_symbols_by_group()
+    stored = adapter.cache.get(next(iter(adapter.cache._entries)))
+
+    # Narrowed inside the cache only
+    assert stored["close"].dtype == "int32"
+    assert first["close"].dtype == second["close"].dtype == "int64"
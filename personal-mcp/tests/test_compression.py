@@ -0,0 +1,84 @@
+"""
+Tests for HTTP response compression.
+"""
+
+import zlib
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.responses import PlainTextResponse, StreamingResponse
+from starlette.routing import Route
+
+from personal_mcp.shared.compression import CompressionMiddleware, _Gzip, negotiate
+
+BODY = '{"data": [' + ", ".join(['{"symbol": "FPT", "close": 95.5}'] * 200) + "]}"
+
+
+async def _events():
+    for i in range(3):
+        yield f"event: message\ndata: {BODY[: 100 * (i + 1)]}\n\n"
+
+
+def _app() -> Starlette:
+    return Starlette(
+        routes=[
+            Route("/small", lambda request: PlainTextResponse("ok")),
+            Route("/large", lambda request: PlainTextResponse(BODY)),
+            Route("/events", lambda request: StreamingResponse(_events(), media_type="text/event-stream")),
+        ],
+        middleware=[Middleware(CompressionMiddleware, minimum_size=500)],
+    )
+
+
+def test_negotiate_prefers_supported_codings():
+    assert negotiate("gzip, deflate") == "gzip"
+    assert negotiate("br;q=1.0, gzip;q=0.5") == "gzip"
+    assert negotiate("gzip;q=0, identity") is None
+    assert negotiate("") is None
+
+
+async def _get(path: str, accept: str = "gzip") -> httpx.Response:
+    transport = httpx.ASGITransport(app=_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(path, headers={"Accept-Encoding": accept})
+
+
+@pytest.mark.asyncio
+async def test_large_responses_are_gzipped():
+    response = await _get("/large")
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert int(response.headers["content-length"]) < len(BODY) / 5
+    assert response.text == BODY
+
+
+@pytest.mark.asyncio
+async def test_small_and_unaccepted_responses_are_left_alone():
+    small = await _get("/small")
+    identity = await _get("/large", accept="identity")
+
+    assert "content-encoding" not in small.headers
+    assert "content-encoding" not in identity.headers
+    assert identity.text == BODY
+
+
+@pytest.mark.asyncio
+async def test_event_streams_are_compressed_per_event():
+    response = await _get("/events")
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert response.text.count("event: message") == 3
+
+
+def test_gzip_chunks_decode_incrementally():
+    encoder = _Gzip(6)
+    decoder = zlib.decompressobj(zlib.MAX_WBITS | 16)
+
+    first = decoder.decompress(encoder.chunk(b"event: one\n\n"))
+    rest = decoder.decompress(encoder.finish(b"event: two\n\n"))
+
+    assert first == b"event: one\n\n"
+    assert rest == b"event: two\n\n"
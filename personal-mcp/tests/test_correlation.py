@@ -0,0 +1,110 @@
+"""
+Tests for the blocked pairwise correlation engine and the correlation_matrix tool.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from fastmcp import Client, FastMCP
+
+from personal_mcp.adapters import vnstock_adapter
+from personal_mcp.config import settings
+from personal_mcp.shared import correlation
+from personal_mcp.shared.correlation import correlation_rows, pairwise, window_ends
+from personal_mcp.tools.analytics_tools import setup_analytics_tools
+
+
+def _returns(rows=300, columns=12, seed=0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    market = rng.normal(0, 0.01, (rows, 1))
+    values = market + rng.normal(0, 0.01, (rows, columns))
+    values[rng.random(values.shape) < 0.1] = np.nan
+    return values
+
+
+@pytest.mark.parametrize("statistic, method", [("correlation", "corr"), ("covariance", "cov")])
+def test_pairwise_matches_pandas(statistic, method):
+    values = _returns()
+    expected = getattr(pd.DataFrame(values), method)(min_periods=5).to_numpy()
+
+    matrix, intensity = pairwise(values, statistic, min_periods=5)
+
+    np.testing.assert_allclose(matrix, expected, atol=1e-12)
+    assert intensity is None
+
+
+def test_blocks_give_the_same_matrix(monkeypatch):
+    values = _returns(columns=40)
+    whole, _ = pairwise(values, shrinkage="auto")
+    # Temporaries too large for more than one symbol per block
+    monkeypatch.setattr(correlation, "_BLOCK_TEMPORARIES", 10**6)
+
+    blocked, _ = pairwise(values, shrinkage="auto")
+
+    np.testing.assert_allclose(blocked, whole, atol=1e-12)
+    monkeypatch.setattr(settings, "analytics_memory_mb", 1)
+    with pytest.raises(ValueError, match="budget"):
+        pairwise(_returns(rows=5000, columns=40))
+
+
+def test_shrinkage_scales_off_diagonal_entries():
+    values = _returns()
+    sample, _ = pairwise(values)
+
+    fixed, intensity = pairwise(values, shrinkage=0.25)
+    auto, estimated = pairwise(values, shrinkage="auto")
+
+    assert intensity == 0.25
+    np.testing.assert_allclose(np.diag(fixed), 1.0)
+    off = ~np.eye(len(sample), dtype=bool)
+    np.testing.assert_allclose(fixed[off], 0.75 * sample[off])
+    # Strong common factor over 300 bars: little shrinkage is needed
+    assert 0 < estimated < 0.25
+    with pytest.raises(ValueError, match="shrinkage"):
+        pairwise(values, shrinkage=1.5)
+
+
+def test_rolling_windows():
+    index = pd.bdate_range("2025-01-01", periods=100)
+    panel = pd.DataFrame(_returns(rows=100, columns=3), index=index, columns=["AAA", "BBB", "CCC"])
+
+    rows, applied = correlation_rows(panel, window=40, step=30, layout="pairs", min_periods=10)
+
+    assert window_ends(100, 40, 30) == [40, 70, 100]
+    assert rows["time"].unique().tolist() == [index[39], index[69], index[99]]
+    assert len(rows) == 3 * 3
+    assert applied == []
+
+
+class _Adapter:
+    def quote_history(self, symbol, start=None, end=None, interval="1D"):
+        if symbol == "BAD":
+            raise ValueError("no data")
+        rng = np.random.default_rng(len(symbol) + ord(symbol[0]))
+        close = 10 * np.exp(rng.normal(0, 0.02, 60).cumsum())
+        return pd.DataFrame({"time": pd.bdate_range("2025-01-01", periods=60), "close": close})
+
+    def listing_symbols_by_group(self, group):
+        return pd.Series(["AAA", "BB", "BAD"])
+
+
+@pytest.mark.asyncio
+async def test_tool_returns_compact_matrix(monkeypatch):
+    monkeypatch.setattr(vnstock_adapter, "_adapter_instance", _Adapter())
+    server = FastMCP("test")
+    setup_analytics_tools(server)
+
+    async with Client(server) as client:
+        matrix = await client.call_tool("correlation_matrix", {"group": "VN30", "shrinkage": 0.5})
+        pairs = await client.call_tool(
+            "correlation_matrix", {"symbols": ["AAA", "BB"], "layout": "pairs", "format": "records"}
+        )
+
+    payload = matrix.structured_content
+    assert payload["columns"] == ["symbol", "AAA", "BB"]
+    assert [row[0] for row in payload["data"]] == ["AAA", "BB"]
+    assert payload["data"][0][1] == 1.0
+    assert payload["errors"] == {"BAD": "no data"}
+    assert payload["notes"] == ["Shrinkage intensity 0.5000"]
+    (pair,) = pairs.structured_content["data"]
+    assert pair["value"] == pytest.approx(2 * payload["data"][0][2], abs=1e-3)
@@ -0,0 +1,77 @@
+"""
+Tests for the blocking-call executor.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from personal_mcp.shared.executor import BlockingExecutor, CallTimeoutError
+
+
+@pytest.fixture
+def executor():
+    pool = BlockingExecutor(max_workers=4, default_timeout=5)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_blocking_calls_run_concurrently(executor: BlockingExecutor):
+    """Four 0.2s sleeps on four workers finish in roughly one sleep."""
+    started = time.perf_counter()
+    results = await asyncio.gather(
+        *(executor.run(lambda i=i: (time.sleep(0.2), i)[1]) for i in range(4))
+    )
+    elapsed = time.perf_counter() - started
+
+    assert results == [0, 1, 2, 3]
+    assert elapsed < 0.6
+
+
+@pytest.mark.asyncio
+async def test_event_loop_stays_responsive(executor: BlockingExecutor):
+    """The loop keeps ticking while a blocking call is in flight."""
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    task = asyncio.create_task(ticker())
+    await executor.run(lambda: time.sleep(0.2))
+    task.cancel()
+
+    assert ticks > 5
+
+
+@pytest.mark.asyncio
+async def test_deadline_raises_timeout(executor: BlockingExecutor):
+    with pytest.raises(CallTimeoutError):
+        await executor.run(lambda: time.sleep(0.5), timeout=0.05)
+
+
+@pytest.mark.asyncio
+async def test_cancel_drops_queued_call():
+    """Cancelling the awaiting task removes work that has not started yet."""
+    pool = BlockingExecutor(max_workers=1)
+    release = threading.Event()
+    ran = threading.Event()
+    try:
+        blocker = asyncio.create_task(pool.run(release.wait))
+        queued = asyncio.create_task(pool.run(ran.set))
+        await asyncio.sleep(0.05)
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        release.set()
+        await blocker
+        await asyncio.sleep(0.05)
+
+        assert not ran.is_set()
+    finally:
+        pool.shutdown()
@@ -0,0 +1,76 @@
+"""
+Tests for the Arrow/Parquet exports.
+"""
+
+import base64
+
+import pandas as pd
+import pytest
+from fastmcp import Client, FastMCP
+from fastmcp.tools.tool import ToolResult
+
+from personal_mcp.adapters import vnstock_adapter
+from personal_mcp.config import settings
+from personal_mcp.resources.export_resources import setup_export_resources
+from personal_mcp.shared.exports import decode_frame, encode_frame
+from personal_mcp.shared.payloads import OUTPUT_SCHEMA, frame_result
+
+
+def _bars(rows: int = 3) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "time": pd.date_range("2025-01-02", periods=rows, freq="D"),
+            "close": [10.5 + i for i in range(rows)],
+            "volume": [2**53 + i for i in range(rows)],
+        }
+    )
+
+
+@pytest.mark.parametrize("format", ["parquet", "arrow"])
+def test_round_trip_keeps_types(format):
+    frame = _bars()
+
+    decoded = decode_frame(encode_frame(frame, format), format)
+
+    pd.testing.assert_frame_equal(decoded, frame, check_dtype=False)
+    assert decoded["volume"].dtype == "int64"
+    assert pd.api.types.is_datetime64_dtype(decoded["time"].dtype)
+
+
+def test_mixed_object_columns_are_stored_as_strings():
+    frame = pd.DataFrame({"value": [1, "n/a", None]})
+
+    decoded = decode_frame(encode_frame(frame))
+
+    assert decoded["value"].tolist() == ["1", "n/a", None]
+
+
+class _Adapter:
+    def quote_history(self, symbol, start=None, end=None, interval="1D"):
+        return _bars()
+
+
+def _server() -> FastMCP:
+    server = FastMCP("test")
+    setup_export_resources(server)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def bars() -> ToolResult:
+        return frame_result(_bars(5))
+
+    return server
+
+
+@pytest.mark.asyncio
+async def test_resources_return_compressed_files(monkeypatch):
+    monkeypatch.setattr(vnstock_adapter, "_adapter_instance", _Adapter())
+    monkeypatch.setattr(settings, "page_rows", 2)
+    async with Client(_server()) as client:
+        history = await client.read_resource("vnstock://quote_history/FPT.arrow?start=2025-01-01")
+        paged = (await client.call_tool("bars", {})).structured_content
+        snapshot = paged["next_cursor"].split(":")[0]
+        result = await client.read_resource(f"vnstock://results/{snapshot}.parquet")
+
+    assert history[0].mimeType == "application/vnd.apache.arrow.file"
+    assert len(decode_frame(base64.b64decode(history[0].blob), "arrow")) == 3
+    assert len(decode_frame(base64.b64decode(result[0].blob), "parquet")) == 5
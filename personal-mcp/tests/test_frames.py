@@ -0,0 +1,80 @@
+"""
+Tests for shared DataFrame helpers.
+"""
+
+import pandas as pd
+import pytest
+
+from personal_mcp.shared.frames import combine_histories, shape_frame, summarize_history, symbols_from
+
+
+def _history(closes: list[float]) -> pd.DataFrame:
+    times = pd.bdate_range("2025-01-01", periods=len(closes))
+    return pd.DataFrame({"time": times, "open": closes, "close": closes, "volume": 10})
+
+
+def test_long_layout_stacks_symbols():
+    combined = combine_histories({"SSI": _history([1, 2]), "VCB": _history([3, 4, 5])})
+
+    assert list(combined.columns[:2]) == ["symbol", "time"]
+    assert combined["symbol"].tolist() == ["SSI", "SSI", "VCB", "VCB", "VCB"]
+
+
+def test_wide_layout_pivots_close_by_symbol():
+    combined = combine_histories(
+        {"SSI": _history([1, 2]), "VCB": _history([3, 4, 5]), "HPG": pd.DataFrame()},
+        layout="wide",
+    )
+
+    assert list(combined.columns) == ["time", "SSI", "VCB"]
+    assert len(combined) == 3
+    assert combined["SSI"].isna().sum() == 1
+
+
+def test_symbols_from_series_and_frame():
+    assert symbols_from(pd.Series(["ssi", "vcb"])) == ["SSI", "VCB"]
+    assert symbols_from(pd.DataFrame({"symbol": ["HPG"], "name": ["Hoa Phat"]})) == ["HPG"]
+
+
+def test_shape_frame_filters_pages_and_projects():
+    frame = pd.DataFrame(
+        {
+            "symbol": ["SSI", "VCB", "HPG", "FPT"],
+            "exchange": ["HOSE", "HOSE", "HNX", "HOSE"],
+            "pe": [12.0, 8.5, None, 20.0],
+        }
+    )
+
+    shaped = shape_frame(frame, fields=["symbol"], filter=["exchange == HOSE", "pe >= 10"], limit=1, offset=1)
+
+    assert shaped.to_dict(orient="list") == {"symbol": ["FPT"]}
+    assert shape_frame(frame, filter=["symbol ~ s"])["symbol"].tolist() == ["SSI"]
+    assert shape_frame(frame) is frame
+    with pytest.raises(ValueError, match="Unknown fields"):
+        shape_frame(frame, fields=["roe"])
+    with pytest.raises(ValueError, match="Invalid filter"):
+        shape_frame(frame, filter=["pe"])
+
+
+def test_summarize_history_reduces_bars_to_one_row():
+    frame = _history([10, 12, 9, 11, 8, 13])
+
+    summary = summarize_history(frame).iloc[0]
+
+    assert summary["bars"] == 6
+    assert summary["last_close"] == 13
+    assert summary["return_pct"] == pytest.approx(30)
+    assert summary["max_drawdown_pct"] == pytest.approx(-100 / 3)
+    assert summary["max_drawdown_at"] == frame["time"].iloc[4]
+    assert summary["annualized_volatility_pct"] == pytest.approx(summary["volatility_pct"] * 252**0.5)
+    assert summarize_history(pd.DataFrame()).empty
+
+
+def test_summarize_history_annualizes_only_daily_and_coarser_bars():
+    frame = _history([10, 12, 9, 11, 8, 13])
+
+    minutes = summarize_history(frame, "1m")
+    months = summarize_history(frame, "1M").iloc[0]
+
+    assert "annualized_volatility_pct" not in minutes.columns
+    assert months["annualized_volatility_pct"] == pytest.approx(months["volatility_pct"] * 12**0.5)
@@ -0,0 +1,58 @@
+"""
+Tests for the shared HTTP session pool.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from personal_mcp.shared.http import install_session_pool
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = 0
+
+    def setup(self):
+        super().setup()
+        type(self).connections += 1
+
+    def do_GET(self):
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_POST = do_GET
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_module_level_requests_reuse_one_connection(server):
+    install_session_pool()
+    _Handler.connections = 0
+
+    for _ in range(5):
+        assert requests.get(f"{server}/a").text == "ok"
+    requests.post(f"{server}/b", data={"x": 1})
+    requests.request("GET", f"{server}/c")
+
+    assert _Handler.connections == 1
+
+
+def test_install_is_idempotent():
+    assert install_session_pool() is install_session_pool()
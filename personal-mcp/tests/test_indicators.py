@@ -0,0 +1,127 @@
+"""
+Tests for the panel indicator engine and the technical_indicators tool.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from fastmcp import Client, FastMCP
+
+from personal_mcp.adapters import vnstock_adapter
+from personal_mcp.shared.indicators import compute_indicators, panel_rows, parse_spec
+from personal_mcp.shared.panels import price_panel
+from personal_mcp.tools.analytics_tools import setup_analytics_tools
+
+
+def _history(closes, start="2025-01-01") -> pd.DataFrame:
+    closes = np.asarray(closes, dtype=float)
+    return pd.DataFrame(
+        {
+            "time": pd.bdate_range(start, periods=len(closes)),
+            "open": closes,
+            "high": closes + 1,
+            "low": closes - 1,
+            "close": closes,
+            "volume": 1000,
+        }
+    )
+
+
+def _frames() -> dict[str, pd.DataFrame]:
+    rng = np.random.default_rng(1)
+    return {
+        "AAA": _history(100 + rng.normal(0, 1, 80).cumsum()),
+        # Listed later, so its first bars are missing from the panel
+        "BBB": _history(50 + rng.normal(0, 1, 70).cumsum(), start="2025-01-15"),
+        "UP": _history(np.arange(1, 81)),
+    }
+
+
+def test_panel_matches_per_symbol_pandas():
+    frames = _frames()
+    outputs = compute_indicators(price_panel(frames), ["sma:10", "ema:10", "bbands:20,2"])
+
+    for symbol, frame in frames.items():
+        close = frame.set_index("time")["close"]
+        expected_sma = close.rolling(10).mean()
+        expected_ema = close.ewm(span=10, adjust=False, min_periods=10).mean()
+        expected_std = close.rolling(20).std(ddof=0)
+        np.testing.assert_allclose(outputs["sma_10"][symbol].dropna(), expected_sma.dropna())
+        np.testing.assert_allclose(outputs["ema_10"][symbol].dropna(), expected_ema.dropna())
+        np.testing.assert_allclose(
+            (outputs["bb_upper_20_2"][symbol] - outputs["bb_mid_20_2"][symbol]).dropna(),
+            2 * expected_std.dropna(),
+        )
+
+
+def test_rsi_and_atr_of_a_steady_rise():
+    outputs = compute_indicators(price_panel({"UP": _frames()["UP"]}), ["rsi", "atr:5"])
+
+    assert outputs["rsi_14"]["UP"].dropna().eq(100).all()
+    assert outputs["rsi_14"]["UP"].isna().sum() == 14
+    # True range is max(high - low, |high - previous close|) = 2 every bar
+    assert outputs["atr_5"]["UP"].dropna().round(10).eq(2).all()
+
+
+def test_symbol_indicators_do_not_depend_on_peers():
+    frames = _frames()
+    alone = compute_indicators(price_panel({"AAA": frames["AAA"]}), ["sma:5", "ema:5", "rsi:5", "atr:5"])
+    # A peer whose bars are 30 s off interleaves its own rows into the panel
+    peer = frames["BBB"].assign(time=frames["BBB"]["time"] + pd.Timedelta(seconds=30))
+    together = compute_indicators(price_panel({"AAA": frames["AAA"], "BBB": peer}), ["sma:5", "ema:5", "rsi:5", "atr:5"])
+
+    for name, frame in alone.items():
+        pd.testing.assert_series_equal(together[name]["AAA"].dropna(), frame["AAA"].dropna(), check_names=False)
+        assert together[name]["AAA"].notna().sum() == frame["AAA"].notna().sum()
+
+
+def test_specs_are_parsed_with_defaults():
+    assert parse_spec("MACD:5") == ("macd", [5, 26, 9])
+    assert parse_spec("bbands:20,2.5") == ("bbands", [20, 2.5])
+    with pytest.raises(ValueError, match="Unknown indicator"):
+        parse_spec("vwap")
+    with pytest.raises(ValueError, match="positive"):
+        parse_spec("sma:0")
+
+
+def test_latest_rows_take_each_symbols_last_bar():
+    frames = _frames()
+    frames["AAA"] = frames["AAA"].iloc[:-3]
+    panel = price_panel(frames)
+
+    rows = panel_rows(panel, compute_indicators(panel, ["sma:5"]), latest=True)
+
+    assert rows["symbol"].tolist() == ["AAA", "BBB", "UP"]
+    assert rows.loc[0, "time"] == frames["AAA"]["time"].iloc[-1]
+    assert rows.loc[2, "close"] == 80
+    assert rows.loc[2, "sma_5"] == pytest.approx(78)
+
+
+class _Adapter:
+    def quote_history(self, symbol, start=None, end=None, interval="1D"):
+        if symbol == "BAD":
+            raise ValueError("no data")
+        return _frames()[symbol]
+
+    def listing_symbols_by_group(self, group):
+        return pd.Series(["AAA", "BBB", "BAD"])
+
+
+@pytest.mark.asyncio
+async def test_tool_computes_group_indicators(monkeypatch):
+    monkeypatch.setattr(vnstock_adapter, "_adapter_instance", _Adapter())
+    server = FastMCP("test")
+    setup_analytics_tools(server)
+
+    async with Client(server) as client:
+        latest = await client.call_tool("technical_indicators", {"indicators": ["rsi", "sma:5"], "group": "VN30"})
+        series = await client.call_tool(
+            "technical_indicators",
+            {"indicators": ["sma:5"], "symbols": ["UP"], "mode": "series", "filter": ["sma_5 > 0"]},
+        )
+
+    payload = latest.structured_content
+    assert [row["symbol"] for row in payload["data"]] == ["AAA", "BBB"]
+    assert set(payload["data"][0]) == {"symbol", "time", "close", "rsi_14", "sma_5"}
+    assert payload["errors"] == {"BAD": "no data"}
+    assert len(series.structured_content["data"]) == 76
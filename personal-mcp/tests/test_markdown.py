@@ -0,0 +1,52 @@
+"""
+Tests for bounded markdown rendering.
+"""
+
+import numpy as np
+import pandas as pd
+
+from personal_mcp.shared.markdown import payload_markdown, render_markdown
+
+
+def _frame(rows: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        {"symbol": [f"S{i}" for i in range(rows)], "pe": np.linspace(1, 2, rows), "note": "a|b"}
+    )
+
+
+def test_small_tables_are_rendered_whole():
+    text = render_markdown(_frame(3))
+
+    lines = text.splitlines()
+    assert lines[0].startswith("| symbol")
+    assert len(lines) == 5
+    assert "a\\|b" in lines[2]
+    assert "rows ×" not in text
+
+
+def test_large_tables_keep_head_and_tail():
+    text = render_markdown(_frame(1000), max_rows=4, max_cols=2, max_width=0)
+
+    lines = text.splitlines()
+    assert lines[2].startswith("| S0 ")
+    assert lines[4].startswith("| …")
+    assert lines[6].startswith("| S999 ")
+    assert "note" not in lines[0]
+    assert lines[-1] == "_1000 rows × 3 columns (showing 4 of 1000 rows, 2 of 3 columns)._"
+
+
+def test_fast_path_matches_cell_formatting():
+    text = render_markdown(_frame(200), max_rows=0, max_width=2)
+
+    lines = text.splitlines()
+    assert len(lines) == 202
+    assert lines[2] == "| S0 | 1 | a… |"
+
+
+def test_payload_formats_render_the_same_rows():
+    records = {"data": [{"symbol": f"S{i}", "pe": float(i)} for i in range(100)]}
+    columns = {"data": {"symbol": [f"S{i}" for i in range(100)], "pe": [float(i) for i in range(100)]}}
+
+    assert payload_markdown(records) == payload_markdown(columns)
+    assert "_100 rows × 2 columns" in payload_markdown(records)
+    assert payload_markdown({"data": "text"}) is None
@@ -0,0 +1,115 @@
+"""
+Tests for the persistent OHLC store.
+"""
+
+import json
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+
+from personal_mcp.adapters.ohlc_store import OHLCStore, merge_ranges, missing_ranges
+
+pytest.importorskip("pyarrow")
+
+
+class _Upstream:
+    """Fake provider returning one daily bar per business day."""
+
+    def __init__(self):
+        self.calls: list[tuple[str, str]] = []
+
+    def __call__(self, start: str, end: str) -> pd.DataFrame:
+        self.calls.append((start, end))
+        days = pd.bdate_range(start, end)
+        return pd.DataFrame(
+            {"time": days, "open": 1.0, "high": 2.0, "low": 0.5, "close": 1.5, "volume": 100}
+        )
+
+
+def test_missing_ranges_returns_only_uncovered_dates():
+    d = date.fromisoformat
+    covered = [(d("2024-01-01"), d("2024-01-31")), (d("2024-03-01"), d("2024-03-31"))]
+
+    assert missing_ranges(covered, d("2023-12-15"), d("2024-04-10")) == [
+        (d("2023-12-15"), d("2023-12-31")),
+        (d("2024-02-01"), d("2024-02-29")),
+        (d("2024-04-01"), d("2024-04-10")),
+    ]
+    assert missing_ranges(covered, d("2024-01-05"), d("2024-01-20")) == []
+
+
+def test_merge_ranges_joins_adjacent_days():
+    d = date.fromisoformat
+
+    assert merge_ranges([(d("2024-01-11"), d("2024-01-20")), (d("2024-01-01"), d("2024-01-10"))]) == [
+        (d("2024-01-01"), d("2024-01-20"))
+    ]
+
+
+def test_overlapping_requests_fetch_only_gaps(tmp_path):
+    store = OHLCStore(tmp_path)
+    upstream = _Upstream()
+
+    first = store.history("ssi", "2024-01-01", "2024-06-30", "1D", upstream)
+    second = store.history("SSI", "2024-03-01", "2024-09-30", "1d", upstream)
+    third = store.history("SSI", "2024-02-01", "2024-08-31", "1D", upstream)
+
+    assert upstream.calls == [("2024-01-01", "2024-06-30"), ("2024-07-01", "2024-09-30")]
+    assert len(first) == len(pd.bdate_range("2024-01-01", "2024-06-30"))
+    assert second["time"].min() == pd.Timestamp("2024-03-01")
+    assert second["time"].max() == pd.Timestamp("2024-09-30")
+    assert third["time"].is_monotonic_increasing
+
+
+def test_today_is_refetched(tmp_path):
+    store = OHLCStore(tmp_path)
+    upstream = _Upstream()
+    start = (date.today() - timedelta(days=10)).isoformat()
+
+    store.history("SSI", start, None, "1D", upstream)
+    store.history("SSI", start, None, "1D", upstream)
+
+    assert upstream.calls[1] == (date.today().isoformat(), date.today().isoformat())
+
+
+def test_weekly_interval_is_not_stored(tmp_path):
+    with pytest.raises(ValueError):
+        OHLCStore(tmp_path).history("SSI", "2024-01-01", "2024-02-01", "1W", _Upstream())
+
+
+def _age_check(store: OHLCStore, symbol: str) -> None:
+    """Pretend the last revalidation of ``symbol`` daily bars was yesterday."""
+    _, coverage = store._paths("VCI", "1D", symbol)
+    sidecar = json.loads(coverage.read_text())
+    coverage.write_text(json.dumps({**sidecar, "checked": (date.today() - timedelta(days=1)).isoformat()}))
+
+
+def test_gap_fetch_revalidates_one_stored_bar(tmp_path):
+    store = OHLCStore(tmp_path)
+    upstream = _Upstream()
+    store.history("SSI", "2024-01-01", "2024-06-30", "1D", upstream)
+    _age_check(store, "SSI")
+
+    store.history("SSI", "2024-01-01", "2024-09-30", "1D", upstream)
+    store.history("SSI", "2024-01-01", "2024-10-31", "1D", upstream)
+
+    # Widened to the last stored bar (Friday 2024-06-28), then checked for the day
+    assert upstream.calls[1:] == [("2024-06-28", "2024-09-30"), ("2024-10-01", "2024-10-31")]
+
+
+def test_readjusted_close_drops_stored_bars(tmp_path):
+    store = OHLCStore(tmp_path)
+    upstream = _Upstream()
+    store.history("SSI", "2024-01-01", "2024-06-30", "1D", upstream)
+    _age_check(store, "SSI")
+
+    # A dividend went ex: upstream now serves every past close adjusted
+    def adjusted(start: str, end: str) -> pd.DataFrame:
+        return upstream(start, end).assign(close=1.2)
+
+    bars = store.history("SSI", "2024-03-01", "2024-09-30", "1D", adjusted)
+
+    assert upstream.calls[1:] == [("2024-06-28", "2024-09-30"), ("2024-03-01", "2024-09-30")]
+    assert (bars["close"] == 1.2).all()
+    assert store.history("SSI", "2024-01-01", "2024-01-31", "1D", adjusted)["close"].eq(1.2).all()
@@ -0,0 +1,183 @@
+"""
+Tests for structured tool payloads.
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+import jsonschema
+import pytest
+from fastmcp import Client, FastMCP
+from fastmcp.exceptions import ToolError
+from fastmcp.tools.tool import ToolResult
+
+from personal_mcp.config import settings
+from personal_mcp.shared.payloads import (
+    OUTPUT_SCHEMA,
+    OutputFormat,
+    frame_data,
+    frame_payload,
+    frame_records,
+    frame_result,
+    paged_data,
+    tool_result,
+)
+from personal_mcp.tools.result_tools import setup_result_tools
+
+
+def test_frame_records_are_json_ready():
+    frame = pd.DataFrame(
+        {
+            "time": pd.to_datetime(["2025-01-02", None]),
+            "close": [1.5, np.nan],
+            "volume": np.array([100, 200], dtype="int64"),
+            "tag": [np.int64(7), "x"],
+        }
+    )
+
+    records = frame_records(frame)
+
+    assert records[0] == {"time": "2025-01-02", "close": 1.5, "volume": 100, "tag": 7}
+    assert records[1]["time"] is None
+    assert type(records[1]["volume"]) is int
+    assert type(records[0]["tag"]) is int
+
+
+def test_series_and_scalars_are_wrapped():
+    assert frame_payload(pd.Series(["SSI", "VCB"], name="symbol")) == {
+        "data": [{"symbol": "SSI"}, {"symbol": "VCB"}]
+    }
+    assert frame_payload(42) == {"data": "42"}
+
+
+def test_columns_and_split_layouts():
+    frame = pd.DataFrame(
+        {"symbol": ["SSI", "VCB"], "close": [1.5, 2.0], "volume": pd.array([1, None], dtype="Int64")}
+    )
+
+    assert frame_data(frame, "columns") == {
+        "data": {"symbol": ["SSI", "VCB"], "close": [1.5, 2.0], "volume": [1, None]}
+    }
+    assert frame_data(frame, "split") == {
+        "columns": ["symbol", "close", "volume"],
+        "dtypes": ["object", "float64", "Int64"],
+        "data": [["SSI", 1.5, 1], ["VCB", 2.0, None]],
+    }
+    with pytest.raises(ValueError):
+        frame_data(frame, "xml")  # type: ignore[arg-type]
+
+
+def _server() -> FastMCP:
+    server = FastMCP("payloads")
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def bars(format: OutputFormat = "records") -> ToolResult:
+        return frame_result(pd.DataFrame({"close": [1.0, np.nan]}), format)
+
+    return server
+
+
+@pytest.mark.asyncio
+async def test_tool_returns_structured_content_with_schema():
+    async with Client(_server()) as client:
+        tools = {t.name: t for t in await client.list_tools()}
+        result = await client.call_tool("bars", {})
+
+    assert "data" in tools["bars"].outputSchema["properties"]
+    assert result.structured_content["data"][0] == {"close": 1.0}
+    # By default the rows travel once, in structuredContent
+    assert result.content[0].text == "2 rows in structuredContent"
+
+
+@pytest.mark.parametrize("format", ["records", "columns", "split"])
+def test_payloads_match_the_output_schema(format, monkeypatch):
+    monkeypatch.setattr(settings, "page_rows", 2)
+    frame = pd.DataFrame({"symbol": ["SSI", "VCB", "FPT"], "close": [1.5, np.nan, 2.0]})
+
+    payload = {**paged_data(frame, format), "errors": {"BAD": "no data"}, "notes": ["trimmed"]}
+
+    jsonschema.validate(payload, OUTPUT_SCHEMA)
+    jsonschema.validate(frame_payload("text result"), OUTPUT_SCHEMA)
+
+
+@pytest.mark.asyncio
+async def test_output_schema_is_enforced():
+    server = FastMCP("schema")
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def broken() -> ToolResult:
+        return tool_result({"total": "many"})  # type: ignore[typeddict-item]
+
+    async with Client(server) as client:
+        with pytest.raises(ToolError, match="validation"):
+            await client.call_tool("broken", {})
+
+
+@pytest.mark.asyncio
+async def test_full_mode_repeats_data_as_text(monkeypatch):
+    monkeypatch.setattr(settings, "tool_text_content", "full")
+    async with Client(_server()) as client:
+        result = await client.call_tool("bars", {})
+
+    assert len(result.structured_content["data"]) == 2
+    assert result.content[0].text == '{"data":[{"close":1.0},{"close":null}]}'
+
+
+@pytest.mark.asyncio
+async def test_tool_accepts_columns_format(monkeypatch):
+    monkeypatch.setattr(settings, "tool_text_content", "full")
+    async with Client(_server()) as client:
+        result = await client.call_tool("bars", {"format": "columns"})
+
+    assert result.structured_content == {"data": {"close": [1.0, None]}}
+    assert result.content[0].text == '{"data":{"close":[1.0,null]}}'
+
+
+def _paged_server() -> FastMCP:
+    server = _server()
+    setup_result_tools(server)
+
+    @server.tool(output_schema=OUTPUT_SCHEMA)
+    async def symbols() -> ToolResult:
+        return frame_result(pd.DataFrame({"symbol": [f"S{i}" for i in range(5)]}))
+
+    return server
+
+
+@pytest.mark.asyncio
+async def test_large_results_are_paged_by_cursor(monkeypatch):
+    monkeypatch.setattr(settings, "page_rows", 2)
+    async with Client(_paged_server()) as client:
+        first = (await client.call_tool("symbols", {})).structured_content
+        second = (await client.call_tool("next_page", {"cursor": first["next_cursor"]})).structured_content
+        last = (await client.call_tool("next_page", {"cursor": second["next_cursor"]})).structured_content
+        expired = await client.call_tool("next_page", {"cursor": "gone:2"})
+
+    assert first["data"] == [{"symbol": "S0"}, {"symbol": "S1"}]
+    assert first["total"] == 5
+    assert second["data"] == [{"symbol": "S2"}, {"symbol": "S3"}]
+    assert last["data"] == [{"symbol": "S4"}]
+    assert "next_cursor" not in last
+    assert "expired" in expired.structured_content["error"]
+
+
+@pytest.mark.asyncio
+async def test_stream_pages_sends_progress_chunks(monkeypatch):
+    monkeypatch.setattr(settings, "page_rows", 2)
+    chunks = []
+
+    async def on_progress(progress: float, total: float | None, message: str | None) -> None:
+        chunks.append((progress, total, json.loads(message)["data"]))
+
+    async with Client(_paged_server()) as client:
+        first = (await client.call_tool("symbols", {})).structured_content
+        result = await client.call_tool(
+            "stream_pages", {"cursor": first["next_cursor"]}, progress_handler=on_progress
+        )
+
+    assert chunks == [
+        (4, 5, [{"symbol": "S2"}, {"symbol": "S3"}]),
+        (5, 5, [{"symbol": "S4"}]),
+    ]
+    assert result.structured_content["total"] == 5
@@ -0,0 +1,48 @@
+"""
+Tests for the vnstock object pool.
+"""
+
+import time
+
+from personal_mcp.shared.pool import ObjectPool
+
+
+class _Client:
+    built = 0
+
+    def __init__(self, symbol: str, source: str = "VCI"):
+        type(self).built += 1
+        self.symbol = symbol
+        self.source = source
+
+
+def test_same_symbol_and_source_reuse_one_object():
+    pool = ObjectPool(max_size=8, idle_seconds=60)
+    first = pool.get(_Client, symbol="ssi", source="vci")
+    second = pool.get(_Client, source="VCI", symbol="SSI")
+    other = pool.get(_Client, symbol="SSI", source="TCBS")
+
+    assert first is second
+    assert other is not first
+    assert (pool.hits, pool.misses) == (1, 2)
+
+
+def test_least_recently_used_object_is_dropped_past_max_size():
+    pool = ObjectPool(max_size=2, idle_seconds=60)
+    a = pool.get(_Client, symbol="A")
+    pool.get(_Client, symbol="B")
+    pool.get(_Client, symbol="A")
+    pool.get(_Client, symbol="C")
+
+    assert len(pool) == 2
+    assert pool.get(_Client, symbol="A") is a
+    assert pool.misses == 3
+
+
+def test_idle_objects_are_evicted():
+    pool = ObjectPool(max_size=8, idle_seconds=0.05)
+    first = pool.get(_Client, symbol="SSI")
+    time.sleep(0.06)
+
+    assert pool.get(_Client, symbol="SSI") is not first
+    assert len(pool) == 1
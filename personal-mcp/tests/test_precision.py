@@ -0,0 +1,89 @@
+"""
+Tests for the numeric precision policy.
+"""
+
+import numpy as np
+import pandas as pd
+
+from personal_mcp.config import settings
+from personal_mcp.shared.payloads import frame_data, payload_json
+from personal_mcp.shared.precision import downcast_frame, is_price_column, restore_frame
+
+
+def test_floats_are_rounded_by_column_kind():
+    frame = pd.DataFrame({"close": [95.4999999999], "pe": [12.3456789], "bid_1_price": [1.006]})
+
+    data = frame_data(frame, "columns")["data"]
+
+    assert data == {"close": [95.5], "pe": [12.3457], "bid_1_price": [1.01]}
+    assert is_price_column("match_price") and not is_price_column("price_to_earning")
+
+
+def test_rounding_can_be_disabled(monkeypatch):
+    monkeypatch.setattr(settings, "float_decimals", None)
+
+    assert frame_data(pd.DataFrame({"pe": [12.3456789]}), "columns")["data"] == {"pe": [12.3456789]}
+
+
+def test_dates_are_compact_only_at_midnight():
+    daily = pd.DataFrame({"time": pd.to_datetime(["2025-01-02", None])})
+    intraday = pd.DataFrame({"time": pd.to_datetime(["2025-01-02 09:15:00", "2025-01-02 00:00:00"])})
+
+    assert frame_data(daily, "columns")["data"] == {"time": ["2025-01-02", None]}
+    assert frame_data(intraday, "columns")["data"] == {"time": ["2025-01-02T09:15:00", "2025-01-02T00:00:00"]}
+
+
+def test_downcast_narrows_only_exact_columns():
+    frame = pd.DataFrame(
+        {
+            "close": [95.5, 10.25, np.nan],
+            "open": [95.55, 10.1, 9.0],
+            "market_cap": [1.23456789e14, 1.0, 2.0],
+            "volume": np.array([1_000_000, 2, 3], dtype="int64"),
+            "value": np.array([2**40, 2, 3], dtype="int64"),
+        }
+    )
+
+    narrowed = downcast_frame(frame)
+
+    assert narrowed.dtypes.to_dict() == {
+        "close": np.float32,
+        "open": np.float64,
+        "market_cap": np.float64,
+        "volume": np.int32,
+        "value": np.int64,
+    }
+    assert frame["close"].dtype == np.float64
+    assert payload_json(frame_data(narrowed[["close"]], "columns")) == '{"data":{"close":[95.5,10.25,null]}}'
+
+
+def test_downcast_returns_frame_unchanged_when_nothing_narrows():
+    frame = pd.DataFrame({"symbol": ["FPT"], "value": np.array([2**40], dtype="int64")})
+
+    assert downcast_frame(frame) is frame
+
+
+def test_restore_widens_narrowed_columns_to_exact_values():
+    frame = pd.DataFrame(
+        {
+            "close": [23.5, 10.0],
+            "volume": np.array([100, 200], dtype="int64"),
+            "flag": np.array([1, 2], dtype="int32"),
+        }
+    )
+
+    restored = restore_frame(downcast_frame(frame))
+
+    assert restored.dtypes.to_dict() == {"close": np.float64, "volume": np.int64, "flag": np.int32}
+    assert restored["close"].tolist() == [23.5, 10.0]
+    assert restored.attrs == {}
+
+
+def test_cache_round_trip_keeps_small_ratios_and_extra_decimals():
+    frame = pd.DataFrame({"dividend_yield": [0.00004321, 0.05], "close": [1.08345, 23.45], "pe": [12.345678, 8.0]})
+
+    restored = restore_frame(downcast_frame(frame))
+
+    pd.testing.assert_frame_equal(restored, frame)
+    # Rounding is left to serialization
+    assert frame_data(restored, "columns")["data"]["close"] == [1.08, 23.45]
@@ -0,0 +1,141 @@
+"""
+Tests for session-aware resampling and derived intervals in the OHLC store.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from personal_mcp.adapters.ohlc_store import OHLCStore
+from personal_mcp.shared.resample import bucket_starts, can_resample, resample_bars
+
+pytest.importorskip("pyarrow")
+
+
+def _session_minutes(day: str) -> pd.DatetimeIndex:
+    """1-minute bar times of a HOSE day, with the 11:30 and 14:45 prints."""
+    morning = pd.date_range(f"{day} 09:15", f"{day} 11:30", freq="1min")
+    afternoon = pd.date_range(f"{day} 13:00", f"{day} 14:29", freq="1min")
+    return morning.append(afternoon).append(pd.DatetimeIndex([f"{day} 14:45"]))
+
+
+def _bars(times: pd.DatetimeIndex) -> pd.DataFrame:
+    n = len(times)
+    return pd.DataFrame(
+        {
+            "time": times,
+            "open": np.arange(n, dtype=float),
+            "high": np.arange(n, dtype=float) + 1,
+            "low": np.arange(n, dtype=float) - 1,
+            "close": np.arange(n, dtype=float) + 0.5,
+            "volume": np.full(n, 10),
+        }
+    )
+
+
+def test_buckets_respect_sessions():
+    times = pd.DatetimeIndex(
+        ["2025-03-03 09:15", "2025-03-03 11:29", "2025-03-03 11:30", "2025-03-03 13:05", "2025-03-03 14:45"]
+    ).to_numpy()
+
+    hourly = bucket_starts(times, "1H").astype("datetime64[m]").astype(str).tolist()
+    quarter = bucket_starts(times, "15m").astype("datetime64[m]").astype(str).tolist()
+
+    assert hourly == ["2025-03-03T09:00", "2025-03-03T11:00", "2025-03-03T11:00", "2025-03-03T13:00", "2025-03-03T14:00"]
+    # The closing auction folds into the last bucket of the afternoon
+    assert quarter[-1] == "2025-03-03T14:30"
+    assert quarter[2] == "2025-03-03T11:15"
+
+
+def test_resample_aggregates_ohlcv():
+    bars = _bars(_session_minutes("2025-03-03"))
+
+    hourly = resample_bars(bars, "1H")
+    daily = resample_bars(bars, "1D")
+
+    assert hourly["time"].dt.hour.tolist() == [9, 10, 11, 13, 14]
+    first = bars[bars["time"] < "2025-03-03 10:00"]
+    assert hourly.iloc[0][["open", "high", "low", "close", "volume"]].tolist() == [
+        first["open"].iloc[0],
+        first["high"].max(),
+        first["low"].min(),
+        first["close"].iloc[-1],
+        first["volume"].sum(),
+    ]
+    assert daily["volume"].tolist() == [bars["volume"].sum()]
+    assert daily["close"].iloc[0] == bars["close"].iloc[-1]
+
+
+def test_weekly_and_monthly_labels():
+    days = _bars(pd.bdate_range("2025-01-01", "2025-02-14"))
+
+    weekly = resample_bars(days, "1W")
+    monthly = resample_bars(days, "1M")
+
+    assert (weekly["time"].dt.dayofweek == 0).all()
+    assert weekly["time"].iloc[0] == pd.Timestamp("2024-12-30")
+    assert monthly["time"].tolist() == [pd.Timestamp("2025-01-01"), pd.Timestamp("2025-02-01")]
+
+
+def test_incremental_resampling_matches_full():
+    bars = _bars(_session_minutes("2025-03-03"))
+    head = bars[bars["time"] < "2025-03-03 13:20"]
+
+    incremental = resample_bars(bars, "15m", previous=resample_bars(head, "15m"))
+
+    pd.testing.assert_frame_equal(incremental, resample_bars(bars, "15m"))
+
+
+def test_can_resample():
+    assert can_resample("5m", "15m") and can_resample("5m", "1D") and can_resample("1D", "1W")
+    assert can_resample("15m", "1H")
+    assert not can_resample("15m", "1m") and not can_resample("30m", "30m")
+
+
+class _Upstream:
+    """Fake provider returning session bars for each business day."""
+
+    def __init__(self):
+        self.calls: list[tuple[str, str, str]] = []
+
+    def __call__(self, start: str, end: str, interval: str) -> pd.DataFrame:
+        self.calls.append((start, end, interval))
+        days = pd.bdate_range(start, end)
+        if interval == "1D":
+            return _bars(days)
+        times = pd.DatetimeIndex([]).append([_session_minutes(str(d.date())) for d in days])
+        return _bars(times)
+
+
+def test_store_derives_coarser_intervals_without_fetching(tmp_path):
+    store = OHLCStore(tmp_path)
+    upstream = _Upstream()
+
+    assert store.derived_history("SSI", "2025-03-03", "2025-03-07", "1H", upstream) is None
+    store.history("SSI", "2025-03-03", "2025-03-07", "1m", lambda lo, hi: upstream(lo, hi, "1m"))
+    hourly = store.derived_history("SSI", "2025-03-03", "2025-03-07", "1H", upstream)
+    shorter = store.derived_history("SSI", "2025-03-03", "2025-03-04", "1H", upstream)
+    store.history("SSI", "2025-03-03", "2025-03-07", "1D", lambda lo, hi: upstream(lo, hi, "1D"))
+    weekly = store.derived_history("SSI", "2025-03-05", "2025-03-07", "1W", upstream)
+
+    assert len(upstream.calls) == 2
+    assert len(hourly) == 5 * 5
+    # Same start, different end: not served from the longer memoized series
+    assert len(shorter) == 2 * 5
+    # The week of a mid-week start date is kept
+    assert weekly["time"].tolist() == [pd.Timestamp("2025-03-03")]
+
+
+def test_stored_interval_wins_and_daily_is_never_rebuilt_from_intraday(tmp_path):
+    store = OHLCStore(tmp_path)
+    upstream = _Upstream()
+    store.history("SSI", "2024-01-01", "2024-03-29", "1D", lambda lo, hi: upstream(lo, hi, "1D"))
+    store.history("SSI", "2024-03-01", "2024-03-29", "1m", lambda lo, hi: upstream(lo, hi, "1m"))
+    store.history("SSI", "2024-03-01", "2024-03-29", "1H", lambda lo, hi: upstream(lo, hi, "1H"))
+
+    # Adjusted daily bars stay the source of daily data
+    assert store.derived_history("SSI", "2024-03-01", "2024-03-29", "1D", upstream) is None
+    assert store.derived_history("SSI", "2024-03-04", "2024-03-08", "1D", upstream) is None
+    # 1H is stored itself, so it is not rebuilt from the 1m bars either
+    assert store.derived_history("SSI", "2024-03-04", "2024-03-08", "1H", upstream) is None
+    assert len(upstream.calls) == 3
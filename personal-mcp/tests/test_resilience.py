@@ -0,0 +1,122 @@
+"""
+Tests for per-source rate limiting and circuit breaking.
+"""
+
+import time
+
+import pandas as pd
+import pytest
+
+from personal_mcp.adapters.vnstock_adapter import _cached
+from personal_mcp.shared.cache import TTLCache
+from personal_mcp.shared.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RateLimitedError,
+    SourceGuard,
+    TokenBucket,
+    get_source_guard,
+)
+from personal_mcp.shared.singleflight import SingleFlight
+
+
+def _guard(rate: float = 1000.0, burst: int = 10, threshold: int = 2, reset: float = 60.0) -> SourceGuard:
+    return SourceGuard(
+        name="TEST",
+        limiter=TokenBucket(rate=rate, burst=burst),
+        breaker=CircuitBreaker(failure_threshold=threshold, reset_timeout=reset),
+        max_wait=0.05,
+    )
+
+
+def _fail():
+    raise ConnectionError("upstream down")
+
+
+def test_token_bucket_paces_after_burst():
+    bucket = TokenBucket(rate=20.0, burst=2)
+    started = time.monotonic()
+    for _ in range(4):
+        assert bucket.acquire()
+
+    # Two tokens come from the burst, the other two take 1/20s each
+    assert time.monotonic() - started >= 0.09
+    assert bucket.acquire(timeout=0.0) is False
+
+
+def test_guard_rejects_when_rate_limited():
+    guard = _guard(rate=0.1, burst=1)
+    guard.call(lambda: 1)
+
+    with pytest.raises(RateLimitedError):
+        guard.call(lambda: 1)
+
+
+def test_circuit_opens_after_threshold_and_fails_fast():
+    guard = _guard(threshold=2)
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            guard.call(_fail)
+
+    calls = []
+    with pytest.raises(CircuitOpenError):
+        guard.call(lambda: calls.append(1))
+    assert calls == []
+
+
+def test_half_open_trial_closes_or_reopens_circuit():
+    guard = _guard(threshold=1, reset=0.05)
+    with pytest.raises(ConnectionError):
+        guard.call(_fail)
+    time.sleep(0.06)
+
+    assert guard.breaker.state == "half_open"
+    with pytest.raises(ConnectionError):
+        guard.call(_fail)
+    assert guard.breaker.state == "open"
+
+    time.sleep(0.06)
+    assert guard.call(lambda: "ok") == "ok"
+    assert guard.breaker.state == "closed"
+
+
+def test_caller_errors_do_not_trip_the_circuit():
+    guard = _guard(threshold=1)
+    with pytest.raises(ValueError):
+        guard.call(lambda: int("x"))
+
+    assert guard.breaker.state == "closed"
+
+
+class _FlakyAdapter:
+    def __init__(self):
+        self.cache = TTLCache(max_bytes=1 << 20)
+        self.inflight = SingleFlight()
+        self.down = False
+
+    @_cached("fund", source="STALE_TEST")
+    def fund_listing(self, fund_type: str = ""):
+        if self.down:
+            raise ConnectionError("upstream down")
+        return pd.DataFrame({"short_name": ["A", "B"]})
+
+
+def test_expired_entry_is_served_while_source_fails():
+    adapter = _FlakyAdapter()
+    fresh = adapter.fund_listing()
+    for key, entry in list(adapter.cache._entries.items()):
+        adapter.cache.set(key, entry.value, expires_at=time.time() - 1)
+    adapter.down = True
+
+    stale = adapter.fund_listing()
+
+    pd.testing.assert_frame_equal(stale, fresh)
+    assert get_source_guard("STALE_TEST").breaker.failures == 1
+
+
+def test_failure_without_cached_entry_propagates():
+    adapter = _FlakyAdapter()
+    adapter.down = True
+
+    with pytest.raises(ConnectionError):
+        adapter.fund_listing(fund_type="BOND")
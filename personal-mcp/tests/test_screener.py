@@ -0,0 +1,120 @@
+"""
+Tests for the local screener: expressions, market snapshot and tool.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+from fastmcp import Client, FastMCP
+
+from personal_mcp.adapters import vnstock_adapter
+from personal_mcp.adapters.market_snapshot import MarketSnapshot
+from personal_mcp.config import settings
+from personal_mcp.shared.expressions import sort_by, validate_expression, where
+from personal_mcp.tools.analytics_tools import setup_analytics_tools
+
+MARKET = pd.DataFrame(
+    {
+        "ticker": ["VCB", "FPT", "HPG", "XYZ"],
+        "exchange": ["HOSE", "HOSE", "HOSE", "UPCOM"],
+        "pe": [15.0, 20.0, 8.0, np.nan],
+        "roe": [20.0, 25.0, 12.0, 5.0],
+    }
+)
+INDUSTRIES = pd.DataFrame(
+    {"symbol": ["VCB", "FPT", "HPG"], "icb_name2": ["Ngân hàng", "Công nghệ", "Tài nguyên"]}
+)
+
+
+def test_expressions_reject_anything_but_columns_and_operators():
+    columns = ["pe", "roe"]
+    validate_expression("pe < 10 and not (roe <= 0) or -pe in [1, 2]", columns)
+    for bad in ("__import__('os')", "pe.values", "pe[0]", "price > 1", "pe <"):
+        with pytest.raises(ValueError):
+            validate_expression(bad, columns)
+
+
+def test_expressions_cannot_build_huge_values():
+    columns = ["pe", "roe"]
+    validate_expression("pe ** 2 + roe ** -0.5 > 1", columns)
+    for bad in ("pe < 9**9**7", "pe < (9**16)**16", "pe ** roe", "pe ** 17", "[0] * 10 == pe", "'a' * 9 == pe"):
+        with pytest.raises(ValueError):
+            validate_expression(bad, columns)
+
+
+def test_where_and_sort_by_expressions():
+    frame = MARKET.rename(columns={"ticker": "symbol"})
+
+    matched = where(frame, "roe / pe > 1 and exchange in ['HOSE']")
+    ordered = sort_by(frame, ["-(roe / pe)", "symbol"])
+
+    assert matched["symbol"].tolist() == ["VCB", "FPT", "HPG"]
+    # NaN keys sort last in both directions
+    assert ordered["symbol"].tolist() == ["HPG", "VCB", "FPT", "XYZ"]
+    with pytest.raises(ValueError, match="true/false"):
+        where(frame, "pe + 1")
+
+
+class _Adapter:
+    def __init__(self):
+        self.calls = 0
+
+    def screener_stock(self, params=None, limit=50, id=None, lang="vi"):
+        self.calls += 1
+        return MARKET.copy()
+
+    def listing_symbols_by_industries(self):
+        return INDUSTRIES
+
+
+def test_snapshot_joins_industries_and_persists(tmp_path):
+    adapter = _Adapter()
+    path = tmp_path / "market.parquet"
+
+    frame, _ = MarketSnapshot(adapter, path).get()
+    reloaded, _ = MarketSnapshot(adapter, path).get()
+
+    assert frame.columns[0] == "symbol"
+    assert frame.set_index("symbol").loc["VCB", "icb_name2"] == "Ngân hàng"
+    assert adapter.calls == 1
+    pd.testing.assert_frame_equal(reloaded, frame)
+
+
+def test_stale_snapshot_is_served_while_refreshing(monkeypatch):
+    adapter = _Adapter()
+    snapshot = MarketSnapshot(adapter, "")
+    snapshot.get()
+    monkeypatch.setattr(settings, "screener_refresh_seconds", 0)
+
+    frame, _ = snapshot.get()
+    deadline = time.time() + 5
+    while adapter.calls < 2 and time.time() < deadline:
+        time.sleep(0.01)
+
+    assert len(frame) == 4
+    assert adapter.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_screener_local_tool(monkeypatch):
+    monkeypatch.setattr(vnstock_adapter, "_adapter_instance", _Adapter())
+    monkeypatch.setattr(settings, "screener_snapshot_path", "")
+    server = FastMCP("test")
+    setup_analytics_tools(server)
+
+    async with Client(server) as client:
+        result = await client.call_tool(
+            "screener_local",
+            {"where": "pe < 18", "sort": ["-roe"], "fields": ["symbol", "roe", "icb_name2"]},
+        )
+        invalid = await client.call_tool("screener_local", {"where": "open('x')"})
+
+    assert result.structured_content["data"] == [
+        {"symbol": "VCB", "roe": 20.0, "icb_name2": "Ngân hàng"},
+        {"symbol": "HPG", "roe": 12.0, "icb_name2": "Tài nguyên"},
+    ]
+    assert "Unsupported syntax" in invalid.structured_content["error"]
+    assert result.structured_content["notes"][0].startswith("Market snapshot built")
+    assert result.structured_content["notes"][0].endswith("(0 min ago)")
@@ -0,0 +1,59 @@
+"""
+Tests for single-flight request coalescing.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from personal_mcp.shared.singleflight import SingleFlight
+
+
+def test_concurrent_identical_calls_run_once():
+    flight = SingleFlight()
+    calls = 0
+    barrier = threading.Barrier(8)
+
+    def slow_fetch():
+        nonlocal calls
+        calls += 1
+        time.sleep(0.2)
+        return "bars"
+
+    def caller():
+        barrier.wait()
+        return flight.do("quote_history:SSI", slow_fetch)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: caller(), range(8)))
+
+    assert results == ["bars"] * 8
+    assert calls == 1
+    assert flight.coalesced == 7
+
+
+def test_followers_receive_leader_exception():
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def failing_fetch():
+        started.set()
+        time.sleep(0.1)
+        raise ConnectionError("upstream down")
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        leader = pool.submit(flight.do, "k", failing_fetch)
+        started.wait()
+        follower = pool.submit(flight.do, "k", failing_fetch)
+        for future in (leader, follower):
+            with pytest.raises(ConnectionError):
+                future.result()
+
+
+def test_sequential_calls_are_not_coalesced():
+    flight = SingleFlight()
+
+    assert flight.do("k", lambda: 1) == 1
+    assert flight.do("k", lambda: 2) == 2
@@ -4,14 +4,15 @@ Company-related MCP tools (extracted from original `main.py`).
 import logging
 from typing import Literal
 
-from mcp_instance import mcp
+from mcp_instance import tool
+from object_pool import pooled
 from vnstock import Company
 from vnstock.explorer.tcbs.company import Company as TCBSCompany
 from vnstock.explorer.vci.company import Company as VCICompany
 
 
-@mcp.tool()
-async def overview(symbol: str, source: Literal["VCI", "TCBS"] = "VCI"):
+@tool()
+def overview(symbol: str, source: Literal["VCI", "TCBS"] = "VCI"):
     """
     Cung cấp tổng quan về công ty cổ phần trên thị trường Việt Nam.
     Retrieve company overview data.
@@ -20,12 +21,12 @@ async def overview(symbol: str, source: Literal["VCI", "TCBS"] = "VCI"):
     """
     logging.info("Processing overview request...")
 
-    company = Company(symbol=symbol, source=source)
+    company = pooled(Company, symbol=symbol, source=source)
     return company.overview()
 
 
-@mcp.tool()
-async def profile(symbol: str):
+@tool(source="TCBS")
+def profile(symbol: str):
     """
     Truy xuất thông tin mô tả công ty theo mã chứng khoán.
     Retrieve company profile data.
@@ -35,12 +36,12 @@ async def profile(symbol: str):
     """
     logging.info("Processing profile request...")
 
-    company = TCBSCompany(symbol=symbol)
+    company = pooled(TCBSCompany, symbol=symbol)
     return company.profile()
 
 
-@mcp.tool()
-async def shareholders(symbol: str, source: Literal["VCI", "TCBS"] = "VCI"):
+@tool()
+def shareholders(symbol: str, source: Literal["VCI", "TCBS"] = "VCI"):
     """
     Truy xuất thông tin cổ đông lớn của một cổ phiếu cụ thể trên thị trường Việt Nam.
     Retrieve company shareholders data.
@@ -50,12 +51,12 @@ async def shareholders(symbol: str, source: Literal["VCI", "TCBS"] = "VCI"):
     """
     logging.info("Processing shareholders request...")
 
-    company = Company(symbol=symbol, source=source)
+    company = pooled(Company, symbol=symbol, source=source)
     return company.shareholders()
 
 
-@mcp.tool()
-async def officers_vci(symbol: str, filter_by: Literal['working', "all", 'resigned']= 'working'):
+@tool()
+def officers_vci(symbol: str, filter_by: Literal['working', "all", 'resigned']= 'working'):
     """
     Truy xuất thông tin ban lãnh đạo của một cổ phiếu cụ thể trên thị trường Việt Nam.
     Retrieve company officers data. Supports kwargs like filter_by='working'|'resigned'|'all'.
@@ -69,12 +70,12 @@ async def officers_vci(symbol: str, filter_by: Literal['working', "all", 'resign
     """
     logging.info("Processing officers request...")
 
-    company = VCICompany(symbol=symbol)
+    company = pooled(VCICompany, symbol=symbol)
     return company.officers(filter_by=filter_by)
 
 
-@mcp.tool()
-async def officers_tcbs(symbol: str, page_size: int = 20, page: int = 0):
+@tool(source="TCBS")
+def officers_tcbs(symbol: str, page_size: int = 20, page: int = 0):
     """
     Truy xuất danh sách lãnh đạo của một công ty theo mã chứng khoán từ nguồn dữ liệu TCBS.
     Retrieve company officers data. 
@@ -86,12 +87,12 @@ async def officers_tcbs(symbol: str, page_size: int = 20, page: int = 0):
     """
     logging.info("Processing officers request...")
 
-    company = TCBSCompany(symbol=symbol)
+    company = pooled(TCBSCompany, symbol=symbol)
     return company.officers(page=page, page_size=page_size)
 
 
-@mcp.tool()
-async def subsidiaries_vci(symbol: str, filter_by: Literal["all", "subsidiary", "affiliate"] = "all"):
+@tool()
+def subsidiaries_vci(symbol: str, filter_by: Literal["all", "subsidiary", "affiliate"] = "all"):
     """
     Truy xuất thông tin công ty con của một cổ phiếu cụ thể trên thị trường Việt Nam.
     Retrieve company subsidiaries data. Supports kwargs like filter_by='all'|'subsidiary'.
@@ -105,12 +106,12 @@ async def subsidiaries_vci(symbol: str, filter_by: Literal["all", "subsidiary",
     """
     logging.info("Processing subsidiaries request...")
 
-    company = VCICompany(symbol=symbol)
+    company = pooled(VCICompany, symbol=symbol)
     return company.subsidiaries(filter_by=filter_by)
 
 
-@mcp.tool()
-async def subsidiaries_tcbs(symbol: str, page_size: int = 100, page: int = 0):
+@tool(source="TCBS")
+def subsidiaries_tcbs(symbol: str, page_size: int = 100, page: int = 0):
     """
     Truy xuất thông tin các công ty con, công ty liên kết của một công ty theo mã chứng khoán từ nguồn dữ liệu TCBS.
     Retrieve company subsidiaries data.
@@ -122,12 +123,12 @@ async def subsidiaries_tcbs(symbol: str, page_size: int = 100, page: int = 0):
     """
     logging.info("Processing subsidiaries request...")
 
-    company = TCBSCompany(symbol=symbol)
+    company = pooled(TCBSCompany, symbol=symbol)
     return company.subsidiaries(page=page, page_size=page_size)
 
 
-@mcp.tool()
-async def dividends(symbol: str, page_size: int = 15, page: int = 0):
+@tool(source="TCBS")
+def dividends(symbol: str, page_size: int = 15, page: int = 0):
     """
     Truy xuất lịch sử cổ tức của một công ty theo mã chứng khoán từ nguồn dữ liệu TCBS.
     Retrieve company dividends data.
@@ -139,12 +140,12 @@ async def dividends(symbol: str, page_size: int = 15, page: int = 0):
     """
     logging.info("Processing dividends request...")
 
-    company = TCBSCompany(symbol=symbol)
+    company = pooled(TCBSCompany, symbol=symbol)
     return company.dividends(page=page, page_size=page_size)
 
 
-@mcp.tool()
-async def insider_deals(symbol: str, page_size: int = 20, page: int = 0):
+@tool(source="TCBS")
+def insider_deals(symbol: str, page_size: int = 20, page: int = 0):
     """
     Truy xuất thông tin giao dịch nội bộ của công ty theo mã chứng khoán từ nguồn dữ liệu TCBS.
     Retrieve company insider deals data.
@@ -156,12 +157,12 @@ async def insider_deals(symbol: str, page_size: int = 20, page: int = 0):
     """
     logging.info("Processing insider_deals request...")
 
-    company = TCBSCompany(symbol=symbol)
+    company = pooled(TCBSCompany, symbol=symbol)
     return company.insider_deals(page=page, page_size=page_size)
 
 
-@mcp.tool()
-async def events(symbol: str, source: Literal["VCI", "TCBS"] = "VCI"):
+@tool()
+def events(symbol: str, source: Literal["VCI", "TCBS"] = "VCI"):
     """
     Truy xuất thông tin sự kiện của một cổ phiếu cụ thể trên thị trường Việt Nam.
     Retrieve company events data.
@@ -171,12 +172,12 @@ async def events(symbol: str, source: Literal["VCI", "TCBS"] = "VCI"):
     """
     logging.info("Processing events request...")
 
-    company = Company(symbol=symbol, source=source)
+    company = pooled(Company, symbol=symbol, source=source)
     return company.events()
 
 
-@mcp.tool()
-async def news(symbol: str, source: Literal["VCI", "TCBS"] = "VCI"):
+@tool()
+def news(symbol: str, source: Literal["VCI", "TCBS"] = "VCI"):
     """
     Truy xuất tin tức liên quan đến công ty.
     Retrieve company news data.
@@ -185,12 +186,12 @@ async def news(symbol: str, source: Literal["VCI", "TCBS"] = "VCI"):
     """
     logging.info("Processing news request...")
 
-    company = Company(symbol=symbol, source=source)
+    company = pooled(Company, symbol=symbol, source=source)
     return company.news()
 
 
-@mcp.tool()
-async def reports(symbol: str):
+@tool()
+def reports(symbol: str):
     """
     Truy xuất báo cáo phân tích về công ty.
     Retrieve company financial reports data.
@@ -200,12 +201,12 @@ async def reports(symbol: str):
     """
     logging.info("Processing reports request...")
 
-    company = VCICompany(symbol=symbol)
+    company = pooled(VCICompany, symbol=symbol)
     return company.reports()
 
 
-@mcp.tool()
-async def ratio_summary(symbol: str):
+@tool()
+def ratio_summary(symbol: str):
     """
     Truy xuất tóm tắt các chỉ số tài chính quan trọng của công ty.
     Retrieve company financial ratio summary data.
@@ -215,12 +216,12 @@ async def ratio_summary(symbol: str):
     """
     logging.info("Processing ratio_summary request...")
 
-    company = VCICompany(symbol=symbol)
+    company = pooled(VCICompany, symbol=symbol)
     return company.ratio_summary()
 
 
-@mcp.tool()
-async def trading_stats(symbol: str):
+@tool()
+def trading_stats(symbol: str):
     """
     Truy xuất thống kê giao dịch của công ty.
     Retrieve company trading statistics data.
@@ -230,5 +231,5 @@ async def trading_stats(symbol: str):
     """
     logging.info("Processing trading_stats request...")
 
-    company = VCICompany(symbol=symbol)
+    company = pooled(VCICompany, symbol=symbol)
     return company.trading_stats()
@@ -6,12 +6,13 @@ Supports both VCI and TCBS data sources.
 import logging
 from typing import Literal
 
-from vnstock import Vnstock, Finance
+from vnstock import Finance
 from vnstock.explorer.vci import Finance as VCIFinance
 from vnstock.explorer.tcbs import Finance as TCBSFinance
 
 
-from mcp_instance import mcp
+from mcp_instance import tool
+from object_pool import pooled
 
 
 # ============================================================================
@@ -19,8 +20,8 @@ from mcp_instance import mcp
 # ============================================================================
 
 
-@mcp.tool()
-async def income_statement_vci(
+@tool()
+def income_statement_vci(
     symbol: str,
     period: Literal["year", "quarter"] = "year",
     lang: Literal["vi", "en"] = "vi",
@@ -43,12 +44,12 @@ async def income_statement_vci(
     """
     logging.info("Processing income_statement_vci for %s...", symbol)
 
-    finance = VCIFinance(symbol=symbol)
+    finance = pooled(VCIFinance, symbol=symbol)
     return finance.income_statement(period=period, lang=lang, dropna=dropna)
 
 
-@mcp.tool()
-async def balance_sheet_vci(
+@tool()
+def balance_sheet_vci(
     symbol: str,
     period: Literal["year", "quarter"] = "year",
     lang: Literal["vi", "en"] = "vi",
@@ -72,12 +73,12 @@ async def balance_sheet_vci(
     logging.info("Processing balance_sheet_vci for %s...", symbol)
 
 
-    finance = VCIFinance(symbol=symbol)
+    finance = pooled(VCIFinance, symbol=symbol)
     return finance.balance_sheet(period=period, lang=lang, dropna=dropna)
 
 
-@mcp.tool()
-async def cash_flow_vci(
+@tool()
+def cash_flow_vci(
     symbol: str,
     period: Literal["year", "quarter"] = "year",
     lang: Literal["vi", "en"] = "vi",
@@ -100,12 +101,12 @@ async def cash_flow_vci(
     """
     logging.info("Processing cash_flow_vci for %s...", symbol)
 
-    finance = VCIFinance(symbol=symbol)
+    finance = pooled(VCIFinance, symbol=symbol)
     return finance.cash_flow(period=period, lang=lang, dropna=dropna)
 
 
-@mcp.tool()
-async def financial_ratio_vci(
+@tool()
+def financial_ratio_vci(
     symbol: str,
     period: Literal["year", "quarter"] = "year",
     lang: Literal["vi", "en"] = "vi",
@@ -127,7 +128,7 @@ async def financial_ratio_vci(
     """
     logging.info("Processing financial_ratio_vci for %s...", symbol)
 
-    finance = VCIFinance(symbol=symbol)
+    finance = pooled(VCIFinance, symbol=symbol)
     return finance.ratio(period=period, lang=lang, dropna=dropna)
 
 
@@ -136,8 +137,8 @@ async def financial_ratio_vci(
 # ============================================================================
 
 
-@mcp.tool()
-async def income_statement_tcbs(
+@tool(source="TCBS")
+def income_statement_tcbs(
     symbol: str,
     period: Literal["year", "quarter"] = "year",
 ):
@@ -156,12 +157,12 @@ async def income_statement_tcbs(
     """
     logging.info("Processing income_statement_tcbs for %s...", symbol)
 
-    finance = TCBSFinance(symbol=symbol)
+    finance = pooled(TCBSFinance, symbol=symbol)
     return finance.income_statement(period=period)
 
 
-@mcp.tool()
-async def balance_sheet_tcbs(
+@tool(source="TCBS")
+def balance_sheet_tcbs(
     symbol: str,
     period: Literal["year", "quarter"] = "year",
 ):
@@ -180,13 +181,12 @@ async def balance_sheet_tcbs(
     """
     logging.info("Processing balance_sheet_tcbs for %s...", symbol)
 
-    stock = Vnstock().stock(symbol=symbol, source="TCBS")
-    finance = stock.finance
+    finance = pooled(TCBSFinance, symbol=symbol)
     return finance.balance_sheet(period=period)
 
 
-@mcp.tool()
-async def cash_flow_tcbs(
+@tool(source="TCBS")
+def cash_flow_tcbs(
     symbol: str,
     period: Literal["year", "quarter"] = "year",
 ):
@@ -205,13 +205,12 @@ async def cash_flow_tcbs(
     """
     logging.info("Processing cash_flow_tcbs for %s...", symbol)
 
-    stock = Vnstock().stock(symbol=symbol, source="TCBS")
-    finance = stock.finance
+    finance = pooled(TCBSFinance, symbol=symbol)
     return finance.cash_flow(period=period)
 
 
-@mcp.tool()
-async def financial_ratio_tcbs(
+@tool(source="TCBS")
+def financial_ratio_tcbs(
     symbol: str,
     period: Literal["year", "quarter"] = "year",
     get_all: bool = True,
@@ -231,6 +230,5 @@ async def financial_ratio_tcbs(
     """
     logging.info("Processing financial_ratio_tcbs for %s...", symbol)
 
-    stock = Vnstock().stock(symbol=symbol, source="TCBS")
-    finance = stock.finance
+    finance = pooled(TCBSFinance, symbol=symbol)
     return finance.ratio(period=period, get_all=get_all)
@@ -5,11 +5,12 @@ Fund-related tools for MCP.
 import logging
 
 from vnstock import Fund
-from mcp_instance import mcp
+from mcp_instance import tool
+from object_pool import pooled
 
 
-@mcp.tool()
-async def fund_listing(fund_type: str = ""):
+@tool(source="FMARKET")
+def fund_listing(fund_type: str = ""):
     """
     Truy xuất danh sách quỹ đầu tư trên thị trường Việt Nam.
     Retrieve fund listing.
@@ -23,12 +24,12 @@ async def fund_listing(fund_type: str = ""):
     """
     logging.info("Processing fund listing request...")
 
-    fund = Fund()
+    fund = pooled(Fund)
     return fund.listing(fund_type=fund_type)
 
 
-@mcp.tool()
-async def fund_filter(symbol: str = ""):
+@tool(source="FMARKET")
+def fund_filter(symbol: str = ""):
     """
     Truy xuất danh sách quỹ theo tên viết tắt (short_name) và mã id của quỹ. Mặc định là rỗng để liệt kê tất cả các quỹ.
     Filter funds by category.
@@ -38,12 +39,12 @@ async def fund_filter(symbol: str = ""):
     """
     logging.info("Processing fund filter request...")
 
-    fund = Fund()
+    fund = pooled(Fund)
     return fund.filter(symbol=symbol)
 
 
-@mcp.tool()
-async def fund_nav_report(symbol: str):
+@tool(source="FMARKET")
+def fund_nav_report(symbol: str):
     """
     Báo cáo tăng trưởng NAV của quỹ đầu tư.
 
@@ -53,12 +54,12 @@ async def fund_nav_report(symbol: str):
     """
     logging.info("Processing fund NAV report request...")
 
-    fund = Fund()
+    fund = pooled(Fund)
     return fund.details.nav_report(symbol=symbol)
 
 
-@mcp.tool()
-async def fund_top_holding(symbol: str):
+@tool(source="FMARKET")
+def fund_top_holding(symbol: str):
     """
     Danh mục đầu tư lớn nhất của quỹ đầu tư.
 
@@ -68,12 +69,12 @@ async def fund_top_holding(symbol: str):
     """
     logging.info("Processing fund top holdings request...")
 
-    fund = Fund()
+    fund = pooled(Fund)
     return fund.details.top_holding(symbol=symbol)
 
 
-@mcp.tool()
-async def fund_industry_holding(symbol: str):
+@tool(source="FMARKET")
+def fund_industry_holding(symbol: str):
     """
     Phân bổ theo ngành của quỹ đầu tư.
 
@@ -83,12 +84,12 @@ async def fund_industry_holding(symbol: str):
     """
     logging.info("Processing fund industry holdings request...")
 
-    fund = Fund()
+    fund = pooled(Fund)
     return fund.details.industry_holding(symbol=symbol)
 
 
-@mcp.tool()
-async def fund_asset_holding(symbol: str):
+@tool(source="FMARKET")
+def fund_asset_holding(symbol: str):
     """
     Phân bổ theo loại tài sản của quỹ đầu tư.
 
@@ -98,6 +99,6 @@ async def fund_asset_holding(symbol: str):
     """
     logging.info("Processing fund asset holdings request...")
 
-    fund = Fund()
+    fund = pooled(Fund)
     return fund.details.asset_holding(symbol=symbol)
 
@@ -6,11 +6,11 @@ import logging
 
 from vnstock.explorer.misc.gold_price import * 
 from vnstock.explorer.misc.exchange_rate import *
-from mcp_instance import mcp
+from mcp_instance import tool
 
 
-@mcp.tool()
-async def get_sjc_gold_price(date: str = None):
+@tool(source="SJC")
+def get_sjc_gold_price(date: str = None):
     """
     Truy xuất giá vàng SJC hiện tại.
     Retrieve current SJC gold price.
@@ -24,8 +24,8 @@ async def get_sjc_gold_price(date: str = None):
     return sjc_gold_price(date=date)
 
 
-@mcp.tool()
-async def get_btmc_goldprice():
+@tool(source="BTMC")
+def get_btmc_goldprice():
     """
     Parse dữ liệu giá vàng từ API JSON Bảo Tín Minh Châu.
     """
@@ -34,8 +34,8 @@ async def get_btmc_goldprice():
     return btmc_goldprice()
 
 
-@mcp.tool()
-async def get_vcb_exchange_rate(date: str = None):
+@tool(source="VCB")
+def get_vcb_exchange_rate(date: str = None):
     """
     Truy xuất tỷ giá ngoại tệ từ Vietcombank.
     Retrieve exchange rates from Vietcombank.
@@ -0,0 +1,68 @@
+"""
+Statistical summary of OHLC histories.
+
+`mode="summary"` on the history tools returns one row of statistics computed
+with numpy from the fetched (or stored) bars instead of every bar: a fixed,
+few-hundred-byte result whatever the period length.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+# Bars per year by interval, for annualized volatility. Case matters: "1m" is
+# one minute, and intraday bars are not annualized
+_BARS_PER_YEAR = {
+    **dict.fromkeys(("1D", "1d", "D", "d"), 252),
+    **dict.fromkeys(("1W", "1w", "W", "w"), 52),
+    **dict.fromkeys(("1M", "M"), 12),
+}
+
+
+def summarize(frame: pd.DataFrame, interval: str = "1D") -> pd.DataFrame:
+    """
+    Reduce an OHLCV history to one row of statistics.
+    Tóm tắt dữ liệu OHLC: lợi suất, biến động, cao/thấp, sụt giảm tối đa, giá cuối.
+
+    Columns: bars, start, end, first_close, last_close, change, return_pct,
+    high, low, mean_return_pct, volatility_pct, annualized_volatility_pct
+    (daily/weekly/monthly bars), max_drawdown_pct, max_drawdown_at, avg_volume.
+    """
+    if frame is None or "close" not in frame.columns:
+        return pd.DataFrame()
+    frame = frame[frame["close"].notna()]
+    if frame.empty:
+        return pd.DataFrame()
+
+    close = frame["close"].to_numpy(dtype=float)
+    high = frame["high"].to_numpy(dtype=float) if "high" in frame.columns else close
+    low = frame["low"].to_numpy(dtype=float) if "low" in frame.columns else close
+    # Zero prices give infinite returns, sent as null
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = close[1:] / close[:-1] - 1
+        total_return = close[-1] / close[0] - 1
+        drawdown = close / np.fmax.accumulate(close) - 1
+    trough = int(np.nanargmin(drawdown)) if np.isfinite(drawdown).any() else 0
+
+    row = {"bars": len(frame)}
+    if "time" in frame.columns:
+        row.update(start=frame["time"].iloc[0], end=frame["time"].iloc[-1])
+    row.update(
+        first_close=close[0],
+        last_close=close[-1],
+        change=close[-1] - close[0],
+        return_pct=total_return * 100,
+        high=np.nanmax(high),
+        low=np.nanmin(low),
+        mean_return_pct=returns.mean() * 100 if len(returns) else np.nan,
+        volatility_pct=returns.std(ddof=1) * 100 if len(returns) > 1 else np.nan,
+    )
+    bars_per_year = _BARS_PER_YEAR.get(interval)
+    if bars_per_year:
+        row["annualized_volatility_pct"] = row["volatility_pct"] * np.sqrt(bars_per_year)
+    row["max_drawdown_pct"] = drawdown[trough] * 100
+    if "time" in frame.columns:
+        row["max_drawdown_at"] = frame["time"].iloc[trough]
+    if "volume" in frame.columns:
+        row["avg_volume"] = frame["volume"].mean()
+    return pd.DataFrame([row])
@@ -0,0 +1,59 @@
+"""
+Process-wide pooled HTTP session for vnstock requests.
+
+vnstock calls the module-level `requests.get` / `requests.post` /
+`requests.request` helpers, each of which opens a throwaway session, so
+every tool call pays DNS, TCP and TLS setup again. `install()` routes those
+helpers through one shared keep-alive session.
+
+Configuration (environment variables):
+    - TRADDING_MCP_HTTP_POOL_HOSTS: hosts kept in the pool (default 32).
+    - TRADDING_MCP_HTTP_POOL_SIZE: connections kept per host (default 8).
+    - TRADDING_MCP_HTTP_TIMEOUT: timeout in seconds for requests that do not
+      set one (default 30).
+"""
+
+import logging
+import os
+import threading
+
+import requests
+import requests.api
+from requests.adapters import HTTPAdapter
+
+
+POOL_HOSTS = int(os.getenv("TRADDING_MCP_HTTP_POOL_HOSTS", "32"))
+POOL_SIZE = int(os.getenv("TRADDING_MCP_HTTP_POOL_SIZE", "8"))
+TIMEOUT = float(os.getenv("TRADDING_MCP_HTTP_TIMEOUT", "30"))
+
+_session = None
+_lock = threading.Lock()
+
+
+def pooled_request(method, url, **kwargs):
+    """
+    Drop-in replacement for `requests.request` using the shared session.
+    Gửi request qua session dùng chung (giữ kết nối keep-alive).
+    """
+    kwargs.setdefault("timeout", TIMEOUT)
+    return _session.request(method=method, url=url, **kwargs)
+
+
+def install():
+    """
+    Route module-level `requests` calls through the shared session (idempotent).
+    """
+    global _session
+    with _lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=POOL_HOSTS, pool_maxsize=POOL_SIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+            # requests.get/post/... call requests.api.request; requests.request
+            # is a separate reference to the same function
+            requests.api.request = pooled_request
+            requests.request = pooled_request
+            logging.info("HTTP session pool ready with %d connections per host", POOL_SIZE)
+        return _session
@@ -6,11 +6,12 @@ from typing import Literal
 
 from vnstock.explorer.vci.listing import Listing as VCIListing
 from vnstock.explorer.msn.listing import Listing as MSNListing
-from mcp_instance import mcp
+from mcp_instance import tool
+from object_pool import pooled
 
 
-@mcp.tool()
-async def all_symbols(show_log: bool = False):
+@tool()
+def all_symbols(show_log: bool = False):
     """
     Truy xuất danh sách toàn. bộ mã và tên các cổ phiếu trên thị trường Việt Nam.
     Retrieve all symbols (filtered to STOCK).
@@ -20,12 +21,12 @@ async def all_symbols(show_log: bool = False):
     """
     logging.info("Processing all_symbols request...")
 
-    listing = VCIListing()
+    listing = pooled(VCIListing)
     return listing.all_symbols(show_log=show_log)
 
 
-@mcp.tool()
-async def symbols_by_exchange(lang: str = "vi", show_log: bool = False):
+@tool()
+def symbols_by_exchange(lang: str = "vi", show_log: bool = False):
     """
     Truy xuất danh sách mã và tên các cổ phiếu theo sàn giao dịch trên thị trường Việt Nam.
     Retrieve symbols by exchange/board.
@@ -36,12 +37,12 @@ async def symbols_by_exchange(lang: str = "vi", show_log: bool = False):
     """
     logging.info("Processing symbol_by_exchange request...")
 
-    listing = VCIListing()
+    listing = pooled(VCIListing)
     return listing.symbols_by_exchange(lang=lang, show_log=show_log)
 
 
-@mcp.tool()
-async def symbols_by_group(group: str = "VN30", show_log: bool = False):
+@tool()
+def symbols_by_group(group: str = "VN30", show_log: bool = False):
     """
     Retrieve symbols by predefined group (VN30, HNX30, CW, etc.).
     Liệt kê tất cả mã chứng khoán theo nhóm phân loại.
@@ -57,12 +58,12 @@ async def symbols_by_group(group: str = "VN30", show_log: bool = False):
     """
     logging.info("Processing symbol_by_group request...")
 
-    listing = VCIListing()
+    listing = pooled(VCIListing)
     return listing.symbols_by_group(group=group, show_log=show_log)
 
 
-@mcp.tool()
-async def symbols_by_industries(language: str = "vi", show_log: bool = False):
+@tool()
+def symbols_by_industries(language: str = "vi", show_log: bool = False):
     """
     Truy xuất danh sách mã và tên các cổ phiếu theo ngành nghề trên thị trường Việt Nam.
     Retrieve symbols by industries.
@@ -73,12 +74,12 @@ async def symbols_by_industries(language: str = "vi", show_log: bool = False):
     """
     logging.info("Processing symbol_by_industries request...")
 
-    listing = VCIListing()
+    listing = pooled(VCIListing)
     return listing.symbols_by_industries(lang=language, show_log=show_log)
 
 
-@mcp.tool()
-async def industries_icb(show_log: bool = False):
+@tool()
+def industries_icb(show_log: bool = False):
     """
     Truy xuất danh sách ngành nghề theo chuẩn ICB trên thị trường Việt Nam.
     Retrieve industries by ICB classification.
@@ -88,12 +89,12 @@ async def industries_icb(show_log: bool = False):
     """
     logging.info("Processing industries_icb request...")
 
-    listing = VCIListing()
+    listing = pooled(VCIListing)
     return listing.industries_icb(show_log=show_log)
 
 
-@mcp.tool()
-async def all_indices():
+@tool()
+def all_indices():
     """
     Truy xuất danh sách tất cả các chỉ số thị trường trên sàn chứng khoán Việt Nam.
     Retrieve all market indices.
@@ -102,12 +103,12 @@ async def all_indices():
     """
     logging.info("Processing all_indices request...")
 
-    listing = VCIListing()
+    listing = pooled(VCIListing)
     return listing.all_indices()
 
 
-@mcp.tool()
-async def indices_by_group(group: Literal["HOSE Indices", "Sector Indices", "Investment Indices", "VNX Indices"] = "HOSE Indices"):
+@tool()
+def indices_by_group(group: Literal["HOSE Indices", "Sector Indices", "Investment Indices", "VNX Indices"] = "HOSE Indices"):
     """
     Lấy danh sách chỉ số theo nhóm tiêu chuẩn hóa.
     Retrieve market indices by group.
@@ -121,12 +122,12 @@ async def indices_by_group(group: Literal["HOSE Indices", "Sector Indices", "Inv
     """
     logging.info("Processing indices_by_group request...")
 
-    listing = VCIListing()
+    listing = pooled(VCIListing)
     return listing.indices_by_group(group=group)
 
 
-@mcp.tool()
-async def search_symbol_id(query: str, locale: str = None, limit: int = 10, show_log: bool = False):
+@tool(source="MSN")
+def search_symbol_id(query: str, locale: str = None, limit: int = 10, show_log: bool = False):
     """
     Truy xuất danh sách toàn bộ mã và tên các cổ phiếu từ thị trường.
     Search for a stock symbol and return detailed information.
@@ -139,5 +140,5 @@ async def search_symbol_id(query: str, locale: str = None, limit: int = 10, show
     """
     logging.info("Processing search_symbol_id request...")
 
-    listing = MSNListing()
+    listing = pooled(MSNListing)
     return listing.search_symbol_id(query=query, locale=locale, limit=limit, show_log=show_log)
@@ -7,7 +7,7 @@ This file now only imports the tool modules so they register with the shared
 import asyncio
 import logging
 
-# Import modules so their `@mcp.tool()` functions register on import.
+# Import modules so their `@tool()` functions register on import.
 import company_tools  # noqa: F401
 import listing_tools  # noqa: F401
 import quote_tools  # noqa: F401
@@ -15,6 +15,7 @@ import trading_tools  # noqa: F401
 import fund_tools  # noqa: F401
 import gold_tools  # noqa: F401
 import finance_tools  # noqa: F401
+import result_tools  # noqa: F401
 
 from mcp_instance import mcp
 
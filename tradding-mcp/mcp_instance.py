@@ -1,9 +1,55 @@
 """
 MCP instance provider for the project.
 
-Expose a single `mcp` object so tool modules can register with it.
+Expose a single `mcp` object so tool modules can register with it, and a
+`tool()` decorator that registers blocking vnstock functions so they run on
+the shared worker pool instead of the event loop, paced by the rate limiter
+and circuit breaker of their upstream source, with DataFrame results sent as
+structured payloads (see `payloads.py`). Importing this module also routes
+vnstock's HTTP traffic through the shared keep-alive pool.
 """
+import functools
+
 from mcp.server.fastmcp import FastMCP
 
+import http_pool
+from payloads import formatted
+from resilience import get_source_guard
+from worker_pool import offload
+
 
 mcp = FastMCP("tradding-mcp")
+http_pool.install()
+
+
+def guarded(func, source: str):
+    """
+    Wrap a blocking function so it runs through the guard of its source.
+
+    A `source` argument passed to the tool takes precedence over `source`.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return get_source_guard(kwargs.get("source") or source).call(func, *args, **kwargs)
+
+    return wrapper
+
+
+def tool(source: str | None = "VCI", **kwargs):
+    """
+    Register a blocking (plain `def`) function as an MCP tool.
+    Đăng ký hàm đồng bộ làm MCP tool, chạy trên worker pool.
+
+    `source` is the upstream the tool calls (None: the tool guards its own
+    upstream calls). Other keyword arguments are passed to `mcp.tool()`.
+    The tool gains a `format` argument selecting the payload layout.
+    """
+
+    def decorator(func):
+        if source:
+            func = guarded(func, source)
+        # Payloads are built on the worker thread too, off the event loop
+        return mcp.tool(**kwargs)(offload(formatted(func)))
+
+    return decorator
@@ -0,0 +1,63 @@
+"""
+Pool of reusable vnstock objects.
+
+`Company(symbol=...)`, `VCIFinance(symbol=...)`, `Fund()`, `VCIListing()`
+and friends were built on every tool call. `pooled()` keeps one instance per
+(class, symbol, source) so repeated calls reuse it. The pool is bounded
+(TRADDING_MCP_POOL_SIZE, default 512) and drops objects idle for longer than
+TRADDING_MCP_POOL_IDLE seconds (default 900).
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+
+
+POOL_SIZE = int(os.getenv("TRADDING_MCP_POOL_SIZE", "512"))
+POOL_IDLE = float(os.getenv("TRADDING_MCP_POOL_IDLE", "900"))
+
+# Keyword arguments vnstock treats case-insensitively
+_CASELESS = ("symbol", "source")
+
+_slots: OrderedDict = OrderedDict()
+_lock = threading.Lock()
+
+
+def _key(factory, kwargs):
+    args = tuple(
+        sorted(
+            (name, value.upper() if name in _CASELESS and isinstance(value, str) else value)
+            for name, value in kwargs.items()
+        )
+    )
+    return (factory, args)
+
+
+def pooled(factory, **kwargs):
+    """
+    Return a shared `factory(**kwargs)`, building it on first use.
+    Lấy đối tượng dùng chung theo (lớp, mã, nguồn), chỉ khởi tạo một lần.
+    """
+    if POOL_SIZE <= 0:
+        return factory(**kwargs)
+    key = _key(factory, kwargs)
+    now = time.monotonic()
+    with _lock:
+        # Slots are ordered by last use, so idle ones are at the front
+        while _slots and now - next(iter(_slots.values()))[1] >= POOL_IDLE:
+            _slots.popitem(last=False)
+        if key in _slots:
+            obj = _slots.pop(key)[0]
+            _slots[key] = (obj, now)
+            return obj
+
+    # Build outside the lock; constructors may do network I/O
+    obj = factory(**kwargs)
+    with _lock:
+        if key in _slots:
+            return _slots[key][0]
+        _slots[key] = (obj, now)
+        while len(_slots) > POOL_SIZE:
+            _slots.popitem(last=False)
+    return obj
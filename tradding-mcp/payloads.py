@@ -0,0 +1,286 @@
+"""
+Structured payloads for DataFrame results.
+
+Tools used to return DataFrames that the MCP layer rendered with `str(df)`:
+a truncated, human-oriented repr. `formatted()` converts DataFrame/Series
+results into JSON sent as `structuredContent` plus a compact text copy, in
+the layout chosen by the tool's `format` argument:
+
+- `records`: `{"data": [{"col": v, ...}, ...]}`, one object per row.
+- `columns`: `{"data": {"col": [v, ...], ...}}`, one array per column.
+- `split`: `{"columns": [...], "dtypes": [...], "data": [[v, ...], ...]}`.
+
+`columns` and `split` name each column once instead of once per row.
+
+Tools also accept `fields`, `filter`, `limit` and `offset` (see
+`shape_frame`), applied before serialization so unused columns and rows are
+never encoded.
+
+Results longer than TRADDING_MCP_PAGE_ROWS (default 1000, 0 disables) are
+returned page by page: the response holds the first page plus `total` and
+`next_cursor`, and the full frame is kept in memory (at most
+TRADDING_MCP_CURSOR_MAX results for TRADDING_MCP_CURSOR_TTL seconds) for the
+`next_page` / `stream_pages` tools.
+
+Numbers are rounded as they are serialized: price columns (open, high, low,
+close, *_price, ...) to TRADDING_MCP_PRICE_DECIMALS (default 2, prices are in
+thousands of VND), other floats to TRADDING_MCP_FLOAT_DECIMALS (default 4);
+-1 keeps every digit. Timestamps at midnight are written as plain dates
+unless TRADDING_MCP_COMPACT_DATES is 0.
+"""
+
+import functools
+import inspect
+import os
+import re
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Literal, Optional
+
+import numpy as np
+import pandas as pd
+import pydantic_core
+from mcp.types import CallToolResult, TextContent
+
+
+OutputFormat = Literal["records", "columns", "split"]
+
+PAGE_ROWS = int(os.getenv("TRADDING_MCP_PAGE_ROWS", "1000"))
+CURSOR_TTL = float(os.getenv("TRADDING_MCP_CURSOR_TTL", "600"))
+CURSOR_MAX = int(os.getenv("TRADDING_MCP_CURSOR_MAX", "32"))
+PRICE_DECIMALS = int(os.getenv("TRADDING_MCP_PRICE_DECIMALS", "2"))
+FLOAT_DECIMALS = int(os.getenv("TRADDING_MCP_FLOAT_DECIMALS", "4"))
+COMPACT_DATES = os.getenv("TRADDING_MCP_COMPACT_DATES", "1") != "0"
+
+PRICE_COLUMNS = frozenset(
+    {"open", "high", "low", "close", "price", "ceiling", "floor", "reference", "ref_price", "bid", "ask"}
+)
+
+# snapshot id -> (frame, format, expires at), oldest first
+_snapshots: OrderedDict = OrderedDict()
+_snapshots_lock = threading.Lock()
+
+
+def _native(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    if value is pd.NaT:
+        return None
+    return value
+
+
+def _decimals(name) -> int:
+    name = str(name).lower()
+    return PRICE_DECIMALS if name in PRICE_COLUMNS or name.endswith("_price") else FLOAT_DECIMALS
+
+
+def _column_values(column: pd.Series) -> list:
+    if isinstance(column.dtype, pd.DatetimeTZDtype) or pd.api.types.is_datetime64_dtype(column.dtype):
+        valid = column.dropna()
+        compact = COMPACT_DATES and bool((valid == valid.dt.normalize()).all())
+        text = column.dt.strftime("%Y-%m-%d" if compact else "%Y-%m-%dT%H:%M:%S")
+        return text.astype(object).where(column.notna(), None).tolist()
+    if isinstance(column.dtype, np.dtype) and column.dtype.kind == "f":
+        values = column.to_numpy(dtype=np.float64)
+        decimals = _decimals(column.name)
+        return (values.round(decimals) if decimals >= 0 else values).tolist()
+    if isinstance(column.dtype, np.dtype) and column.dtype != object:
+        # NaN is written as null by the encoder
+        return column.tolist()
+    # Object and extension dtypes may hold numpy scalars, NA or NaT
+    values = column.astype(object).where(column.notna(), None)
+    return [_native(v) for v in values.tolist()]
+
+
+def to_payload(frame: pd.DataFrame, format: OutputFormat = "records") -> dict[str, Any]:
+    """
+    Lay out a DataFrame (index dropped) in one of the output formats.
+    Chuyển DataFrame sang payload JSON theo định dạng `format`.
+    """
+    names = [str(c) for c in frame.columns]
+    columns = [_column_values(frame.iloc[:, i]) for i in range(frame.shape[1])]
+    if format == "records":
+        return {"data": [dict(zip(names, row)) for row in zip(*columns)]}
+    if format == "columns":
+        return {"data": dict(zip(names, columns))}
+    if format == "split":
+        return {
+            "columns": names,
+            "dtypes": [str(t) for t in frame.dtypes],
+            "data": [list(row) for row in zip(*columns)],
+        }
+    raise ValueError(f"Unknown output format: {format}")
+
+
+def _page(frame: pd.DataFrame, format: OutputFormat, snapshot: str, offset: int) -> dict[str, Any]:
+    end = offset + max(PAGE_ROWS, 1)
+    payload = to_payload(frame.iloc[offset:end], format)
+    payload["total"] = len(frame)
+    if end < len(frame):
+        payload["next_cursor"] = f"{snapshot}:{end}"
+    return payload
+
+
+def paged(frame: pd.DataFrame, format: OutputFormat = "records") -> dict[str, Any]:
+    """
+    Lay out a result, keeping it server-side when it spans several pages.
+    Trả về trang đầu tiên kèm `next_cursor` nếu kết quả quá dài.
+    """
+    if PAGE_ROWS <= 0 or len(frame) <= PAGE_ROWS:
+        return to_payload(frame, format)
+    snapshot = secrets.token_urlsafe(12)
+    now = time.monotonic()
+    with _snapshots_lock:
+        while _snapshots and (len(_snapshots) >= CURSOR_MAX or next(iter(_snapshots.values()))[2] <= now):
+            _snapshots.popitem(last=False)
+        _snapshots[snapshot] = (frame, format, now + CURSOR_TTL)
+    return _page(frame, format, snapshot, 0)
+
+
+def from_cursor(cursor: str) -> dict[str, Any]:
+    """
+    Return the page a `next_cursor` token points to.
+    Lấy trang dữ liệu tiếp theo theo `next_cursor`.
+    """
+    snapshot, _, offset = cursor.rpartition(":")
+    if not snapshot or not offset.isdigit():
+        raise ValueError(f"Invalid cursor: {cursor}")
+    with _snapshots_lock:
+        held = _snapshots.get(snapshot)
+    if held is None or held[2] <= time.monotonic():
+        raise ValueError("Cursor has expired; run the original query again")
+    frame, format, _ = held
+    return _page(frame, format, snapshot, int(offset))
+
+
+def payload_json(payload: dict[str, Any]) -> str:
+    """
+    Encode a payload as compact JSON (NaN becomes null).
+    """
+    return pydantic_core.to_json(payload, inf_nan_mode="null").decode()
+
+
+def to_result(payload: dict[str, Any]) -> CallToolResult:
+    """
+    Build the MCP result: payload as `structuredContent` plus its compact JSON text.
+    """
+    text = payload_json(payload)
+    return CallToolResult(content=[TextContent(type="text", text=text)], structuredContent=payload)
+
+
+_PREDICATE = re.compile(r"^\s*(.+?)\s*(==|!=|>=|<=|>|<|~)\s*(.*?)\s*$")
+
+
+def _predicate_mask(frame: pd.DataFrame, columns: dict, predicate: str) -> pd.Series:
+    match = _PREDICATE.match(predicate)
+    if match is None:
+        raise ValueError(f"Invalid filter {predicate!r}, expected '<field> <op> <value>'")
+    name, op, raw = match.groups()
+    if name not in columns:
+        raise ValueError(f"Unknown filter field: {name}")
+    column = frame[columns[name]]
+    raw = raw.strip("'\"")
+    if op == "~":
+        return column.astype(str).str.contains(raw, case=False, regex=False)
+
+    if pd.api.types.is_bool_dtype(column.dtype):
+        value = raw.lower() in ("true", "1")
+    elif pd.api.types.is_numeric_dtype(column.dtype):
+        value = float(raw)
+    elif isinstance(column.dtype, pd.DatetimeTZDtype):
+        value = pd.Timestamp(raw)
+        if value.tzinfo is None:
+            value = value.tz_localize(column.dt.tz)
+    elif pd.api.types.is_datetime64_dtype(column.dtype):
+        value = pd.Timestamp(raw)
+    else:
+        column, value = column.astype(str), raw
+    compare = {
+        "==": column.__eq__,
+        "!=": column.__ne__,
+        ">=": column.__ge__,
+        "<=": column.__le__,
+        ">": column.__gt__,
+        "<": column.__lt__,
+    }[op]
+    return compare(value).fillna(False).astype(bool)
+
+
+def shape_frame(
+    frame: pd.DataFrame,
+    fields: Optional[list[str]] = None,
+    filter: Optional[list[str]] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> pd.DataFrame:
+    """
+    Filter, page and project a DataFrame before it is serialized.
+    Lọc dòng, phân trang và chọn cột trước khi trả về.
+
+    - fields: columns to keep, in order (default: all).
+    - filter: predicates "<field> <op> <value>" combined with AND; op is one of
+      == != > >= < <= or ~ (case-insensitive substring).
+    - limit / offset: rows to keep / skip after filtering.
+    """
+    if not fields and not filter and limit is None and not offset:
+        return frame
+    if offset < 0 or (limit is not None and limit < 0):
+        raise ValueError("limit and offset must not be negative")
+    columns = {str(c): c for c in frame.columns}
+
+    if filter:
+        mask = pd.Series(True, index=frame.index)
+        for predicate in filter:
+            mask &= _predicate_mask(frame, columns, predicate)
+        frame = frame[mask.to_numpy()]
+    if offset or limit is not None:
+        frame = frame.iloc[offset : None if limit is None else offset + limit]
+    if fields:
+        unknown = [f for f in fields if f not in columns]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+        frame = frame[[columns[f] for f in fields]]
+    return frame
+
+
+# Arguments added to every DataFrame tool: (name, default, annotation)
+_SHAPE_PARAMS = (
+    ("format", "records", OutputFormat),
+    ("fields", None, Optional[list[str]]),
+    ("filter", None, Optional[list[str]]),
+    ("limit", None, Optional[int]),
+    ("offset", 0, int),
+)
+
+
+def formatted(func):
+    """
+    Wrap a blocking tool function so DataFrame/Series results become payloads.
+    Thêm tham số `format`, `fields`, `filter`, `limit`, `offset` cho tool trả về DataFrame.
+
+    The extra arguments appear in the tool schema, except those the function
+    already takes (e.g. an upstream `limit`), which stay the function's own.
+    Other results are returned unchanged.
+    """
+    signature = inspect.signature(func)
+    added = [p for p in _SHAPE_PARAMS if p[0] not in signature.parameters]
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        options = {name: kwargs.pop(name, default) for name, default, _ in added}
+        result = func(*args, **kwargs)
+        if isinstance(result, pd.Series):
+            result = result.to_frame(name=result.name if result.name is not None else "value")
+        if isinstance(result, pd.DataFrame):
+            format = options.pop("format", "records")
+            return to_result(paged(shape_frame(result, **options), format))
+        return result
+
+    params = [
+        inspect.Parameter(name, inspect.Parameter.KEYWORD_ONLY, default=default, annotation=annotation)
+        for name, default, annotation in added
+    ]
+    wrapper.__signature__ = signature.replace(parameters=[*signature.parameters.values(), *params])
+    return wrapper
@@ -2,20 +2,52 @@
 Quote related MCP tools (extracted from original `main.py`).
 """
 
+import asyncio
 import logging
 from typing import Literal
 
+import pandas as pd
 from vnstock import Quote, Vnstock
-from mcp_instance import mcp
+from vnstock.explorer.vci.listing import Listing as VCIListing
+from history_summary import summarize
+from mcp_instance import mcp, tool
+from object_pool import pooled
+from ohlc_store import STORED_INTERVALS, normalize_interval, store
+from payloads import OutputFormat, paged, shape_frame, to_payload, to_result
+from resilience import get_source_guard
+from worker_pool import run_in_pool, source_semaphore
 
 
-@mcp.tool()
-async def history(
+def _load_history(symbol: str, start: str, end: str, interval: str, source: str):
+    """
+    Fetch OHLC bars, serving intraday/daily bars from the local store.
+
+    Only upstream fetches go through the source guard, so stored bars stay
+    available while the source is down.
+    """
+    quote = pooled(Quote, symbol=symbol, source=source)
+    guard = get_source_guard(source)
+    if store is not None and normalize_interval(interval) in STORED_INTERVALS:
+        # Serve from the local Parquet store, fetching only missing dates
+        return store.history(
+            symbol=symbol,
+            start=start,
+            end=end,
+            interval=normalize_interval(interval),
+            fetch=lambda lo, hi: guard.call(quote.history, start=lo, end=hi, interval=interval),
+            source=source,
+        )
+    return guard.call(quote.history, start=start, end=end, interval=interval)
+
+
+@tool(source=None)
+def history(
     symbol: str,
     start: str,
     end: str,
     interval: str = "1d",
     source: Literal["VCI", "TCBS"] = "VCI",
+    mode: Literal["bars", "summary"] = "bars",
 ):
     """
     Load historical OHLC data for the symbol. Tải dữ liệu OHLC lịch sử cho mã chứng khoán.
@@ -36,15 +68,115 @@ async def history(
         - interval : str, optional
         Data interval (1m, 5m, 15m, 30m, 1H, D, 1W, 1M).
         Khoảng thời gian dữ liệu (1m, 5m, 15m, 30m, 1H, D, 1W, 1M).
+
+        - mode : "bars" | "summary"
+        bars: every bar. summary: one row of statistics (return, volatility,
+        high/low, max drawdown, last close).
+        Trả về toàn bộ nến hoặc một dòng thống kê tóm tắt.
     """
     logging.info("Processing history request...")
 
-    quote = Quote(symbol=symbol, source=source)
-    return quote.history(start=start, end=end, interval=interval)
+    bars = _load_history(symbol, start, end, interval, source)
+    return summarize(bars, interval) if mode == "summary" else bars
 
 
 @mcp.tool()
-async def intraday(
+async def history_batch(
+    start: str,
+    end: str,
+    symbols: list[str] | None = None,
+    group: str | None = None,
+    interval: str = "1d",
+    source: Literal["VCI", "TCBS"] = "VCI",
+    layout: Literal["long", "wide"] = "long",
+    mode: Literal["bars", "summary"] = "bars",
+    format: OutputFormat = "records",
+    fields: list[str] | None = None,
+    filter: list[str] | None = None,
+    limit: int | None = None,
+    offset: int = 0,
+):
+    """
+    Load historical OHLC data for many symbols in one call.
+    Tải dữ liệu OHLC lịch sử cho nhiều mã chứng khoán cùng lúc.
+
+    Tham số:
+        - start, end, interval, source: như tool `history`.
+        - symbols : list[str], optional
+        Danh sách mã chứng khoán, ví dụ ["SSI", "VCB"].
+
+        - group : str, optional
+        Nhóm mã (VN30, VN100, HNX30, ...) dùng khi không truyền `symbols`.
+
+        - layout : "long" | "wide"
+        long: mỗi dòng là một phiên của một mã (có cột `symbol`).
+        wide: giá đóng cửa, mỗi mã một cột theo `time`.
+
+        - mode : "bars" | "summary"
+        summary: một dòng thống kê cho mỗi mã (bỏ qua `layout`).
+
+        - format : "records" | "columns" | "split"
+        Payload layout. Định dạng dữ liệu trả về.
+
+        - fields, filter, limit, offset
+        Chọn cột / lọc dòng / phân trang trước khi trả về, ví dụ
+        fields=["symbol", "time", "close"], filter=["close > 20"].
+
+    Mã lỗi được trả về trong `errors` ({mã: thông báo}) thay vì làm hỏng cả lô.
+    Per-symbol failures are reported in `errors`; the call fails only when every symbol does.
+    """
+    logging.info("Processing history_batch request...")
+
+    if not symbols:
+        if not group:
+            raise ValueError("symbols or group is required")
+        listing = await run_in_pool(lambda: pooled(VCIListing).symbols_by_group(group=group))
+        symbols = [str(s).upper() for s in listing]
+
+    slots = source_semaphore(source)
+
+    async def fetch(symbol: str):
+        async with slots:
+            return await run_in_pool(_load_history, symbol, start, end, interval, source)
+
+    results = await asyncio.gather(*(fetch(s) for s in symbols), return_exceptions=True)
+    loaded, failures = [], {}
+    for symbol, result in zip(symbols, results):
+        if isinstance(result, BaseException):
+            logging.warning("history_batch failed for %s: %s", symbol, result)
+            failures[symbol] = result
+        elif result is not None and not result.empty:
+            loaded.append((symbol, result))
+    errors = {symbol: str(error) for symbol, error in failures.items()}
+    if not loaded:
+        if failures and all(isinstance(r, BaseException) for r in results):
+            raise next(iter(failures.values()))
+        payload = to_payload(pd.DataFrame(), format)
+        if errors:
+            payload["errors"] = errors
+        return to_result(payload)
+
+    def build() -> dict:
+        # Summaries, concat and pivot scale with the batch: kept off the event loop
+        frames = [
+            (summarize(bars, interval) if mode == "summary" else bars).assign(symbol=symbol)
+            for symbol, bars in loaded
+        ]
+        combined = pd.concat(frames, ignore_index=True)
+        if layout == "wide" and mode == "bars":
+            combined = combined.pivot_table(
+                index="time", columns="symbol", values="close", aggfunc="last"
+            ).reset_index()
+        return paged(shape_frame(combined, fields=fields, filter=filter, limit=limit, offset=offset), format)
+
+    payload = await run_in_pool(build)
+    if errors:
+        payload["errors"] = errors
+    return to_result(payload)
+
+
+@tool()
+def intraday(
     symbol: str,
     page_size: int = 100,
     page: int = 1,
@@ -66,12 +198,12 @@ async def intraday(
     """
     logging.info("Processing intraday request...")
 
-    quote = Quote(symbol=symbol, source=source)
+    quote = pooled(Quote, symbol=symbol, source=source)
     return quote.intraday(page_size=page_size, page=page)
 
 
-@mcp.tool()
-async def price_depth(
+@tool()
+def price_depth(
     symbol: str,
     source: Literal["VCI", "TCBS"] = "VCI",
 ):
@@ -86,12 +218,18 @@ async def price_depth(
     """
     logging.info("Processing price_depth request...")
 
-    quote = Quote(symbol=symbol, source=source)
+    quote = pooled(Quote, symbol=symbol, source=source)
     return quote.price_depth()
 
 
-@mcp.tool()
-async def forex_history(symbol: str, start: str, end: str, interval: str = "1D"):
+@tool(source="MSN")
+def forex_history(
+    symbol: str,
+    start: str,
+    end: str,
+    interval: str = "1D",
+    mode: Literal["bars", "summary"] = "bars",
+):
     """
     Load historical OHLC data for the forex symbol.
     Retrieve historical forex quote data.
@@ -102,15 +240,24 @@ async def forex_history(symbol: str, start: str, end: str, interval: str = "1D")
         - start: Ngày kết thúc của truy vấn dữ liệu lịch sử. Định dạng YYYY-mm-dd
         - end: Ngày kết thúc của truy vấn dữ liệu lịch sử. Định dạng YYYY-mm-dd
         - interval (tuỳ chọn): Khung thời gian lấy mẫu dữ liệu. Chỉ hỗ trợ giá trị "1D" để lấy dữ liệu cuối ngày.
+        - mode (tuỳ chọn): "bars" trả về toàn bộ dữ liệu, "summary" trả về một dòng thống kê
+        (lợi suất, biến động, cao/thấp, sụt giảm tối đa, giá cuối).
     """
     logging.info("Processing forex_history request...")
 
     fx = Vnstock().fx(symbol=symbol, source="MSN")
-    return fx.quote.history(start=start, end=end, interval=interval)
+    bars = fx.quote.history(start=start, end=end, interval=interval)
+    return summarize(bars, interval) if mode == "summary" else bars
 
 
-@mcp.tool()
-async def crypto_history(symbol: str, start: str, end: str, interval: str = "1D"):
+@tool(source="MSN")
+def crypto_history(
+    symbol: str,
+    start: str,
+    end: str,
+    interval: str = "1D",
+    mode: Literal["bars", "summary"] = "bars",
+):
     """
     Load historical OHLC data for the crypto symbol.
     Retrieve historical crypto quote data.
@@ -120,15 +267,24 @@ async def crypto_history(symbol: str, start: str, end: str, interval: str = "1D"
         - start: Ngày kết thúc của truy vấn dữ liệu lịch sử. Định dạng YYYY-mm-dd
         - end: Ngày kết thúc của truy vấn dữ liệu lịch sử. Định dạng YYYY-mm-dd
         - interval (tuỳ chọn): Khung thời gian lấy mẫu dữ liệu. Chỉ hỗ trợ giá trị "1D" để lấy dữ liệu cuối ngày.
+        - mode (tuỳ chọn): "bars" trả về toàn bộ dữ liệu, "summary" trả về một dòng thống kê
+        (lợi suất, biến động, cao/thấp, sụt giảm tối đa, giá cuối).
     """
     logging.info("Processing crypto_history request...")
 
     crypto = Vnstock().crypto(symbol=symbol, source="MSN")
-    return crypto.quote.history(start=start, end=end, interval=interval)
+    bars = crypto.quote.history(start=start, end=end, interval=interval)
+    return summarize(bars, interval) if mode == "summary" else bars
 
 
-@mcp.tool()
-async def world_index_history(symbol: str, start: str, end: str, interval: str = "1D"):
+@tool(source="MSN")
+def world_index_history(
+    symbol: str,
+    start: str,
+    end: str,
+    interval: str = "1D",
+    mode: Literal["bars", "summary"] = "bars",
+):
     """
     Load historical OHLC data for the world index symbol.
     Retrieve historical world index quote data.
@@ -153,8 +309,11 @@ async def world_index_history(symbol: str, start: str, end: str, interval: str =
         - start: Ngày kết thúc của truy vấn dữ liệu lịch sử. Định dạng YYYY-mm-dd
         - end: Ngày kết thúc của truy vấn dữ liệu lịch sử. Định dạng YYYY-mm-dd
         - interval (tuỳ chọn): Khung thời gian lấy mẫu dữ liệu. Chỉ hỗ trợ giá trị "1D" để lấy dữ liệu cuối ngày.
+        - mode (tuỳ chọn): "bars" trả về toàn bộ dữ liệu, "summary" trả về một dòng thống kê
+        (lợi suất, biến động, cao/thấp, sụt giảm tối đa, giá cuối).
     """
     logging.info("Processing world_index_history request...")
 
     world_index = Vnstock().world_index(symbol=symbol, source="MSN")
-    return world_index.quote.history(start=start, end=end, interval=interval)
+    bars = world_index.quote.history(start=start, end=end, interval=interval)
+    return summarize(bars, interval) if mode == "summary" else bars
@@ -0,0 +1,139 @@
+"""
+Per-source rate limiting and circuit breaking.
+
+Each upstream (VCI, TCBS, MSN, FMARKET, ...) throttles differently. A
+`SourceGuard` paces calls to one source with a token bucket and, after
+repeated network failures, rejects calls for a cool-down period so tools fail
+fast instead of queueing behind a dead upstream.
+
+Configuration (environment variables):
+    - TRADDING_MCP_RATE_LIMITS: JSON map of source to requests/second,
+      e.g. `{"VCI": 5, "TCBS": 3}`; other sources use
+      TRADDING_MCP_RATE_DEFAULT (default 2).
+    - TRADDING_MCP_RATE_BURST: bucket size (default 5).
+    - TRADDING_MCP_RATE_MAX_WAIT: seconds to wait for a token (default 10).
+    - TRADDING_MCP_BREAKER_THRESHOLD: consecutive failures that open the
+      circuit (default 5).
+    - TRADDING_MCP_BREAKER_RESET: seconds before a trial call (default 30).
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+
+
+RATE_LIMITS = {"VCI": 5.0, "TCBS": 3.0, "MSN": 2.0, "FMARKET": 2.0}
+RATE_LIMITS.update(
+    {k.upper(): float(v) for k, v in json.loads(os.getenv("TRADDING_MCP_RATE_LIMITS", "{}")).items()}
+)
+RATE_DEFAULT = float(os.getenv("TRADDING_MCP_RATE_DEFAULT", "2"))
+RATE_BURST = int(os.getenv("TRADDING_MCP_RATE_BURST", "5"))
+RATE_MAX_WAIT = float(os.getenv("TRADDING_MCP_RATE_MAX_WAIT", "10"))
+BREAKER_THRESHOLD = int(os.getenv("TRADDING_MCP_BREAKER_THRESHOLD", "5"))
+BREAKER_RESET = float(os.getenv("TRADDING_MCP_BREAKER_RESET", "30"))
+
+
+class RateLimitedError(ConnectionError):
+    """No request token became available in time."""
+
+
+class CircuitOpenError(ConnectionError):
+    """The source is skipped because its circuit is open."""
+
+
+class SourceGuard:
+    """
+    Token bucket plus closed/open/half-open circuit breaker for one source.
+    Giới hạn tốc độ và ngắt mạch cho một nguồn dữ liệu.
+    """
+
+    def __init__(self, name: str, rate: float):
+        self.name = name
+        self.rate = rate
+        self._tokens = float(RATE_BURST)
+        self._updated = time.monotonic()
+        self.failures = 0
+        self._opened_at = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    def _acquire(self) -> bool:
+        deadline = time.monotonic() + RATE_MAX_WAIT
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(RATE_BURST, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self.rate
+            if now + wait > deadline:
+                return False
+            time.sleep(wait)
+
+    def _allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at >= BREAKER_RESET and not self._trial_running:
+                self._trial_running = True
+                return True
+            return False
+
+    def _record(self, ok: bool):
+        with self._lock:
+            if ok:
+                self.failures = 0
+                self._opened_at = None
+            else:
+                self.failures += 1
+                if self._trial_running or self.failures >= BREAKER_THRESHOLD:
+                    self._opened_at = time.monotonic()
+                    logging.warning("circuit for %s is open", self.name)
+            self._trial_running = False
+
+    def _release_trial(self):
+        with self._lock:
+            self._trial_running = False
+
+    def call(self, func, *args, **kwargs):
+        """
+        Run `func(*args, **kwargs)` if the circuit allows it, after taking a token.
+
+        Only network errors (`OSError`, which covers `requests` exceptions)
+        count as failures; other exceptions leave the circuit alone.
+        """
+        if not self._allow():
+            raise CircuitOpenError(f"{self.name} is unavailable, retry in {BREAKER_RESET:.0f}s")
+        if not self._acquire():
+            self._release_trial()
+            raise RateLimitedError(f"{self.name} rate limit exceeded")
+        try:
+            result = func(*args, **kwargs)
+        except OSError:
+            self._record(ok=False)
+            raise
+        except Exception:
+            self._release_trial()
+            raise
+        self._record(ok=True)
+        return result
+
+
+_guards: dict[str, SourceGuard] = {}
+_guards_lock = threading.Lock()
+
+
+def get_source_guard(source: str) -> SourceGuard:
+    """
+    Shared guard for an upstream source (case-insensitive).
+    Lấy bộ giới hạn dùng chung cho một nguồn dữ liệu.
+    """
+    key = source.upper()
+    with _guards_lock:
+        if key not in _guards:
+            _guards[key] = SourceGuard(key, RATE_LIMITS.get(key, RATE_DEFAULT))
+        return _guards[key]
@@ -0,0 +1,60 @@
+"""
+Pagination tools for large results.
+
+Tools return results longer than TRADDING_MCP_PAGE_ROWS one page at a time
+with a `next_cursor` token; these tools read the remaining pages from the
+server-held copy without calling vnstock again.
+"""
+
+import logging
+
+from mcp.server.fastmcp import Context
+
+from mcp_instance import mcp
+from payloads import from_cursor, payload_json, to_result
+
+
+@mcp.tool()
+async def next_page(cursor: str):
+    """
+    Get the next page of a paged result. Lấy trang tiếp theo của kết quả dài.
+
+    Tham số:
+        - cursor : str
+        `next_cursor` of the previous page. Giá trị `next_cursor` của trang trước.
+    """
+    logging.info("Processing next_page request...")
+
+    return to_result(from_cursor(cursor))
+
+
+@mcp.tool()
+async def stream_pages(cursor: str, ctx: Context):
+    """
+    Stream every remaining page of a paged result.
+    Gửi lần lượt các trang còn lại qua thông báo tiến độ (progress notification).
+
+    Each page is the JSON message of an MCP progress notification (progress
+    counts rows sent, out of `total`). Without a progress token the next page
+    is returned instead, as with `next_page`.
+
+    Tham số:
+        - cursor : str
+        `next_cursor` of the previous page. Giá trị `next_cursor` của trang trước.
+    """
+    logging.info("Processing stream_pages request...")
+
+    meta = ctx.request_context.meta
+    if meta is None or meta.progressToken is None:
+        return to_result(from_cursor(cursor))
+
+    payload = from_cursor(cursor)
+    start = int(cursor.rpartition(":")[2])
+    while True:
+        next_cursor = payload.pop("next_cursor", None)
+        sent = int(next_cursor.rpartition(":")[2]) if next_cursor else payload["total"]
+        await ctx.report_progress(progress=sent, total=payload["total"], message=payload_json(payload))
+        if not next_cursor:
+            break
+        payload = from_cursor(next_cursor)
+    return to_result({"data": f"{sent - start} rows streamed as progress notifications", "total": sent})
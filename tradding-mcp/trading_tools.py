@@ -7,11 +7,12 @@ from typing import Literal
 
 from vnstock.explorer.vci.trading import Trading as VCITrading
 from vnstock import Screener
-from mcp_instance import mcp
+from mcp_instance import tool
+from object_pool import pooled
 
 
-@mcp.tool()
-async def price_board(symbols_list: list[str]):
+@tool()
+def price_board(symbols_list: list[str]):
     """
     Truy xuất thông tin bảng giá của các mã chứng khoán tuỳ chọn từ nguồn dữ liệu VCI.
     Retrieve price board by exchange.
@@ -23,12 +24,12 @@ async def price_board(symbols_list: list[str]):
     """
     logging.info("Processing price_board request...")
 
-    trading = VCITrading()
+    trading = pooled(VCITrading)
     return trading.price_board(symbols_list=symbols_list)
 
 
-@mcp.tool()
-async def screener_stocks(
+@tool(source="TCBS")
+def screener_stocks(
     params: dict = {"exchangeName": "HOSE,HNX,UPCOM"}, 
     limit: int = 1700,
     id: str | None = None,
@@ -45,4 +46,4 @@ async def screener_stocks(
     """
     logging.info("Processing screener_stocks request...")
 
-    return Screener().stock(params=params, limit=limit, id=id, lang=lang)
+    return pooled(Screener).stock(params=params, limit=limit, id=id, lang=lang)
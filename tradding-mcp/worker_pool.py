@@ -0,0 +1,65 @@
+"""
+Worker pool for blocking vnstock calls.
+
+vnstock is synchronous, so a tool body that calls it directly on the event
+loop stalls the SSE server for every client. Tool bodies are written as plain
+functions and `offload` runs them on a shared, bounded thread pool.
+
+Set `TRADDING_MCP_MAX_WORKERS` to change the concurrency cap (default 8) and
+`TRADDING_MCP_SOURCE_CONCURRENCY` to cap fan-out calls per data source
+(default 4).
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+
+MAX_WORKERS = int(os.getenv("TRADDING_MCP_MAX_WORKERS", "8"))
+SOURCE_CONCURRENCY = int(os.getenv("TRADDING_MCP_SOURCE_CONCURRENCY", "4"))
+
+_pool = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="vnstock")
+_source_semaphores: dict[str, asyncio.Semaphore] = {}
+
+
+async def run_in_pool(func, *args, **kwargs):
+    """
+    Run `func(*args, **kwargs)` on the worker pool and await the result.
+    Chạy hàm blocking trên worker pool mà không chặn event loop.
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, func, *args, **kwargs)
+    return await loop.run_in_executor(_pool, call)
+
+
+def source_semaphore(source: str) -> asyncio.Semaphore:
+    """
+    Shared semaphore capping concurrent fan-out calls to one data source.
+    Giới hạn số lời gọi đồng thời tới cùng một nguồn dữ liệu.
+    """
+    key = source.upper()
+    if key not in _source_semaphores:
+        _source_semaphores[key] = asyncio.Semaphore(SOURCE_CONCURRENCY)
+    return _source_semaphores[key]
+
+
+def offload(func):
+    """
+    Wrap a blocking function into a coroutine function that runs on the pool.
+
+    `functools.wraps` keeps the name, docstring and signature so the MCP tool
+    schema is generated from the original function.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await run_in_pool(func, *args, **kwargs)
+
+    return wrapper
+
+
+logging.info("vnstock worker pool ready with %d workers", MAX_WORKERS)